@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the chunking engine: legacy character loops vs the shared TokenChunker.
+
+Generates synthetic ESG analysis text of increasing size (up to 2 MB by default)
+and reports time per MB, which stays flat when chunking scales linearly.
+
+Usage:
+    python benchmark_chunking.py [--max-mb 2] [--repeat 3]
+"""
+
+import os
+import re
+import sys
+import time
+import random
+import argparse
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from greenwashing_detector.tools.chunking import MARKDOWN_SECTION, TokenChunker
+from greenwashing_detector.tools.tokenizer import Tokenizer
+
+SENTENCES = [
+    "The company reduced Scope 1 and 2 emissions by 12.5% against its 2019 baseline.",
+    "We remain committed to a sustainable future for all of our stakeholders!",
+    "Water withdrawal in water-stressed regions fell to 3.2 million cubic metres.",
+    "Is our transition plan aligned with a 1.5°C pathway? The board reviews it annually.",
+    "Climate-related risks are integrated into the enterprise risk management framework.",
+    "Renewable electricity accounted for 64% of total consumption in the reporting year.",
+]
+
+def synthetic_text(size_bytes: int, seed: int = 7) -> str:
+    """Build markdown-like agent output of roughly `size_bytes` characters."""
+    rng = random.Random(seed)
+    parts = []
+    length = 0
+    section = 1
+    while length < size_bytes:
+        header = f"## Claim group {section}\n"
+        body = " ".join(rng.choice(SENTENCES) for _ in range(rng.randint(5, 40))) + "\n\n"
+        parts.append(header + body)
+        length += len(header) + len(body)
+        section += 1
+    return "".join(parts)
+
+def legacy_sentence_chunks(text: str, max_tokens_per_chunk: int = 5000):
+    """The original process_all_chunks_for_chatgpt loop (backward character scan)."""
+    chunk_size_chars = int(max_tokens_per_chunk * 3.0)
+    overlap_chars = 200
+    chunks = []
+    start = 0
+    while start < len(text):
+        end = start + chunk_size_chars
+        if end < len(text):
+            for i in range(end, max(start + chunk_size_chars - 100, start), -1):
+                if text[i] in '.!?':
+                    end = i + 1
+                    break
+        chunks.append(text[start:end])
+        start = end - overlap_chars
+        if start >= len(text):
+            break
+    return chunks
+
+def legacy_section_chunks(text: str, max_tokens_per_chunk: int = 4000):
+    """The original chunk_esg_output_for_validation loop (string concatenation per section)."""
+    chunk_size_chars = int(max_tokens_per_chunk * 3.0)
+    overlap_chars = 200
+    sections = re.split(r'(## [^\n]+\n)', text)
+    chunks = []
+    current_chunk = ""
+    for section in sections:
+        if len(current_chunk + section) > chunk_size_chars and current_chunk:
+            chunks.append(current_chunk)
+            current_chunk = current_chunk[-overlap_chars:] + section
+        else:
+            current_chunk += section
+    if current_chunk.strip():
+        chunks.append(current_chunk)
+    return chunks
+
+class PrecomputedTokenizer(Tokenizer):
+    """Serves token offsets computed up front, to time boundary placement without tokenization."""
+
+    name = "precomputed"
+
+    def __init__(self, tokenizer: Tokenizer):
+        self.tokenizer = tokenizer
+        self.offsets = {}
+
+    def prepare(self, text: str):
+        self.offsets[id(text)] = self.tokenizer.token_offsets(text)
+
+    def token_offsets(self, text: str):
+        return self.offsets[id(text)]
+
+def best_time(func, repeat: int):
+    """Return (best seconds, result) over `repeat` runs."""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark chunking on large inputs.")
+    parser.add_argument("--max-mb", type=float, default=2.0, help="Largest input size in MB")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions (best run is reported)")
+    args = parser.parse_args()
+
+    sentence_chunker = TokenChunker(max_tokens=5000, overlap_tokens=60)
+    section_chunker = TokenChunker(max_tokens=4000, overlap_tokens=60)
+    precomputed = PrecomputedTokenizer(sentence_chunker.tokenizer)
+    placement_chunker = TokenChunker(max_tokens=5000, overlap_tokens=60, tokenizer=precomputed)
+    print(f"🔤 Tokenizer: {sentence_chunker.tokenizer.name}")
+
+    sizes = [args.max_mb / 8, args.max_mb / 4, args.max_mb / 2, args.max_mb]
+    cases = [
+        ("Legacy sentence loop", lambda text: legacy_sentence_chunks(text)),
+        ("TokenChunker (sentences)", lambda text: sentence_chunker.chunk(text)),
+        ("Boundary placement only", lambda text: placement_chunker.chunk(text)),
+        ("Legacy section concat", lambda text: legacy_section_chunks(text)),
+        ("TokenChunker (sections)", lambda text: section_chunker.chunk(text, section_pattern=MARKDOWN_SECTION)),
+    ]
+
+    print(f"{'Case':<28}{'Size':>10}{'Chunks':>8}{'Time':>12}{'Time/MB':>12}")
+    for label, func in cases:
+        for size_mb in sizes:
+            text = synthetic_text(int(size_mb * 1024 * 1024))
+            precomputed.prepare(text)
+            elapsed, chunks = best_time(lambda: func(text), args.repeat)
+            print(f"{label:<28}{size_mb:>8.2f}MB{len(chunks):>8}{elapsed * 1000:>10.1f}ms"
+                  f"{elapsed * 1000 / size_mb:>10.1f}ms")
+        print()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
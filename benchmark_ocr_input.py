@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the OCR input path: PNG encode/decode round-trip vs raw pixmap buffer.
+
+Usage:
+    python benchmark_ocr_input.py report.pdf [--pages 10] [--dpi 150] [--repeat 3] [--with-ocr]
+"""
+
+import io
+import os
+import sys
+import time
+import argparse
+
+import fitz  # PyMuPDF
+from PIL import Image
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from greenwashing_detector.tools.ocr_engine import render_page_image
+
+def png_round_trip(page, dpi):
+    """The original OCR input path: render, encode to PNG, decode again."""
+    pix = page.get_pixmap(dpi=dpi)
+    img = Image.open(io.BytesIO(pix.tobytes("png")))
+    img.load()
+    return pix, img
+
+def time_path(doc, page_numbers, repeat, render, ocr):
+    """Return the best-of-`repeat` mean seconds per page for one input path."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for page_num in page_numbers:
+            pix, img = render(doc[page_num])
+            if ocr:
+                import pytesseract
+                pytesseract.image_to_string(img)
+        elapsed = (time.perf_counter() - start) / len(page_numbers)
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark OCR image preparation per page.")
+    parser.add_argument("pdf_path", help="Scanned PDF report to benchmark on")
+    parser.add_argument("--pages", type=int, default=10, help="Number of pages to render")
+    parser.add_argument("--dpi", type=int, default=150, help="Render resolution")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions (best run is reported)")
+    parser.add_argument("--max-dimension", type=int, default=None, help="Downscale cap for the longer side")
+    parser.add_argument("--with-ocr", action="store_true", help="Include Tesseract time in each measurement")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.pdf_path):
+        print(f"❌ PDF file not found: {args.pdf_path}")
+        return 1
+
+    doc = fitz.open(args.pdf_path)
+    page_numbers = list(range(min(args.pages, len(doc))))
+    print(f"📄 {args.pdf_path}: benchmarking {len(page_numbers)} pages at {args.dpi} dpi "
+          f"(best of {args.repeat}{', including OCR' if args.with_ocr else ''})")
+
+    paths = [
+        ("PNG round-trip (RGB)", lambda page: png_round_trip(page, args.dpi)),
+        ("Raw buffer (RGB)", lambda page: render_page_image(page, args.dpi, grayscale=False)),
+        ("Raw buffer (grayscale)", lambda page: render_page_image(page, args.dpi, grayscale=True)),
+    ]
+    if args.max_dimension:
+        paths.append((f"Raw buffer (grayscale, max {args.max_dimension}px)",
+                      lambda page: render_page_image(page, args.dpi, grayscale=True,
+                                                     max_dimension=args.max_dimension)))
+
+    baseline = None
+    for label, render in paths:
+        per_page = time_path(doc, page_numbers, args.repeat, render, args.with_ocr)
+        if baseline is None:
+            baseline = per_page
+            print(f"   {label:<40} {per_page * 1000:8.1f} ms/page")
+        else:
+            saving = baseline - per_page
+            print(f"   {label:<40} {per_page * 1000:8.1f} ms/page  "
+                  f"(saves {saving * 1000:.1f} ms/page, {saving / baseline:.0%})")
+
+    doc.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,341 @@
+# src/greenwashing_detector/batch.py
+
+import os
+import csv
+import sys
+import json
+import time
+import hashlib
+import argparse
+import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_DIR = "batch_results"
+DEFAULT_EXTRACTION_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+DEFAULT_LLM_WORKERS = 2
+
+# Per-report states recorded in state.json
+STATUS_PENDING = "pending"
+STATUS_EXTRACTED = "extracted"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+INDEX_FIELDS = ["report_id", "pdf_path", "status", "workflow", "pages", "extraction_seconds",
+                "analysis_seconds", "result_path", "error", "completed_at"]
+
+def _file_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _report_record(pdf_path: str, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    pdf_path = os.path.abspath(pdf_path)
+    stem = os.path.splitext(os.path.basename(pdf_path))[0]
+    return {
+        "report_id": f"{stem}-{_file_hash(pdf_path)[:8]}",
+        "pdf_path": pdf_path,
+        "metadata": metadata or {}
+    }
+
+def discover_reports(source: str) -> List[Dict[str, Any]]:
+    """
+    List the reports of a batch from a directory or a manifest file.
+
+    A directory contributes every PDF below it. A manifest is a .txt file with one
+    path per line, a .csv file with a `path` column (other columns are kept as
+    metadata, e.g. issuer or year) or a .json list of paths or {"path": ...} objects.
+    Relative paths in a manifest are resolved against the manifest's directory.
+
+    Args:
+        source: Directory or manifest path
+
+    Returns:
+        Report records with `report_id` (file stem plus content hash), `pdf_path` and `metadata`
+    """
+    paths = []
+    if os.path.isdir(source):
+        for root, _, files in os.walk(source):
+            paths.extend((os.path.join(root, name), {}) for name in sorted(files) if name.lower().endswith(".pdf"))
+    else:
+        base_dir = os.path.dirname(os.path.abspath(source))
+        extension = os.path.splitext(source)[1].lower()
+        with open(source, "r", encoding="utf-8") as f:
+            if extension == ".csv":
+                for row in csv.DictReader(f):
+                    path = row.pop("path", None)
+                    if path:
+                        paths.append((path, row))
+            elif extension == ".json":
+                for entry in json.load(f):
+                    if isinstance(entry, str):
+                        paths.append((entry, {}))
+                    else:
+                        entry = dict(entry)
+                        paths.append((entry.pop("path"), entry))
+            else:
+                paths.extend((line.strip(), {}) for line in f if line.strip() and not line.startswith("#"))
+        paths = [(path if os.path.isabs(path) else os.path.join(base_dir, path), metadata)
+                 for path, metadata in paths]
+
+    reports = []
+    seen = set()
+    for path, metadata in sorted(paths, key=lambda item: item[0]):
+        if not os.path.exists(path):
+            logger.warning(f"⚠️ Report not found, skipping: {path}")
+            continue
+        report = _report_record(path, metadata)
+        if report["report_id"] in seen:
+            logger.info(f"⏭️ Duplicate report skipped: {path}")
+            continue
+        seen.add(report["report_id"])
+        reports.append(report)
+    logger.info(f"📚 Found {len(reports)} reports in {source}")
+    return reports
+
+def _extract_report(pdf_path: str) -> Dict[str, Any]:
+    """
+    Extraction stage, run in a worker process: parse every page, run the OCR fallback
+    and framework-section chunking, and store the results in the extraction cache so
+    the LLM stage starts from cached pages.
+    """
+    from greenwashing_detector.tools.ocr_engine import OCREngine
+    from greenwashing_detector.tools.pdf_document import PDFDocument
+    from greenwashing_detector.tools.pdf_loader import SmartChunkingProcessor
+
+    start_time = time.time()
+    # One process per report already uses the cores; nested pools would oversubscribe them
+    doc = PDFDocument(pdf_path, workers=1)
+    try:
+        doc.extract_all_pages(workers=1)
+        SmartChunkingProcessor(OCREngine(workers=1)).create_smart_chunks(doc)
+        doc.save_to_cache()
+        return {"pages": len(doc), "extraction_seconds": round(time.time() - start_time, 2)}
+    finally:
+        doc.close()
+
+def _workflow_runner(workflow: str) -> Callable[[str], str]:
+    # Imported lazily so extraction worker processes never load CrewAI
+    from greenwashing_detector import main
+    runners = {
+        "enhanced": main.run_enhanced_greenwashing_workflow,
+        "crew": main.run_greenwashing_crew,
+        "framework": main.run_framework_detection_with_monitoring,
+    }
+    return runners[workflow]
+
+WORKFLOWS = ("enhanced", "crew", "framework")
+
+class BatchRunner:
+    """
+    Analyses a portfolio of reports with extraction and LLM stages on separate pools.
+
+    Extraction (PDF parsing and OCR, CPU-bound) runs on a process pool; each report is
+    handed to the LLM stage (network-bound, rate limited per provider) on a thread pool
+    as soon as its extraction finishes. Per-report progress is checkpointed to
+    `state.json` in the batch directory after every transition, so a crashed or
+    interrupted batch resumes where it stopped: completed reports are skipped and
+    reports that were mid-analysis are run again. Results are written to
+    `results/<report_id>.md` and summarised in `index.json` and `index.csv`.
+    """
+
+    def __init__(self, batch_dir: str = DEFAULT_BATCH_DIR, workflow: str = "enhanced",
+                 extraction_workers: int = DEFAULT_EXTRACTION_WORKERS, llm_workers: int = DEFAULT_LLM_WORKERS,
+                 runner: Optional[Callable[[str], str]] = None):
+        """
+        Args:
+            batch_dir: Directory for the state file, results and index
+            workflow: One of "enhanced", "crew" or "framework"
+            extraction_workers: Processes for the extraction stage (0 = extract in the LLM stage)
+            llm_workers: Threads for the LLM stage
+            runner: Analysis function taking a PDF path, overriding `workflow`
+        """
+        if runner is None and workflow not in WORKFLOWS:
+            raise ValueError(f"Unknown workflow '{workflow}', expected one of {WORKFLOWS}")
+        self.batch_dir = batch_dir
+        self.results_dir = os.path.join(batch_dir, "results")
+        self.state_path = os.path.join(batch_dir, "state.json")
+        self.workflow = workflow
+        self.extraction_workers = max(0, extraction_workers)
+        self.llm_workers = max(1, llm_workers)
+        self.runner = runner
+        self._lock = threading.Lock()
+        os.makedirs(self.results_dir, exist_ok=True)
+        self.state = self._load_state()
+
+    def _load_state(self) -> Dict[str, Any]:
+        if os.path.exists(self.state_path):
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            logger.info(f"📂 Resuming batch from {self.state_path}")
+            return state
+        return {"created_at": datetime.now().isoformat(), "reports": {}}
+
+    def _save_state(self):
+        # Write-and-rename so a crash never leaves a truncated state file
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, indent=2)
+        os.replace(tmp_path, self.state_path)
+
+    def _update(self, report_id: str, **fields):
+        with self._lock:
+            self.state["reports"][report_id].update(fields)
+            self._save_state()
+
+    def _plan(self, reports: List[Dict[str, Any]], retry_failed: bool) -> List[Dict[str, Any]]:
+        """Register new reports and return those still to be processed."""
+        todo = []
+        with self._lock:
+            for report in reports:
+                entry = self.state["reports"].setdefault(report["report_id"], {
+                    **report, "status": STATUS_PENDING, "workflow": self.workflow
+                })
+                status = entry["status"]
+                if status == STATUS_DONE or (status == STATUS_FAILED and not retry_failed):
+                    continue
+                if status in (STATUS_RUNNING, STATUS_FAILED):
+                    # Interrupted or failed analysis; extraction results are in the cache
+                    entry["status"] = STATUS_EXTRACTED if entry.get("pages") else STATUS_PENDING
+                entry["error"] = None
+                todo.append(entry)
+            self._save_state()
+        return todo
+
+    def _analyze(self, report_id: str) -> str:
+        """LLM stage for one report."""
+        entry = self.state["reports"][report_id]
+        self._update(report_id, status=STATUS_RUNNING)
+        start_time = time.time()
+        try:
+            result = (self.runner or _workflow_runner(self.workflow))(entry["pdf_path"])
+        except Exception as e:
+            logger.error(f"❌ Analysis failed for {report_id}: {e}")
+            self._update(report_id, status=STATUS_FAILED, error=str(e),
+                         analysis_seconds=round(time.time() - start_time, 2))
+            return STATUS_FAILED
+
+        result_path = os.path.join(self.results_dir, f"{report_id}.md")
+        with open(result_path, "w", encoding="utf-8") as f:
+            f.write(str(result))
+        self._update(report_id, status=STATUS_DONE, result_path=result_path,
+                     analysis_seconds=round(time.time() - start_time, 2),
+                     completed_at=datetime.now().isoformat())
+        logger.info(f"✅ {report_id} analysed in {time.time() - start_time:.2f}s")
+        return STATUS_DONE
+
+    def run(self, reports: List[Dict[str, Any]], retry_failed: bool = False) -> Dict[str, int]:
+        """
+        Process a batch of reports, skipping those completed in an earlier run.
+
+        Args:
+            reports: Report records from discover_reports()
+            retry_failed: Also re-run reports that failed in an earlier run
+
+        Returns:
+            Number of reports per final status
+        """
+        todo = self._plan(reports, retry_failed)
+        logger.info(f"🚀 Batch: {len(todo)} of {len(reports)} reports to process "
+                    f"({self.extraction_workers} extraction processes, {self.llm_workers} LLM threads)")
+        batch_start = time.time()
+
+        with ThreadPoolExecutor(max_workers=self.llm_workers, thread_name_prefix="batch-llm") as llm_pool:
+            analyses = [llm_pool.submit(self._analyze, entry["report_id"])
+                        for entry in todo if entry["status"] == STATUS_EXTRACTED]
+            to_extract = [entry for entry in todo if entry["status"] == STATUS_PENDING]
+
+            if to_extract and self.extraction_workers:
+                with ProcessPoolExecutor(max_workers=min(self.extraction_workers, len(to_extract))) as extract_pool:
+                    pending = {extract_pool.submit(_extract_report, entry["pdf_path"]): entry["report_id"]
+                               for entry in to_extract}
+                    while pending:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            report_id = pending.pop(future)
+                            try:
+                                extraction = future.result()
+                            except Exception as e:
+                                logger.error(f"❌ Extraction failed for {report_id}: {e}")
+                                self._update(report_id, status=STATUS_FAILED, error=f"extraction: {e}")
+                                continue
+                            self._update(report_id, status=STATUS_EXTRACTED, **extraction)
+                            logger.info(f"📄 {report_id}: {extraction['pages']} pages extracted "
+                                        f"in {extraction['extraction_seconds']:.2f}s")
+                            analyses.append(llm_pool.submit(self._analyze, report_id))
+            else:
+                # No extraction pool: the workflow parses the PDF itself
+                analyses.extend(llm_pool.submit(self._analyze, entry["report_id"]) for entry in to_extract)
+
+            for future in analyses:
+                future.result()
+
+        self.write_index()
+        counts: Dict[str, int] = {}
+        for entry in self.state["reports"].values():
+            counts[entry["status"]] = counts.get(entry["status"], 0) + 1
+        logger.info(f"🎉 Batch finished in {time.time() - batch_start:.2f}s: {counts}")
+        return counts
+
+    def write_index(self) -> str:
+        """Write the consolidated results index (index.json and index.csv). Returns the JSON path."""
+        with self._lock:
+            entries = sorted(self.state["reports"].values(), key=lambda entry: entry["report_id"])
+        metadata_fields = sorted({field for entry in entries for field in entry.get("metadata", {})})
+
+        json_path = os.path.join(self.batch_dir, "index.json")
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump({"generated_at": datetime.now().isoformat(), "reports": entries}, f, indent=2)
+
+        with open(os.path.join(self.batch_dir, "index.csv"), "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=INDEX_FIELDS + metadata_fields, extrasaction="ignore")
+            writer.writeheader()
+            for entry in entries:
+                writer.writerow({**entry.get("metadata", {}), **{field: entry.get(field) for field in INDEX_FIELDS}})
+        logger.info(f"📇 Results index written to {json_path}")
+        return json_path
+
+def run_batch(source: str, batch_dir: str = DEFAULT_BATCH_DIR, workflow: str = "enhanced",
+              extraction_workers: int = DEFAULT_EXTRACTION_WORKERS, llm_workers: int = DEFAULT_LLM_WORKERS,
+              retry_failed: bool = False) -> Dict[str, int]:
+    """
+    Analyse every report in a directory or manifest, resuming an earlier run in `batch_dir`.
+
+    Returns:
+        Number of reports per final status
+    """
+    runner = BatchRunner(batch_dir, workflow=workflow, extraction_workers=extraction_workers,
+                         llm_workers=llm_workers)
+    return runner.run(discover_reports(source), retry_failed=retry_failed)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line interface for batch (portfolio) analysis."""
+    parser = argparse.ArgumentParser(description="Analyse a directory or manifest of sustainability reports.")
+    parser.add_argument("source", help="Directory of PDFs, or a .txt/.csv/.json manifest")
+    parser.add_argument("--output-dir", default=DEFAULT_BATCH_DIR, help="Batch directory (state, results, index)")
+    parser.add_argument("--workflow", choices=WORKFLOWS, default="enhanced", help="Analysis to run per report")
+    parser.add_argument("--extraction-workers", type=int, default=DEFAULT_EXTRACTION_WORKERS,
+                        help="Processes for PDF extraction and OCR (0 = extract inside the workflow)")
+    parser.add_argument("--llm-workers", type=int, default=DEFAULT_LLM_WORKERS,
+                        help="Reports analysed concurrently by the LLM stage")
+    parser.add_argument("--retry-failed", action="store_true", help="Re-run reports that failed earlier")
+    args = parser.parse_args(argv)
+
+    counts = run_batch(args.source, args.output_dir, workflow=args.workflow,
+                       extraction_workers=args.extraction_workers, llm_workers=args.llm_workers,
+                       retry_failed=args.retry_failed)
+    print(f"Batch complete: {counts}")
+    print(f"Results index: {os.path.join(args.output_dir, 'index.json')}")
+    return 0 if not counts.get(STATUS_FAILED) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
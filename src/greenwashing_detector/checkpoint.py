@@ -0,0 +1,144 @@
+# src/greenwashing_detector/checkpoint.py
+
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_RUNS_DIR = "runs"
+
+def _sha256_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def text_hash(text: str) -> str:
+    """Short content hash used to check that a chunk artifact belongs to the same chunk text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+def result_text(result: Any) -> str:
+    """Plain text of a crew result (CrewOutput.raw when available)."""
+    return str(result.raw) if hasattr(result, "raw") else str(result)
+
+class RunCheckpoint:
+    """
+    Run directory holding the output of every workflow stage as a JSON artifact.
+
+    Each stage (framework detection, fluff removal, chunking, every chunk analysis
+    and validation sub-chunk) is written to `<run_dir>/stages/<stage>.json` as soon
+    as it completes, so a run that fails part-way can be resumed and only redoes
+    the stages and chunks without an artifact. The run directory is derived from
+    the report's content hash, and artifacts written with different prompt
+    templates are discarded rather than reused.
+    """
+
+    def __init__(self, pdf_path: str, run_dir: Optional[str] = None, template_version: str = "",
+                 resume: bool = True):
+        """
+        Args:
+            pdf_path: Report being analysed
+            run_dir: Run directory (default: <RUNS_DIR or "runs">/<file stem>-<content hash>)
+            template_version: Prompt template version; a mismatch invalidates stored artifacts
+            resume: Reuse completed stages from an earlier run; False starts over
+        """
+        self.pdf_path = pdf_path
+        self.file_hash = _sha256_file(pdf_path)
+        if run_dir is None:
+            stem = os.path.splitext(os.path.basename(pdf_path))[0]
+            run_dir = os.path.join(os.getenv("RUNS_DIR", DEFAULT_RUNS_DIR), f"{stem}-{self.file_hash[:8]}")
+        self.run_dir = run_dir
+        self.stages_dir = os.path.join(run_dir, "stages")
+        self.template_version = template_version
+        self.resumed_stages = 0
+        self._lock = threading.Lock()
+        os.makedirs(self.stages_dir, exist_ok=True)
+
+        manifest = self._read_json(os.path.join(run_dir, "run.json"))
+        if manifest and resume and manifest.get("template_version") != template_version:
+            logger.info("🔄 Prompt templates changed since the checkpointed run, starting over")
+            resume = False
+        if not resume:
+            self.clear()
+        elif manifest:
+            logger.info(f"📂 Resuming run from {run_dir} ({len(os.listdir(self.stages_dir))} stages checkpointed)")
+        created_at = manifest.get("created_at") if manifest and resume else None
+        self._write_json(os.path.join(run_dir, "run.json"), {
+            "pdf_path": os.path.abspath(pdf_path),
+            "file_hash": self.file_hash,
+            "template_version": template_version,
+            "created_at": created_at or datetime.now().isoformat(),
+            "updated_at": datetime.now().isoformat()
+        })
+
+    @staticmethod
+    def _read_json(path: str) -> Optional[Dict[str, Any]]:
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ Ignoring unreadable checkpoint {path}: {e}")
+            return None
+
+    @staticmethod
+    def _write_json(path: str, data: Dict[str, Any]):
+        # Write-and-rename so an interrupted run never leaves a truncated artifact
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def _stage_path(self, stage: str) -> str:
+        return os.path.join(self.stages_dir, f"{stage}.json")
+
+    def load(self, stage: str, input_hash: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Return the artifact of a completed stage, or None if it has not completed.
+
+        Args:
+            stage: Stage name, e.g. "framework_detection" or "chunk_007_esg"
+            input_hash: Hash of the stage input; an artifact made from other input is ignored
+        """
+        artifact = self._read_json(self._stage_path(stage))
+        if artifact is None or (input_hash is not None and artifact.get("input_hash") != input_hash):
+            return None
+        with self._lock:
+            self.resumed_stages += 1
+        logger.info(f"⏭️ Stage '{stage}' restored from checkpoint")
+        return artifact["data"]
+
+    def save(self, stage: str, data: Dict[str, Any], elapsed: float = 0.0, input_hash: Optional[str] = None):
+        """Persist the output of a completed stage."""
+        self._write_json(self._stage_path(stage), {
+            "stage": stage,
+            "completed_at": datetime.now().isoformat(),
+            "elapsed": round(elapsed, 2),
+            "input_hash": input_hash,
+            "data": data
+        })
+
+    def stage(self, stage: str, compute: Callable[[], Dict[str, Any]],
+              input_hash: Optional[str] = None) -> Dict[str, Any]:
+        """Return a stage's checkpointed artifact, or compute, persist and return it."""
+        data = self.load(stage, input_hash)
+        if data is None:
+            start_time = time.time()
+            data = compute()
+            self.save(stage, data, time.time() - start_time, input_hash)
+        return data
+
+    def clear(self):
+        """Delete every stage artifact of this run."""
+        for name in os.listdir(self.stages_dir):
+            os.remove(os.path.join(self.stages_dir, name))
@@ -1,17 +1,27 @@
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
-from typing import List
+from typing import Callable, Dict, List, Optional, Tuple
+from contextlib import contextmanager
+import os
 import logging
 import json
+import threading
+import time
 from datetime import datetime
-from .tools.pdf_loader import FrameworkPDFReader, FullPDFReader, ESGChunkProcessor
+from .tools.pdf_loader import ESG_CHUNK_OVERLAP, FrameworkPDFReader, FullPDFReader, ESGChunkProcessor
 from .tools.framework_glossary import FrameworkGlossaryTool
 from .tools.section_extractor import RelevantSectionExtractor
 from .tools.fluff_remover import FluffRemover
 from .tools.tcfd_analyzer import TCFDAnalyzerTool
 from .tools.gri_analyzer import GRIAnalyzerTool
-import re
+from .tools.framework_detector import RuleBasedFrameworkDetector
+from .tools.framework_result import FrameworkDetectionResult
+from .tools.chunking import DEFAULT_CHUNK_MODEL, MARKDOWN_SECTION, TokenChunker
+from .tools.dedup import PageLocator, deduplicate_paragraphs, stage_max_distance, trim_chunk_overlaps
+from .tools.pdf_document import load_pdf_document
+from .tools.knowledge_base import knowledge_base
+from .llm_cache import CachedLLM, file_version
 
 
 # If you want to run a snippet of code before or after the crew starts,
@@ -38,12 +48,43 @@ class GreenwashingDetector():
             "RelevantSectionExtractor": RelevantSectionExtractor,
             "FluffRemover": FluffRemover,
             "TCFDAnalyzerTool": TCFDAnalyzerTool,
-            "GRIAnalyzerTool": GRIAnalyzerTool
+            "GRIAnalyzerTool": GRIAnalyzerTool,
+            "RuleBasedFrameworkDetector": RuleBasedFrameworkDetector
         }
         self.detected_frameworks = None
+        self.framework_detection: Optional[FrameworkDetectionResult] = None
         self.esg_chunk_processor = None
+        # Prompt template version for the LLM response cache: agent/task configs, the inline TCFD
+        # prompts and the framework knowledge base
+        config_dir = os.path.join(os.path.dirname(__file__), 'config')
+        self.prompt_template_version = file_version(
+            os.path.join(config_dir, 'agents.yaml'), os.path.join(config_dir, 'tasks.yaml'), __file__,
+            *knowledge_base().source_files()
+        )
+        # Crew pool: one template per configured crew, plus idle instances reused across chunks
+        self._crew_templates: Dict[str, Crew] = {}
+        self._idle_crews: Dict[str, List[Crew]] = {}
+        self._crew_pool_lock = threading.Lock()
+        self.crew_pool_stats = {
+            "templates_built": 0, "template_seconds": 0.0,
+            "instances_built": 0, "instance_seconds": 0.0,
+            "reuses": 0
+        }
 
     
+    def _with_llm_limits(self, agent: Agent) -> Agent:
+        """Send an agent's completions through its provider's rate limit and the response cache, keeping its settings."""
+        llm = agent.llm
+        if isinstance(llm, CachedLLM) or not hasattr(llm, 'model'):
+            return agent
+        settings = {
+            name: getattr(llm, name) for name in ('temperature', 'top_p', 'max_tokens', 'seed', 'stop',
+                                                  'base_url', 'api_base', 'api_key', 'timeout')
+            if getattr(llm, name, None) is not None
+        }
+        agent.llm = CachedLLM(model=llm.model, template_version=self.prompt_template_version, **settings)
+        return agent
+
     # Learn more about YAML configuration files here:
     # Agents: https://docs.crewai.com/concepts/agents#yaml-configuration-recommended
     # Tasks: https://docs.crewai.com/concepts/tasks#yaml-configuration-recommended
@@ -59,16 +100,16 @@ class GreenwashingDetector():
         # Check if using Ollama - if so, don't use tools
         if config.get('llm', '').startswith('ollama/'):
             logger.info("🔧 Creating Ollama-compatible structure identifier without tools")
-            return Agent(
+            return self._with_llm_limits(Agent(
                 **config,
                 tools=[]  # No tools for Ollama
-            )
+            ))
         else:
             # Use tools for other models (OpenAI, etc.)
-            return Agent(
+            return self._with_llm_limits(Agent(
                 **config,
                 tools=[self.tools["FrameworkPDFReader"]()]
-            )
+            ))
 
     @agent
     def framework_detector(self) -> Agent:
@@ -79,17 +120,18 @@ class GreenwashingDetector():
         # Check if using Ollama - if so, don't use tools
         if config.get('llm', '').startswith('ollama/'):
             logger.info("🔧 Creating Ollama-compatible framework detector without tools")
-            return Agent(
+            return self._with_llm_limits(Agent(
                 **config,
                 tools=[]  # No tools for Ollama
-            )
+            ))
         else:
             # Use tools for other models (OpenAI, etc.)
-            return Agent(
+            return self._with_llm_limits(Agent(
                 **config,
                 tools=[self.tools["FrameworkPDFReader"](),
-                       self.tools["FrameworkGlossaryTool"]()]
-            )
+                       self.tools["FrameworkGlossaryTool"](),
+                       self.tools["RuleBasedFrameworkDetector"]()]
+            ))
 
     @agent
     def section_filter(self) -> Agent:
@@ -100,16 +142,16 @@ class GreenwashingDetector():
         # Check if using Ollama - if so, don't use tools
         if config.get('llm', '').startswith('ollama/'):
             logger.info("🔧 Creating Ollama-compatible section filter without tools")
-            return Agent(
+            return self._with_llm_limits(Agent(
                 **config,
                 tools=[]  # No tools for Ollama
-            )
+            ))
         else:
             # Use tools for other models (OpenAI, etc.)
-            return Agent(
+            return self._with_llm_limits(Agent(
                 **config,
                 tools=[self.tools["RelevantSectionExtractor"]()]
-            )
+            ))
 
     @agent
     def fluff_remover(self) -> Agent:
@@ -120,44 +162,44 @@ class GreenwashingDetector():
         # Check if using Ollama - if so, don't use tools
         if config.get('llm', '').startswith('ollama/'):
             logger.info("🔧 Creating Ollama-compatible fluff remover without tools")
-            return Agent(
+            return self._with_llm_limits(Agent(
                 **config,
                 tools=[]  # No tools for Ollama
-            )
+            ))
         else:
             # Use tools for other models (OpenAI, etc.)
-            return Agent(
+            return self._with_llm_limits(Agent(
                 **config,
                 tools=[self.tools["FluffRemover"]()]
-            )
+            ))
 
     @agent
     def esg_analyst(self) -> Agent:
         config = self.agents_config['esg_analyst'].copy()
         if 'tools' in config:
             del config['tools']
-        return Agent(
+        return self._with_llm_limits(Agent(
             **config,
             tools=[
                 self.tools["TCFDAnalyzerTool"](),
                 self.tools["FrameworkGlossaryTool"](),
                 self.tools["GRIAnalyzerTool"]()
             ]
-        )
+        ))
 
     @agent
     def compliance_checker(self) -> Agent:
         config = self.agents_config['compliance_checker'].copy()
         if 'tools' in config:
             del config['tools']
-        return Agent(
+        return self._with_llm_limits(Agent(
             **config,
             tools=[
                 self.tools["TCFDAnalyzerTool"](),
                 self.tools["FrameworkGlossaryTool"](),
                 self.tools["GRIAnalyzerTool"]()
             ]
-        )
+        ))
 
     # To learn more about structured task outputs,
     # task dependencies, and task callbacks, check out the documentation:
@@ -180,6 +222,7 @@ class GreenwashingDetector():
     def detect_reporting_framework(self) -> Task:
         return Task(
             config=self.tasks_config['detect_reporting_framework'],
+            output_pydantic=FrameworkDetectionResult,
             output_file='framework_detection.md'
         )
 
@@ -227,11 +270,12 @@ class GreenwashingDetector():
                 # Multiple chunks - combine them intelligently
                 logger.info(f"🔄 Combining {len(chunks)} chunks for complete analysis")
                 
-                # Combine all chunks with clear separators
+                # Combine all chunks with clear separators, without the chunk overlaps and repeated paragraphs
                 combined_text = ""
-                for i, chunk in enumerate(chunks, 1):
+                for i, chunk in enumerate(trim_chunk_overlaps(chunks, ESG_CHUNK_OVERLAP), 1):
                     combined_text += f"\n\n--- CHUNK {i} OF {len(chunks)} ---\n\n"
                     combined_text += chunk
+                combined_text = self.deduplicate_for_stage(combined_text, "esg_analysis", file_path)
                 
                 # Add summary information
                 combined_text += f"\n\n--- ANALYSIS SUMMARY ---\n"
@@ -269,11 +313,12 @@ class GreenwashingDetector():
                 # Multiple chunks - combine for claims extraction
                 logger.info(f"🔄 Combining {len(chunks)} chunks for claims extraction")
                 
-                # Combine all chunks with clear separators
+                # Combine all chunks with clear separators, without the chunk overlaps and repeated paragraphs
                 combined_text = ""
-                for i, chunk in enumerate(chunks, 1):
+                for i, chunk in enumerate(trim_chunk_overlaps(chunks, ESG_CHUNK_OVERLAP), 1):
                     combined_text += f"\n\n--- SECTION {i} OF {len(chunks)} ---\n\n"
                     combined_text += chunk
+                combined_text = self.deduplicate_for_stage(combined_text, "claims", file_path)
                 
                 # Add instructions for claims extraction
                 combined_text += f"\n\n--- CLAIMS EXTRACTION INSTRUCTIONS ---\n"
@@ -288,13 +333,55 @@ class GreenwashingDetector():
             logger.error(f"Error processing claims across chunks: {e}")
             return f"Error processing PDF chunks for claims: {str(e)}"
 
-    def process_fluff_removed_content_with_chatgpt(self, cleaned_content: str, max_tokens_per_chunk: int = 6000) -> str:
+    def deduplicate_for_stage(self, text: str, stage: str, file_path: Optional[str] = None) -> str:
+        """
+        Drop near-duplicate paragraphs before an LLM stage, keeping one copy with back-references.
+        
+        Args:
+            text: Text the stage would send to the LLM
+            stage: Stage name ("esg_analysis", "claims" or "chatgpt"), see tools/dedup.py
+            file_path: Report the text comes from, to refer back to the pages of repeated paragraphs
+            
+        Returns:
+            Deduplicated text, or the text unchanged if deduplication is off for the stage
+        """
+        max_distance = stage_max_distance(stage)
+        if max_distance is None:
+            return text
+        try:
+            locator = None
+            if file_path:
+                document = load_pdf_document(file_path)
+                locator = PageLocator([document.strip_boilerplate(page) for page in document.extract_all_pages()])
+            deduplicated, stats = deduplicate_paragraphs(text, max_distance, locator)
+            logger.info(f"♻️ {stage}: removed {stats['duplicates_removed']} near-duplicate paragraphs "
+                        f"of {stats['paragraphs']} ({stats['chars_removed']:,} characters)")
+            return deduplicated
+        except Exception as e:
+            logger.warning(f"⚠️ Near-duplicate removal failed for {stage}, using the text as is: {e}")
+            return text
+
+    def chatgpt_chunker(self, max_tokens_per_chunk: Optional[int] = None, overlap_tokens: int = 0) -> TokenChunker:
+        """
+        Create a token-accurate chunker for the ChatGPT analysis agents.
+        
+        Args:
+            max_tokens_per_chunk: Token budget per chunk (default: CHUNK_FILL_RATIO of the model's context window)
+            overlap_tokens: Tokens shared between consecutive chunks
+            
+        Returns:
+            TokenChunker for the ESG analyst's model
+        """
+        model = self.agents_config['esg_analyst'].get('llm', DEFAULT_CHUNK_MODEL)
+        return TokenChunker(model=model, max_tokens=max_tokens_per_chunk, overlap_tokens=overlap_tokens)
+
+    def process_fluff_removed_content_with_chatgpt(self, cleaned_content: str, max_tokens_per_chunk: Optional[int] = None) -> str:
         """
         Process fluff-removed content with chunking optimized for ChatGPT (16K token limit).
         
         Args:
             cleaned_content: The cleaned content from the fluff remover
-            max_tokens_per_chunk: Maximum tokens per chunk (default 6K to leave buffer for task descriptions)
+            max_tokens_per_chunk: Maximum tokens per chunk (default: a fill ratio of the model's context window)
             
         Returns:
             Processed content ready for ChatGPT analysis
@@ -303,82 +390,53 @@ class GreenwashingDetector():
             logger.info("🧹 Processing fluff-removed content for ChatGPT analysis")
             logger.info(f"📄 Input content length: {len(cleaned_content)} characters")
             
-            # More accurate token estimation (1 token ≈ 3.5 characters for English text)
-            estimated_tokens = len(cleaned_content) // 3.5
-            logger.info(f"📊 Estimated tokens: {estimated_tokens:,}")
+            chunker = self.chatgpt_chunker(max_tokens_per_chunk, overlap_tokens=15)
+            total_tokens = chunker.count_tokens(cleaned_content)
+            logger.info(f"📊 Tokens: {total_tokens:,}")
             
-            if estimated_tokens <= max_tokens_per_chunk:
+            if total_tokens <= chunker.max_tokens:
                 # Content fits in single chunk
                 logger.info("✅ Content fits in single ChatGPT chunk")
                 return cleaned_content
             else:
                 # Need to chunk the content
-                logger.info(f"🔄 Content needs chunking for ChatGPT (max {max_tokens_per_chunk:,} tokens per chunk)")
-                
-                # Calculate chunk size in characters (much more conservative)
-                chunk_size_chars = int(max_tokens_per_chunk * 2.0)  # Much more conservative estimate
-                overlap_chars = 50  # Minimal overlap to avoid token waste
+                logger.info(f"🔄 Content needs chunking for ChatGPT ({chunker.describe()})")
                 
-                # Split content into chunks
-                chunks = []
-                start = 0
-                chunk_num = 1
-                
-                while start < len(cleaned_content):
-                    end = start + chunk_size_chars
-                    
-                    # Try to break at sentence boundary
-                    if end < len(cleaned_content):
-                        # Look for sentence endings within last 100 chars of chunk
-                        for i in range(end, max(start + chunk_size_chars - 100, start), -1):
-                            if cleaned_content[i] in '.!?':
-                                end = i + 1
-                                break
-                    
-                    chunk = cleaned_content[start:end]
-                    chunks.append(chunk)
-                    
-                    logger.info(f"📄 Chunk {chunk_num}: {len(chunk)} characters (~{len(chunk)//3.0:.0f} tokens)")
-                    
-                    # Move start position with overlap
-                    start = end - overlap_chars
-                    chunk_num += 1
-                    
-                    # Safety check to prevent infinite loop
-                    if start >= len(cleaned_content):
-                        break
+                chunks = chunker.chunk(cleaned_content)
+                for chunk in chunks:
+                    logger.info(f"📄 Chunk {chunk['index']}: {len(chunk['text'])} characters ({chunk['tokens']:,} tokens)")
                 
                 logger.info(f"✅ Created {len(chunks)} chunks for ChatGPT processing")
                 
                 # For ChatGPT analysis, we need to process chunks separately, not combine them
                 # Return the first chunk with information about total chunks
                 if len(chunks) == 1:
-                    return chunks[0]
+                    return chunks[0]['text']
                 else:
                     # Return first chunk with chunk information
                     first_chunk = chunks[0]
                     chunk_info = f"\n\n--- CHUNK INFORMATION ---\n"
                     chunk_info += f"This is chunk 1 of {len(chunks)} total chunks.\n"
                     chunk_info += f"Total content length: {len(cleaned_content)} characters\n"
-                    chunk_info += f"Estimated total tokens: {estimated_tokens:,}\n"
-                    chunk_info += f"Chunk size: ~{chunk_size_chars} characters (~{chunk_size_chars//3.0:.0f} tokens)\n"
+                    chunk_info += f"Total tokens: {total_tokens:,}\n"
+                    chunk_info += f"Chunk size: {first_chunk['tokens']:,} tokens\n"
                     chunk_info += f"Please analyze this chunk for ESG claims and framework compliance.\n"
                     chunk_info += f"Additional chunks will be processed separately.\n"
                     
-                    return f"{first_chunk}{chunk_info}"
+                    return f"{first_chunk['text']}{chunk_info}"
                 
         except Exception as e:
             logger.error(f"Error processing fluff-removed content: {e}")
             return f"Error processing cleaned content: {str(e)}"
 
-    def process_all_chunks_for_chatgpt(self, cleaned_content: str, max_tokens_per_chunk: int = 5000) -> List[str]:
+    def process_all_chunks_for_chatgpt(self, cleaned_content: str, max_tokens_per_chunk: Optional[int] = None) -> List[str]:
         """
         Process all chunks of fluff-removed content for ChatGPT analysis.
         Returns a list of chunks that can be processed separately.
         
         Args:
             cleaned_content: The cleaned content from the fluff remover
-            max_tokens_per_chunk: Maximum tokens per chunk (default 5K to leave buffer)
+            max_tokens_per_chunk: Maximum tokens per chunk (default: a fill ratio of the model's context window)
             
         Returns:
             List of chunks ready for ChatGPT analysis
@@ -387,57 +445,34 @@ class GreenwashingDetector():
             logger.info("🧹 Processing all chunks for ChatGPT analysis")
             logger.info(f"📄 Input content length: {len(cleaned_content)} characters")
             
-            # More accurate token estimation
-            estimated_tokens = len(cleaned_content) // 3.0
-            logger.info(f"📊 Estimated tokens: {estimated_tokens:,}")
+            chunker = self.chatgpt_chunker(max_tokens_per_chunk, overlap_tokens=60)
+            total_tokens = chunker.count_tokens(cleaned_content)
+            logger.info(f"📊 Tokens: {total_tokens:,}")
             
-            if estimated_tokens <= max_tokens_per_chunk:
+            if total_tokens <= chunker.max_tokens:
                 # Content fits in single chunk
                 logger.info("✅ Content fits in single ChatGPT chunk")
                 return [cleaned_content]
             else:
                 # Need to chunk the content
-                logger.info(f"🔄 Content needs chunking for ChatGPT (max {max_tokens_per_chunk:,} tokens per chunk)")
-                
-                # Calculate chunk size in characters (more conservative)
-                chunk_size_chars = int(max_tokens_per_chunk * 3.0)
-                overlap_chars = 200
+                logger.info(f"🔄 Content needs chunking for ChatGPT ({chunker.describe()})")
                 
-                # Split content into chunks
                 chunks = []
-                start = 0
-                chunk_num = 1
+                token_chunks = chunker.chunk(cleaned_content)
                 
-                while start < len(cleaned_content):
-                    end = start + chunk_size_chars
-                    
-                    # Try to break at sentence boundary
-                    if end < len(cleaned_content):
-                        for i in range(end, max(start + chunk_size_chars - 100, start), -1):
-                            if cleaned_content[i] in '.!?':
-                                end = i + 1
-                                break
-                    
-                    chunk = cleaned_content[start:end]
+                for chunk in token_chunks:
+                    chunk_num = chunk['index']
                     
                     # Add chunk information
-                    chunk_with_info = f"--- CHUNK {chunk_num} OF {estimated_tokens//max_tokens_per_chunk + 1} ---\n\n"
-                    chunk_with_info += chunk
+                    chunk_with_info = f"--- CHUNK {chunk_num} OF {len(token_chunks)} ---\n\n"
+                    chunk_with_info += chunk['text']
                     chunk_with_info += f"\n\n--- CHUNK {chunk_num} ANALYSIS INSTRUCTIONS ---\n"
                     chunk_with_info += f"Analyze this chunk for ESG claims, framework compliance, and potential greenwashing indicators.\n"
                     chunk_with_info += f"Focus on environmental, social, and governance disclosures.\n"
                     
                     chunks.append(chunk_with_info)
                     
-                    logger.info(f"📄 Chunk {chunk_num}: {len(chunk)} characters (~{len(chunk)//3.0:.0f} tokens)")
-                    
-                    # Move start position with overlap
-                    start = end - overlap_chars
-                    chunk_num += 1
-                    
-                    # Safety check
-                    if start >= len(cleaned_content):
-                        break
+                    logger.info(f"📄 Chunk {chunk_num}: {len(chunk['text'])} characters ({chunk['tokens']:,} tokens)")
                 
                 logger.info(f"✅ Created {len(chunks)} chunks for ChatGPT processing")
                 return chunks
@@ -446,54 +481,27 @@ class GreenwashingDetector():
             logger.error(f"Error processing all chunks: {e}")
             return [f"Error processing cleaned content: {str(e)}"]
 
-    def log_detected_frameworks(self, framework_result: str):
+    def log_detected_frameworks(self, framework_result):
         """Log the detected frameworks with timestamp and details."""
         try:
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            detection = self.parse_framework_result(framework_result)
             
             # Log the raw result
             logger.info("🔍 FRAMEWORK DETECTION RESULTS")
             logger.info("=" * 50)
             logger.info(f"📅 Timestamp: {timestamp}")
-            logger.info(f"📄 Raw Result: {framework_result}")
-            
-            # Try to parse and structure the result
-            frameworks_detected = []
-            
-            # Simple parsing of bullet points
-            lines = framework_result.split('\n')
-            for line in lines:
-                line = line.strip()
-                if line.startswith('-') or line.startswith('•') or line.startswith('*'):
-                    # Extract framework name and confidence
-                    if '**' in line:
-                        # Format: **GRI**: Description. Confidence: 95%
-                        parts = line.split('**')
-                        if len(parts) >= 3:
-                            framework_name = parts[1].strip()
-                            description = parts[2].replace(':', '', 1).strip()
-                            
-                            # Extract confidence score
-                            confidence = "N/A"
-                            if "confidence" in description.lower():
-                                import re
-                                confidence_match = re.search(r'(\d+)%', description.lower())
-                                if confidence_match:
-                                    confidence = f"{confidence_match.group(1)}%"
-                            
-                            frameworks_detected.append({
-                                "framework": framework_name,
-                                "description": description,
-                                "confidence": confidence
-                            })
+            logger.info(f"📄 Raw Result: {detection.raw}")
             
             # Log structured results
-            if frameworks_detected:
+            if detection.frameworks:
                 logger.info("📋 DETECTED FRAMEWORKS:")
-                for framework in frameworks_detected:
-                    logger.info(f"   🏷️  {framework['framework']}")
-                    logger.info(f"   📝 {framework['description']}")
-                    logger.info(f"   🎯 Confidence: {framework['confidence']}")
+                for framework in detection.frameworks:
+                    confidence = f"{framework.confidence:.0f}%" if framework.confidence is not None else "N/A"
+                    logger.info(f"   🏷️  {framework.name} ({framework.role})")
+                    if framework.evidence:
+                        logger.info(f"   📝 {framework.evidence[0].text}")
+                    logger.info(f"   🎯 Confidence: {confidence}")
                     logger.info("")
             else:
                 logger.info("⚠️  No frameworks detected or unable to parse results")
@@ -501,12 +509,12 @@ class GreenwashingDetector():
             # Save to JSON file for later analysis
             framework_log = {
                 "timestamp": timestamp,
-                "raw_result": framework_result,
-                "parsed_frameworks": frameworks_detected,
-                "total_frameworks_detected": len(frameworks_detected)
+                "raw_result": detection.raw,
+                "method": detection.method,
+                "parsed_frameworks": [framework.model_dump() for framework in detection.frameworks],
+                "total_frameworks_detected": len(detection.frameworks)
             }
             
-            import os
             log_dir = "framework_logs"
             if not os.path.exists(log_dir):
                 os.makedirs(log_dir)
@@ -518,7 +526,7 @@ class GreenwashingDetector():
             logger.info(f"💾 Framework detection log saved to: {log_filename}")
             
             # Store for potential use by other agents
-            self.detected_frameworks = frameworks_detected
+            self.detected_frameworks = detection.frameworks
             
         except Exception as e:
             logger.error(f"❌ Error logging detected frameworks: {e}")
@@ -540,6 +548,27 @@ class GreenwashingDetector():
         except Exception as e:
             logger.warning(f"⚠️  Could not determine file size: {e}")
 
+    def parse_framework_result(self, framework_result) -> FrameworkDetectionResult:
+        """
+        Parse a framework detection result once and keep it for routing and reporting.
+        
+        Args:
+            framework_result: A FrameworkDetectionResult, or the framework detector's output
+            
+        Returns:
+            The typed detection result (also stored as self.framework_detection)
+        """
+        result_str = str(framework_result.raw) if hasattr(framework_result, 'raw') else str(framework_result)
+        if isinstance(framework_result, FrameworkDetectionResult):
+            detection = framework_result
+        elif self.framework_detection is not None and self.framework_detection.raw == result_str:
+            # Already parsed (log_detected_frameworks and _extract_detected_frameworks see the same output)
+            detection = self.framework_detection
+        else:
+            detection = FrameworkDetectionResult.from_llm_output(framework_result)
+        self.framework_detection = detection
+        return detection
+
     def _extract_detected_frameworks(self, framework_result) -> List[str]:
         """
         Extract detected frameworks from the framework detection result.
@@ -552,103 +581,13 @@ class GreenwashingDetector():
             List of detected framework names (e.g., ["GRI", "TCFD"])
         """
         try:
-            # Convert CrewOutput to string if needed
-            if hasattr(framework_result, 'raw'):
-                result_str = str(framework_result.raw)
-            else:
-                result_str = str(framework_result)
-            
-            detected_frameworks = []
-            primary_frameworks = []
-            secondary_frameworks = []
-            reference_frameworks = []
-            
-            # Common framework names to look for
-            framework_patterns = {
-                "GRI": ["GRI", "Global Reporting Initiative"],
-                "TCFD": ["TCFD", "Task Force on Climate-related Financial Disclosures"],
-                "SASB": ["SASB", "Sustainability Accounting Standards Board"],
-                "CDP": ["CDP", "Carbon Disclosure Project"],
-                "CSRD": ["CSRD", "Corporate Sustainability Reporting Directive"],
-                "ESRS": ["ESRS", "European Sustainability Reporting Standards"],
-                "ISO": ["ISO 14064", "ISO 14001"],
-                "SDG": ["SDG", "Sustainable Development Goals"]
-            }
-            
-            result_lower = result_str.lower()
-            
-            # First pass: Look for role indicators with improved priority
-            for framework, patterns in framework_patterns.items():
-                for pattern in patterns:
-                    if pattern.lower() in result_lower:
-                        # Look for role indicators in the same line or nearby
-                        lines = result_str.split('\n')
-                        for line in lines:
-                            if pattern.lower() in line.lower():
-                                line_lower = line.lower()
-                                
-                                # Check for PRIMARY indicators (strongest evidence)
-                                primary_indicators = [
-                                    "(primary)", "primary", "prepared in accordance with", 
-                                    "this report follows", "we report in accordance with",
-                                    "the report is prepared following"
-                                ]
-                                
-                                # Check for SECONDARY indicators (weaker evidence)
-                                secondary_indicators = [
-                                    "(secondary)", "secondary", "voluntary", "publish against", 
-                                    "additional", "supplementary", "aligned with", "consistent with"
-                                ]
-                                
-                                # Check for REFERENCE indicators (weakest evidence)
-                                reference_indicators = [
-                                    "(reference)", "reference", "consideration to", 
-                                    "mentioned for context", "but do not align in full with"
-                                ]
-                                
-                                # Check for role indicators with priority
-                                if any(indicator in line_lower for indicator in primary_indicators):
-                                    primary_frameworks.append(framework)
-                                    break
-                                elif any(indicator in line_lower for indicator in secondary_indicators):
-                                    secondary_frameworks.append(framework)
-                                    break
-                                elif any(indicator in line_lower for indicator in reference_indicators):
-                                    reference_frameworks.append(framework)
-                                    break
-                        else:
-                            # If no role indicator found, check confidence
-                            if "confidence" in result_lower:
-                                # Look for confidence scores
-                                import re
-                                for line in lines:
-                                    if pattern.lower() in line.lower() and "confidence" in line.lower():
-                                        # Extract confidence score
-                                        confidence_match = re.search(r'(\d+)%', line)
-                                        if confidence_match:
-                                            confidence = int(confidence_match.group(1))
-                                            if confidence >= 40:  # Only include if confidence >= 40%
-                                                # Default to secondary if no role specified
-                                                secondary_frameworks.append(framework)
-                                            break
-                            else:
-                                # If no confidence mentioned, include as secondary
-                                secondary_frameworks.append(framework)
-                        break  # Only add each framework once
-            
-            # Prioritize frameworks: Primary first, then secondary, then reference
-            detected_frameworks = primary_frameworks + secondary_frameworks + reference_frameworks
-            
-            # Remove duplicates while preserving order
-            unique_frameworks = []
-            for framework in detected_frameworks:
-                if framework not in unique_frameworks:
-                    unique_frameworks.append(framework)
+            detection = self.parse_framework_result(framework_result)
+            unique_frameworks = detection.framework_names
             
             logger.info(f"🎯 Extracted frameworks: {unique_frameworks}")
-            logger.info(f"   Primary: {primary_frameworks}")
-            logger.info(f"   Secondary: {secondary_frameworks}")
-            logger.info(f"   Reference: {reference_frameworks}")
+            logger.info(f"   Primary: {[framework.name for framework in detection.by_role('primary')]}")
+            logger.info(f"   Secondary: {[framework.name for framework in detection.by_role('secondary')]}")
+            logger.info(f"   Reference: {[framework.name for framework in detection.by_role('reference')]}")
             
             return unique_frameworks
             
@@ -680,7 +619,7 @@ class GreenwashingDetector():
         logger.info("-" * 30)
         
         # Call the detailed logging function
-        self.log_detected_frameworks(result_str)
+        self.log_detected_frameworks(framework_result)
 
     def log_agent_execution(self, agent_name: str, task_name: str, input_data: str = None, output_data: str = None):
         """Log agent execution details for monitoring."""
@@ -718,7 +657,8 @@ class GreenwashingDetector():
         if self.detected_frameworks:
             logger.info(f"🎯 Frameworks Detected: {len(self.detected_frameworks)}")
             for framework in self.detected_frameworks:
-                logger.info(f"   - {framework['framework']} ({framework['confidence']})")
+                confidence = f"{framework.confidence:.0f}%" if framework.confidence is not None else "N/A"
+                logger.info(f"   - {framework.name} ({confidence})")
         
         logger.info("")
 
@@ -1118,6 +1058,13 @@ This analysis was performed using the enhanced greenwashing detection system wit
             logger.error(f"❌ Error saving enhanced workflow summary to markdown: {e}")
             return None
 
+    def _current_framework_detection(self) -> Optional[FrameworkDetectionResult]:
+        if self.framework_detection is not None:
+            return self.framework_detection
+        if hasattr(self, 'last_framework_result'):
+            return self.parse_framework_result(self.last_framework_result)
+        return None
+
     def is_tcfd_major_framework(self, detected_frameworks: List[str]) -> bool:
         """
         Determine if TCFD is a major framework that should trigger TCFD-specific analysis.
@@ -1133,21 +1080,10 @@ This analysis was performed using the enhanced greenwashing detection system wit
             if "TCFD" not in detected_frameworks:
                 return False
             
-            # Get the framework detection result to check confidence
-            if hasattr(self, 'last_framework_result'):
-                result_str = str(self.last_framework_result)
-                
-                # Look for TCFD confidence score
-                import re
-                tcfd_confidence_match = re.search(r'TCFD.*?Confidence.*?(\d+)%', result_str, re.IGNORECASE)
-                if tcfd_confidence_match:
-                    confidence = int(tcfd_confidence_match.group(1))
-                    # TCFD is major if confidence >= 70%
-                    return confidence >= 70
-                
-                # If no confidence found, check if TCFD is mentioned prominently
-                tcfd_mentions = result_str.lower().count('tcfd')
-                return tcfd_mentions >= 2  # Multiple mentions indicate major framework
+            # TCFD is major if detected with confidence >= 70%, or as primary/secondary without a score
+            detection = self._current_framework_detection()
+            if detection is not None:
+                return detection.is_major("TCFD")
             
             # Default: TCFD is major if it's in the detected frameworks
             return True
@@ -1170,17 +1106,10 @@ This analysis was performed using the enhanced greenwashing detection system wit
             if "TCFD" not in detected_frameworks:
                 return "standard"
             
-            # Get the framework detection result to check role
-            if hasattr(self, 'last_framework_result'):
-                result_str = str(self.last_framework_result)
-                
-                # Check if TCFD is marked as PRIMARY (case insensitive)
-                if re.search(r'tcfd.*?primary|primary.*?tcfd', result_str, re.IGNORECASE):
-                    return "tcfd_primary"
-                
-                # Check if TCFD is marked as SECONDARY
-                if re.search(r'tcfd.*?secondary|secondary.*?tcfd', result_str, re.IGNORECASE):
-                    return "tcfd_secondary"
+            # Route on TCFD's detected role
+            detection = self._current_framework_detection()
+            if detection is not None and detection.get("TCFD") is not None:
+                return detection.tcfd_analysis_route()
             
             # Default: TCFD secondary if TCFD is detected
             return "tcfd_secondary"
@@ -1206,7 +1135,7 @@ This analysis was performed using the enhanced greenwashing detection system wit
             logger.info("🎯 Creating TCFD PRIMARY specialized crew")
             
             # Create TCFD-focused agents
-            tcfd_analyst = Agent(
+            tcfd_analyst = self._with_llm_limits(Agent(
                 role="TCFD Compliance Specialist",
                 goal="Perform comprehensive TCFD compliance analysis across all four pillars with deep climate expertise",
                 backstory="""You are a senior TCFD compliance specialist with 15+ years of experience in climate-related financial disclosures. 
@@ -1219,9 +1148,9 @@ This analysis was performed using the enhanced greenwashing detection system wit
                     self.tools["TCFDAnalyzerTool"](),
                     self.tools["FrameworkGlossaryTool"]()
                 ]
-            )
+            ))
             
-            tcfd_validator = Agent(
+            tcfd_validator = self._with_llm_limits(Agent(
                 role="TCFD Greenwashing Detector",
                 goal="Identify potential greenwashing in TCFD disclosures using climate-specific criteria",
                 backstory="""You are a climate finance expert specializing in detecting greenwashing in TCFD disclosures. 
@@ -1234,7 +1163,7 @@ This analysis was performed using the enhanced greenwashing detection system wit
                     self.tools["TCFDAnalyzerTool"](),
                     self.tools["FrameworkGlossaryTool"]()
                 ]
-            )
+            ))
             
             # Create TCFD-specific tasks
             tcfd_analysis_task = Task(
@@ -1398,6 +1327,96 @@ This analysis was performed using the enhanced greenwashing detection system wit
                 verbose=True
             )
 
+    def create_esg_analysis_crew(self) -> Crew:
+        """Create the ChatGPT crew that extracts ESG claims from a content chunk."""
+        return Crew(
+            agents=[self.esg_analyst()],
+            tasks=[self.extract_esg_claims()],
+            process=Process.sequential,
+            verbose=True
+        )
+
+    def create_claims_validation_crew(self) -> Crew:
+        """Create the ChatGPT crew that validates extracted claims for greenwashing."""
+        return Crew(
+            agents=[self.compliance_checker()],
+            tasks=[self.validate_claims()],
+            process=Process.sequential,
+            verbose=True
+        )
+
+    def _crew_factory(self, name: str) -> Callable[[], Crew]:
+        """Return the factory for a pooled crew: 'esg_analysis', 'claims_validation' or a TCFD route."""
+        if name == "esg_analysis":
+            return self.create_esg_analysis_crew
+        if name == "claims_validation":
+            return self.create_claims_validation_crew
+        if name in ("tcfd_primary", "tcfd_secondary"):
+            return lambda: self.create_tcfd_specialized_crew(name)
+        raise ValueError(f"Unknown crew: {name}")
+
+    @staticmethod
+    def _measure_build(build: Callable[[], Crew]) -> Tuple[Crew, float]:
+        """Build a crew, returning it with the time taken."""
+        start_time = time.perf_counter()
+        crew = build()
+        return crew, time.perf_counter() - start_time
+
+    @contextmanager
+    def pooled_crew(self, name: str):
+        """
+        Check a crew out of the pool for one kickoff and return it afterwards.
+        
+        Each crew is built once per run as a template. Every concurrent user gets its own
+        copy of the template (agents and tasks keep per-run state), and copies are reused
+        by later chunks instead of rebuilding agents, tools and tasks every iteration.
+        
+        Args:
+            name: 'esg_analysis', 'claims_validation', 'tcfd_primary' or 'tcfd_secondary'
+            
+        Yields:
+            A crew ready for kickoff with new inputs
+        """
+        with self._crew_pool_lock:
+            idle = self._idle_crews.setdefault(name, [])
+            if idle:
+                crew = idle.pop()
+                self.crew_pool_stats["reuses"] += 1
+            else:
+                # Builds are rare, so they run under the lock and each template is built once
+                template = self._crew_templates.get(name)
+                if template is None:
+                    template, elapsed = self._measure_build(self._crew_factory(name))
+                    self._crew_templates[name] = template
+                    self.crew_pool_stats["templates_built"] += 1
+                    self.crew_pool_stats["template_seconds"] += elapsed
+                crew, elapsed = self._measure_build(template.copy)
+                self.crew_pool_stats["instances_built"] += 1
+                self.crew_pool_stats["instance_seconds"] += elapsed
+        try:
+            yield crew
+        finally:
+            with self._crew_pool_lock:
+                self._idle_crews[name].append(crew)
+
+    def log_crew_pool_stats(self):
+        """Log how many crews were built versus reused and the estimated time saved per chunk."""
+        stats = self.crew_pool_stats
+        builds = stats["templates_built"] + stats["instances_built"]
+        if not builds:
+            return
+        # Without the pool, every kickoff built its crew from scratch (agents, tools, tasks) and copied it
+        per_build_seconds = (stats["template_seconds"] / max(1, stats["templates_built"])
+                             + stats["instance_seconds"] / max(1, stats["instances_built"]))
+        logger.info(
+            f"♻️ Crew pool: {stats['templates_built']} crews built once, {stats['instances_built']} instances, "
+            f"{stats['reuses']} reuses"
+        )
+        logger.info(
+            f"   Saved ~{per_build_seconds * 1000:.0f} ms per reused kickoff "
+            f"(~{per_build_seconds * stats['reuses']:.2f} s total)"
+        )
+
     def chunk_esg_output_for_validation(self, esg_output: str, max_tokens_per_chunk: int = 4000) -> List[str]:
         """
         Chunk the ESG analyst output for claims validation to avoid token limits.
@@ -1413,61 +1432,30 @@ This analysis was performed using the enhanced greenwashing detection system wit
             logger.info("🔍 Chunking ESG output for claims validation")
             logger.info(f"📄 ESG output length: {len(esg_output)} characters")
             
-            # More accurate token estimation
-            estimated_tokens = len(esg_output) // 3.0
-            logger.info(f"📊 Estimated tokens: {estimated_tokens:,}")
+            chunker = self.chatgpt_chunker(max_tokens_per_chunk, overlap_tokens=60)
+            total_tokens = chunker.count_tokens(esg_output)
+            logger.info(f"📊 Tokens: {total_tokens:,}")
             
-            if estimated_tokens <= max_tokens_per_chunk:
+            if total_tokens <= chunker.max_tokens:
                 # Output fits in single chunk
                 logger.info("✅ ESG output fits in single validation chunk")
                 return [esg_output]
             else:
                 # Need to chunk the output
-                logger.info(f"🔄 ESG output needs chunking for validation (max {max_tokens_per_chunk:,} tokens per chunk)")
-                
-                # Calculate chunk size in characters (more conservative)
-                chunk_size_chars = int(max_tokens_per_chunk * 3.0)
-                overlap_chars = 200
-                
-                # Split by sections first (look for markdown headers)
-                import re
-                sections = re.split(r'(## [^\n]+\n)', esg_output)
+                logger.info(f"🔄 ESG output needs chunking for validation ({chunker.describe()})")
                 
+                # Keep markdown sections together where they fit, otherwise break at sentence ends
                 chunks = []
-                current_chunk = ""
-                chunk_num = 1
-                
-                for section in sections:
-                    # If adding this section would exceed chunk size, start a new chunk
-                    if len(current_chunk + section) > chunk_size_chars and current_chunk:
-                        # Add chunk information
-                        chunk_with_info = f"--- ESG ANALYSIS CHUNK {chunk_num} ---\n\n"
-                        chunk_with_info += current_chunk
-                        chunk_with_info += f"\n\n--- VALIDATION INSTRUCTIONS ---\n"
-                        chunk_with_info += f"Analyze the ESG claims above for potential greenwashing indicators.\n"
-                        chunk_with_info += f"Focus on specificity, verifiability, and evidence quality.\n"
-                        
-                        chunks.append(chunk_with_info)
-                        
-                        logger.info(f"📄 Validation chunk {chunk_num}: {len(current_chunk)} characters (~{len(current_chunk)//3.5:.0f} tokens)")
-                        
-                        # Start new chunk with overlap
-                        current_chunk = current_chunk[-overlap_chars:] + section
-                        chunk_num += 1
-                    else:
-                        current_chunk += section
-                
-                # Add the last chunk
-                if current_chunk.strip():
-                    chunk_with_info = f"--- ESG ANALYSIS CHUNK {chunk_num} ---\n\n"
-                    chunk_with_info += current_chunk
-                    chunk_with_info += f"\n\n--- VALIDATION INSTRUCTIONS ---\n"
-                    chunk_with_info += f"Analyze the ESG claims above for potential greenwashing indicators.\n"
-                    chunk_with_info += f"Focus on specificity, verifiability, and evidence quality.\n"
-                    
-                    chunks.append(chunk_with_info)
+                for chunk in chunker.chunk(esg_output, section_pattern=MARKDOWN_SECTION):
+                    chunks.append(
+                        f"--- ESG ANALYSIS CHUNK {chunk['index']} ---\n\n"
+                        f"{chunk['text']}"
+                        f"\n\n--- VALIDATION INSTRUCTIONS ---\n"
+                        f"Analyze the ESG claims above for potential greenwashing indicators.\n"
+                        f"Focus on specificity, verifiability, and evidence quality.\n"
+                    )
                     
-                    logger.info(f"📄 Validation chunk {chunk_num}: {len(current_chunk)} characters (~{len(current_chunk)//3.5:.0f} tokens)")
+                    logger.info(f"📄 Validation chunk {chunk['index']}: {len(chunk['text'])} characters ({chunk['tokens']:,} tokens)")
                 
                 logger.info(f"✅ Created {len(chunks)} chunks for claims validation")
                 return chunks
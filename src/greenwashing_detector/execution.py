@@ -0,0 +1,127 @@
+# src/greenwashing_detector/execution.py
+
+import os
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_ANALYSIS_WORKERS = 4
+
+# Requests per minute and concurrent requests allowed per LLM provider; overridable with
+# LLM_RATE_LIMIT_<PROVIDER>_RPM and LLM_MAX_CONCURRENT_<PROVIDER>, e.g. LLM_RATE_LIMIT_OPENAI_RPM
+DEFAULT_PROVIDER_LIMITS = {
+    "openai": {"rpm": 60, "concurrent": 4},
+    "ollama": {"rpm": 0, "concurrent": 1},  # local model: no quota, but one request at a time
+}
+
+def default_analysis_workers() -> int:
+    """Worker threads for chunk analysis, overridable with ANALYSIS_WORKERS (1 = serial)."""
+    configured = os.getenv("ANALYSIS_WORKERS")
+    if configured:
+        try:
+            return max(1, int(configured))
+        except ValueError:
+            logger.warning(f"⚠️ Invalid ANALYSIS_WORKERS value: {configured}")
+    return DEFAULT_ANALYSIS_WORKERS
+
+def provider_for_llm(llm: Optional[str]) -> str:
+    """Return the provider of an LLM identifier, e.g. 'ollama' for 'ollama/llama2:latest'."""
+    if not llm:
+        return "openai"  # CrewAI's default LLM
+    llm = str(getattr(llm, "model", llm))
+    return llm.split("/", 1)[0].lower() if "/" in llm else "openai"
+
+class RateLimiter:
+    """
+    Thread-safe limits for one LLM provider.
+
+    Used as a context manager, it caps the number of crews running against the
+    provider at once. The requests-per-minute quota is applied per request: every
+    LLM request calls wait() first (see CachedLLM), which spaces request starts at
+    least 60/rpm seconds apart across all threads.
+    """
+
+    def __init__(self, provider: str, rpm: int = 0, concurrent: int = 1):
+        self.provider = provider
+        self.rpm = rpm
+        self.min_interval = 60.0 / rpm if rpm > 0 else 0.0
+        self._slots = threading.BoundedSemaphore(max(1, concurrent))
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def wait(self):
+        """Block until the next request may start under the requests-per-minute quota."""
+        if not self.min_interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.min_interval
+        if start > now:
+            time.sleep(start - now)
+
+    def __enter__(self):
+        self._slots.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._slots.release()
+        return False
+
+
+_rate_limiters: Dict[str, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+def get_rate_limiter(provider: str) -> RateLimiter:
+    """Return the process-wide rate limiter for a provider."""
+    provider = provider.lower()
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(provider)
+        if limiter is None:
+            defaults = DEFAULT_PROVIDER_LIMITS.get(provider, {"rpm": 0, "concurrent": DEFAULT_ANALYSIS_WORKERS})
+            rpm = int(os.getenv(f"LLM_RATE_LIMIT_{provider.upper()}_RPM", defaults["rpm"]))
+            concurrent = int(os.getenv(f"LLM_MAX_CONCURRENT_{provider.upper()}", defaults["concurrent"]))
+            limiter = RateLimiter(provider, rpm=rpm, concurrent=concurrent)
+            _rate_limiters[provider] = limiter
+            logger.info(f"🚦 Rate limit for {provider}: {rpm or 'unlimited'} rpm, {concurrent} concurrent")
+        return limiter
+
+def kickoff_crew(crew, inputs: Dict[str, Any], provider: str = "openai", copy: bool = True):
+    """
+    Kick off a crew within its provider's concurrency cap.
+
+    The requests-per-minute quota is not applied here, since a kickoff makes many
+    requests: the agents' LLMs wait for the provider's limiter before each request.
+
+    By default the call runs on its own copy of the crew (as Crew.kickoff_for_each does),
+    since a crew's tasks keep per-run state and must not be shared between threads. Pass
+    copy=False for crews the caller holds exclusively, e.g. one checked out of the pool.
+    """
+    with get_rate_limiter(provider):
+        return (crew.copy() if copy else crew).kickoff(inputs=inputs)
+
+def map_in_order(func: Callable[[int, T], R], items: Sequence[T], workers: int = 1,
+                 label: str = "items") -> List[R]:
+    """
+    Apply `func(index, item)` to every item, on a thread pool when `workers` > 1.
+
+    Results are returned in the order of `items` regardless of completion order.
+    Indices are 1-based, matching the chunk numbering used in logs and reports.
+    """
+    if workers <= 1 or len(items) <= 1:
+        return [func(index, item) for index, item in enumerate(items, 1)]
+
+    workers = min(workers, len(items))
+    logger.info(f"⚡ Processing {len(items)} {label} with {workers} worker threads")
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="analysis") as executor:
+        futures = [executor.submit(func, index, item) for index, item in enumerate(items, 1)]
+        return [future.result() for future in futures]
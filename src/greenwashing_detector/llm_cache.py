@@ -0,0 +1,312 @@
+# src/greenwashing_detector/llm_cache.py
+
+import os
+import sys
+import json
+import time
+import sqlite3
+import hashlib
+import argparse
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from crewai import LLM
+from .execution import get_rate_limiter, provider_for_llm
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "greenwashing_detector", "llm_responses.sqlite3")
+DEFAULT_TTL_DAYS = 30
+DEFAULT_MAX_MB = 512
+
+# LLM_CACHE_MODE values
+MODE_OFF = "off"              # always call the model (default)
+MODE_READ_WRITE = "readwrite"  # serve hits, store misses
+MODE_REPLAY = "replay"        # read-only: serve hits, fail on misses (regression tests)
+CACHE_MODES = (MODE_OFF, MODE_READ_WRITE, MODE_REPLAY)
+
+# Caching freezes model output, so it is opt-in
+DEFAULT_MODE = MODE_OFF
+
+SAMPLING_PARAMS = ("temperature", "top_p", "max_tokens", "max_completion_tokens", "seed", "stop",
+                   "n", "presence_penalty", "frequency_penalty", "response_format")
+
+class LLMCacheMissError(RuntimeError):
+    """Raised in replay mode when a request has no recorded response."""
+
+def file_version(*paths: str) -> str:
+    """Short content hash of prompt template files, used as a template version."""
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:12]
+
+class LLMResponseCache:
+    """
+    Persistent SQLite cache of LLM responses.
+
+    Responses are keyed by model, prompt template version, rendered inputs and sampling
+    parameters, so byte-identical requests are answered without calling Ollama or OpenAI.
+    Entries expire after a TTL and the least recently used ones are evicted once the
+    cache grows past its size limit. In replay mode the database is opened read-only
+    and a request without a recorded response raises LLMCacheMissError.
+    """
+
+    def __init__(self, path: Optional[str] = None, mode: Optional[str] = None,
+                 ttl_seconds: Optional[float] = None, max_bytes: Optional[int] = None):
+        self.path = path or os.getenv("LLM_CACHE_PATH", DEFAULT_CACHE_PATH)
+        self.mode = (mode or os.getenv("LLM_CACHE_MODE", DEFAULT_MODE)).lower()
+        if self.mode not in CACHE_MODES:
+            raise ValueError(f"Invalid LLM cache mode '{self.mode}', expected one of {CACHE_MODES}")
+        if ttl_seconds is None:
+            ttl_seconds = float(os.getenv("LLM_CACHE_TTL_DAYS", DEFAULT_TTL_DAYS)) * 86400
+        self.ttl_seconds = ttl_seconds  # 0 disables expiry
+        if max_bytes is None:
+            max_bytes = int(float(os.getenv("LLM_CACHE_MAX_MB", DEFAULT_MAX_MB)) * 1024 * 1024)
+        self.max_bytes = max_bytes
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+        self._stats_lock = threading.Lock()
+        if self.mode == MODE_READ_WRITE:
+            self._init_db()
+
+    @property
+    def read_only(self) -> bool:
+        return self.mode == MODE_REPLAY
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # One short-lived connection per operation keeps the cache safe to use from worker threads
+        if self.read_only:
+            conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, timeout=30)
+        else:
+            conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:  # commits on success, rolls back on error
+                yield conn
+        finally:
+            conn.close()
+
+    def _init_db(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY, model TEXT, template_version TEXT, response TEXT,"
+                " created_at REAL, last_used REAL, size INTEGER)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)")
+
+    def _count(self, stat: str, amount: int = 1):
+        with self._stats_lock:
+            self.stats[stat] += amount
+
+    @staticmethod
+    def make_key(model: str, template_version: str, inputs: Any, params: Optional[Dict[str, Any]] = None) -> str:
+        """Build the cache key from everything that determines a response."""
+        payload = json.dumps({
+            "model": model,
+            "template_version": template_version,
+            "inputs": inputs,
+            "params": params or {}
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for a key, or None if missing or expired."""
+        if self.mode == MODE_OFF or (self.read_only and not os.path.exists(self.path)):
+            return None
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                row = conn.execute("SELECT response, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return None
+                response, created_at = row
+                if self.ttl_seconds and now - created_at > self.ttl_seconds:
+                    if not self.read_only:
+                        conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    return None
+                if not self.read_only:
+                    conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+                return response
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ LLM cache read failed: {e}")
+            return None
+
+    def put(self, key: str, response: str, model: str = "", template_version: str = ""):
+        """Store a response (no-op unless the cache is read-write), then enforce TTL and size limits."""
+        if self.mode != MODE_READ_WRITE:
+            return
+        now = time.time()
+        size = len(response.encode("utf-8")) + len(key)
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, model, template_version, response, created_at, last_used, size)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, model, template_version, response, now, now, size)
+                )
+            self._count("stores")
+            self.evict()
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ LLM cache write failed: {e}")
+
+    def evict(self) -> int:
+        """Delete expired entries, then least-recently-used ones until the cache fits its size limit."""
+        if self.mode != MODE_READ_WRITE:
+            return 0
+        removed = 0
+        with self._connect() as conn:
+            if self.ttl_seconds:
+                removed += conn.execute("DELETE FROM responses WHERE created_at < ?",
+                                        (time.time() - self.ttl_seconds,)).rowcount
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total > self.max_bytes:
+                for key, size in conn.execute("SELECT key, size FROM responses ORDER BY last_used").fetchall():
+                    conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    removed += 1
+                    total -= size
+                    if total <= self.max_bytes:
+                        break
+        if removed:
+            self._count("evictions", removed)
+        return removed
+
+    def purge(self) -> int:
+        """Delete every entry. Returns the number removed."""
+        if self.mode != MODE_READ_WRITE:
+            return 0
+        with self._connect() as conn:
+            return conn.execute("DELETE FROM responses").rowcount
+
+    def summary(self) -> Dict[str, Any]:
+        """Return entry count, size and per-model counts of the cache."""
+        if not os.path.exists(self.path):
+            return {"entries": 0, "size": 0, "models": {}}
+        with self._connect() as conn:
+            entries, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+            models = dict(conn.execute("SELECT model, COUNT(*) FROM responses GROUP BY model").fetchall())
+        return {"entries": entries, "size": size, "models": models}
+
+    def get_or_call(self, key: str, call: Callable[[], str], model: str = "", template_version: str = "") -> str:
+        """
+        Return the cached response for a key, calling the model and caching the result on a miss.
+
+        Raises:
+            LLMCacheMissError: In replay mode, when no response was recorded for the key
+        """
+        response = self.get(key)
+        if response is not None:
+            self._count("hits")
+            return response
+        self._count("misses")
+        if self.read_only:
+            raise LLMCacheMissError(f"No recorded LLM response for {model} (key {key[:12]}) in replay mode")
+        response = call()
+        if isinstance(response, str):
+            self.put(key, response, model=model, template_version=template_version)
+        return response
+
+
+_default_cache: Optional[LLMResponseCache] = None
+_default_cache_lock = threading.Lock()
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """Return the process-wide LLM response cache, or None unless LLM_CACHE_MODE enables it."""
+    global _default_cache
+    if os.getenv("LLM_CACHE_MODE", DEFAULT_MODE).lower() == MODE_OFF:
+        return None
+    with _default_cache_lock:
+        if _default_cache is None:
+            try:
+                _default_cache = LLMResponseCache()
+            except (ValueError, sqlite3.Error, OSError) as e:
+                logger.warning(f"⚠️ LLM response cache disabled: {e}")
+                return None
+            ttl = f"{_default_cache.ttl_seconds / 86400:g}-day TTL" if _default_cache.ttl_seconds else "no TTL"
+            logger.info(f"🗄️ LLM response cache: {_default_cache.mode} mode, {ttl}, database {_default_cache.path}")
+        return _default_cache
+
+def cached_completion(model: str, template_version: str, inputs: Any, params: Optional[Dict[str, Any]],
+                      call: Callable[[], str]) -> str:
+    """
+    Run an LLM request through the response cache (or directly if caching is off).
+
+    Args:
+        model: Model name, e.g. "llama3"
+        template_version: Version of the prompt template that rendered the inputs
+        inputs: The rendered prompt or messages
+        params: Sampling parameters that affect the response
+        call: Performs the actual request and returns the response text
+    """
+    cache = get_llm_cache()
+    if cache is None:
+        return call()
+    key = cache.make_key(model, template_version, inputs, params)
+    return cache.get_or_call(key, call, model=model, template_version=template_version)
+
+class CachedLLM(LLM):
+    """
+    CrewAI LLM whose completions go through the LLM response cache and the provider's rate limit.
+
+    Only requests actually sent to the provider wait for its requests-per-minute
+    limiter; cache hits do not count. Requests that pass native tool definitions are
+    sent uncached, since their responses trigger tool execution inside the call.
+    """
+
+    def __init__(self, *args, template_version: str = "", response_cache: Optional[LLMResponseCache] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.template_version = template_version
+        self.response_cache = response_cache or get_llm_cache()
+        self.rate_limiter = get_rate_limiter(provider_for_llm(self.model))
+
+    def _request(self, messages, *args, **kwargs):
+        self.rate_limiter.wait()
+        return super().call(messages, *args, **kwargs)
+
+    def _sampling_params(self) -> Dict[str, Any]:
+        return {name: getattr(self, name, None) for name in SAMPLING_PARAMS}
+
+    def call(self, messages, *args, **kwargs):
+        tools = kwargs.get("tools", args[0] if args else None)
+        if self.response_cache is None or tools:
+            return self._request(messages, *args, **kwargs)
+        key = self.response_cache.make_key(self.model, self.template_version, messages, self._sampling_params())
+        return self.response_cache.get_or_call(
+            key, lambda: self._request(messages, *args, **kwargs),
+            model=self.model, template_version=self.template_version
+        )
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line interface to inspect, evict or purge the LLM response cache."""
+    parser = argparse.ArgumentParser(description="Inspect or purge the LLM response cache.")
+    parser.add_argument("--path", help="Cache database (defaults to LLM_CACHE_PATH or ~/.cache)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("stats", help="Show entries, size and limits")
+    subparsers.add_parser("evict", help="Apply TTL and size limits now")
+    subparsers.add_parser("purge", help="Delete every cached response")
+    args = parser.parse_args(argv)
+
+    # Inspection opens the database read-only, so it never creates one
+    cache = LLMResponseCache(path=args.path, mode=MODE_REPLAY if args.command == "stats" else MODE_READ_WRITE)
+    if args.command == "stats":
+        summary = cache.summary()
+        print(f"Cache database: {cache.path}")
+        print(f"Entries: {summary['entries']}")
+        print(f"Size: {summary['size'] / (1024 * 1024):.1f} MiB of {cache.max_bytes / (1024 * 1024):.0f} MiB")
+        print(f"TTL: {cache.ttl_seconds / 86400:.0f} days" if cache.ttl_seconds else "TTL: none")
+        for model, count in sorted(summary["models"].items()):
+            print(f"  {model}: {count}")
+    elif args.command == "evict":
+        print(f"Removed {cache.evict()} entries")
+    elif args.command == "purge":
+        print(f"Removed {cache.purge()} entries")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,21 @@
 #!/usr/bin/env python
+import os
 import sys
 import warnings
 import logging
 import time
+import functools
 from datetime import datetime
+from typing import Optional
+from greenwashing_detector.checkpoint import RunCheckpoint, result_text, text_hash
 from greenwashing_detector.crew import GreenwashingDetector
+from greenwashing_detector.execution import default_analysis_workers, kickoff_crew, map_in_order, provider_for_llm
+from greenwashing_detector.tools.dedup import stage_max_distance
+from greenwashing_detector.tools.framework_detector import detect_frameworks_rule_based
+from greenwashing_detector.tools.framework_result import FrameworkDetectionResult
+from greenwashing_detector.tools.knowledge_base import knowledge_base
+from greenwashing_detector.tools.prompt_builder import log_prompt_metrics
+from greenwashing_detector.tools.pdf_document import load_pdf_document, release_pdf_document
 
 warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
 
@@ -18,6 +29,21 @@ logger = logging.getLogger(__name__)
 # interpolate any tasks and agents information
 # src/greenwashing_detector/main.py
 
+def with_shared_pdf_document(run_func):
+    """
+    Open the report once for the duration of a run so every reader, chunker and tool
+    shares the same parsed pages, and release it when the run finishes.
+    """
+    @functools.wraps(run_func)
+    def wrapper(pdf_path: str, *args, **kwargs):
+        load_pdf_document(pdf_path)
+        try:
+            return run_func(pdf_path, *args, **kwargs)
+        finally:
+            release_pdf_document(pdf_path)
+    return wrapper
+
+@with_shared_pdf_document
 def run_greenwashing_crew(pdf_path: str) -> str:
     """
     Run the greenwashing detection crew with comprehensive framework logging and proper chunk processing.
@@ -210,6 +236,7 @@ def run_greenwashing_crew(pdf_path: str) -> str:
     
     return combined_result
 
+@with_shared_pdf_document
 def run_framework_detection_only(pdf_path: str) -> str:
     """
     Run only the framework detection task for testing with enhanced logging.
@@ -259,6 +286,7 @@ def run_framework_detection_only(pdf_path: str) -> str:
     
     return result
 
+@with_shared_pdf_document
 def run_framework_detection_with_monitoring(pdf_path: str) -> str:
     """
     Run framework detection with detailed monitoring and logging.
@@ -344,32 +372,35 @@ def run_framework_detection_with_monitoring(pdf_path: str) -> str:
     
     return result
 
-def run_enhanced_greenwashing_workflow(pdf_path: str) -> str:
+def detect_frameworks_stage(detector: GreenwashingDetector, pdf_path: str) -> dict:
     """
-    Run the enhanced greenwashing detection workflow with fluff remover and ChatGPT chunking.
+    Step 1 of the enhanced workflow: framework detection.
     
-    Workflow:
-    1. Framework Detection (Ollama) - Identify ESG frameworks
-    2. Fluff Removal (Ollama) - Remove unnecessary content
-    3. ChatGPT Chunking - Process cleaned content for ChatGPT
-    4. ESG Analysis (ChatGPT) - Extract claims from cleaned content
-    5. Claims Validation (ChatGPT) - Validate claims for greenwashing
+    The rule-based detector runs first; the Ollama framework detector is only asked
+    when its result is ambiguous. FRAMEWORK_DETECTION_MODE=rules or =llm forces one
+    of the two.
     
-    Args:
-        pdf_path: Path to the PDF file to analyze
-        
     Returns:
-        Analysis results as a string
+        Stage artifact with `framework_result`, `detection` (FrameworkDetectionResult dump),
+        `detected_frameworks`, `method` and `seconds`
     """
-    logger.info("🚀 Starting Enhanced Greenwashing Detection Workflow")
-    logger.info(f"📄 Analyzing PDF: {pdf_path}")
-    logger.info("=" * 60)
-    
-    detector = GreenwashingDetector()
-    
-    # --- Step 1: Framework Detection (Ollama) ---
-    logger.info("🔍 Step 1: Framework Detection (Ollama)")
-    logger.info("-" * 40)
+    mode = os.getenv("FRAMEWORK_DETECTION_MODE", "auto").lower()
+    rule_result = None
+    if mode != "llm":
+        rule_result = detect_frameworks_rule_based(load_pdf_document(pdf_path).full_text)
+        if mode == "rules" or not rule_result["ambiguous"]:
+            detection = detector.parse_framework_result(rule_result["result"])
+            logger.info(f"✅ Framework detection completed without the LLM: {rule_result['reason']}")
+            detector.log_framework_detection_complete(detection, rule_result["seconds"])
+            detector.save_framework_detection_to_md(detection, pdf_path)
+            return {
+                "framework_result": detection.raw,
+                "detection": detection.model_dump(),
+                "detected_frameworks": detection.framework_names,
+                "method": "rules",
+                "seconds": rule_result["seconds"]
+            }
+        logger.info(f"🤔 Rule-based detection is ambiguous ({rule_result['reason']}), asking the LLM detector")
     
     # Extract PDF content first since Ollama agents don't have tools
     logger.info("📄 Extracting PDF content for framework detection...")
@@ -410,25 +441,45 @@ def run_enhanced_greenwashing_workflow(pdf_path: str) -> str:
     detector.save_framework_detection_to_md(framework_result, pdf_path)
     detector.save_agent_output_to_md("framework_detector", "detect_reporting_framework", framework_result, pdf_path)
     
-    # Extract detected frameworks for fluff remover
-    detected_frameworks = detector._extract_detected_frameworks(framework_result)
-    logger.info(f"🎯 Detected frameworks for fluff remover: {detected_frameworks}")
-    
-    # Store framework result for TCFD routing logic
-    detector.last_framework_result = framework_result
+    # Parsed once here; routing and fluff removal use the typed result
+    detection = detector.parse_framework_result(framework_result)
+    return {
+        "framework_result": detection.raw,
+        "detection": detection.model_dump(),
+        # Extract detected frameworks for fluff remover
+        "detected_frameworks": detector._extract_detected_frameworks(detection),
+        "method": "llm",
+        "rule_based_summary": rule_result["result"].raw if rule_result else None,
+        "seconds": framework_time + (rule_result["seconds"] if rule_result else 0.0)
+    }
+
+def remove_fluff_stage(detector: GreenwashingDetector, pdf_path: str, detected_frameworks: list) -> dict:
+    """
+    Step 2 of the enhanced workflow: framework-aware fluff removal.
     
-    # Check if TCFD is a major framework and determine analysis route
-    tcfd_is_major = detector.is_tcfd_major_framework(detected_frameworks)
-    tcfd_analysis_route = detector.get_tcfd_analysis_route(detected_frameworks)
+    By default the FluffRemover's local engine cleans the whole report without an
+    LLM. FLUFF_REMOVAL_MODE=hybrid also asks the Ollama model about the paragraphs
+    the engine finds ambiguous; FLUFF_REMOVAL_MODE=llm runs the fluff remover agent
+    on the report text instead.
     
-    if tcfd_is_major:
-        logger.info(f"🎯 TCFD detected as major framework - Analysis route: {tcfd_analysis_route}")
-    else:
-        logger.info("📋 TCFD not detected as major framework - Using standard analysis")
+    Returns:
+        Stage artifact with `cleaned_content`, `method`, `stats` and `seconds`
+    """
+    mode = os.getenv("FLUFF_REMOVAL_MODE", "local").lower()
+    if mode != "llm":
+        fluff_remover = detector.tools["FluffRemover"]()
+        document = load_pdf_document(pdf_path)
+        # Running headers and footers are stripped before the paragraphs are scored
+        full_text = document.clean_full_text
+        review = fluff_remover._review_with_ollama if mode == "hybrid" else None
+        fluff_result = fluff_remover.remove_fluff(full_text, detected_frameworks, review=review)
+        stats = {**fluff_result["stats"], "boilerplate": document.boilerplate_stats()}
+        logger.info(f"⏱️  Fluff removal time: {stats['seconds']:.2f} seconds")
+        logger.info(f"🎯 Frameworks preserved: {detected_frameworks}")
+        detector.save_agent_output_to_md("fluff_remover", "remove_report_fluff", fluff_result["text"], pdf_path)
+        return {"cleaned_content": fluff_result["text"], "method": mode, "stats": stats, "seconds": stats["seconds"]}
     
-    # --- Step 2: Framework-Aware Fluff Removal (Ollama) ---
-    logger.info("\n🧹 Step 2: Framework-Aware Fluff Removal (Ollama)")
-    logger.info("-" * 40)
+    from crewai import Crew, Process
     
     # First, extract full text from PDF
     pdf_reader = detector.tools["FullPDFReader"]()
@@ -463,9 +514,88 @@ def run_enhanced_greenwashing_workflow(pdf_path: str) -> str:
     detector.save_agent_output_to_md("fluff_remover", "remove_report_fluff", fluff_result, pdf_path)
     
     # Extract cleaned content
-    cleaned_content = str(fluff_result)
-    if hasattr(fluff_result, 'raw'):
-        cleaned_content = str(fluff_result.raw)
+    return {"cleaned_content": result_text(fluff_result), "method": "llm", "seconds": fluff_time}
+
+@with_shared_pdf_document
+def run_enhanced_greenwashing_workflow(pdf_path: str, workers: Optional[int] = None,
+                                       run_dir: Optional[str] = None, resume: bool = True) -> str:
+    """
+    Run the enhanced greenwashing detection workflow with fluff remover and ChatGPT chunking.
+    
+    Workflow:
+    1. Framework Detection (Ollama) - Identify ESG frameworks
+    2. Fluff Removal (local, optional Ollama review) - Remove unnecessary content
+    3. ChatGPT Chunking - Process cleaned content for ChatGPT
+    4. ESG Analysis (ChatGPT) - Extract claims from cleaned content
+    5. Claims Validation (ChatGPT) - Validate claims for greenwashing
+    
+    Every stage and chunk result is checkpointed to the run directory, so a rerun after
+    a failure skips completed stages and chunks (see RunCheckpoint).
+    
+    Args:
+        pdf_path: Path to the PDF file to analyze
+        workers: Concurrent chunk analyses in step 4 (env ANALYSIS_WORKERS, default 4; 1 = serial)
+        run_dir: Checkpoint directory (default: runs/<report name>-<content hash>)
+        resume: Reuse checkpointed stages from an earlier run of the same report
+        
+    Returns:
+        Analysis results as a string
+    """
+    workers = workers or default_analysis_workers()
+    
+    logger.info("🚀 Starting Enhanced Greenwashing Detection Workflow")
+    logger.info(f"📄 Analyzing PDF: {pdf_path}")
+    logger.info("=" * 60)
+    
+    detector = GreenwashingDetector()
+    checkpoint = RunCheckpoint(pdf_path, run_dir, template_version=detector.prompt_template_version, resume=resume)
+    logger.info(f"💾 Checkpoints: {checkpoint.run_dir}")
+    
+    # --- Step 1: Framework Detection (Ollama) ---
+    logger.info("🔍 Step 1: Framework Detection (Ollama)")
+    logger.info("-" * 40)
+    
+    framework_stage = checkpoint.load("framework_detection")
+    if framework_stage is None:
+        framework_stage = detect_frameworks_stage(detector, pdf_path)
+        checkpoint.save("framework_detection", framework_stage, framework_stage["seconds"])
+    framework_result = framework_stage["framework_result"]
+    # Checkpoints written before the typed result was stored are parsed from the text
+    if "detection" in framework_stage:
+        detection = FrameworkDetectionResult.model_validate(framework_stage["detection"])
+    else:
+        detection = FrameworkDetectionResult.from_llm_output(framework_result)
+    detector.framework_detection = detection
+    detected_frameworks = detection.framework_names
+    framework_time = framework_stage["seconds"]
+    logger.info(f"🎯 Detected frameworks for fluff remover ({framework_stage.get('method', 'llm')}): "
+                f"{detected_frameworks}")
+    
+    # Store framework result for TCFD routing logic
+    detector.last_framework_result = framework_result
+    
+    # Check if TCFD is a major framework and determine analysis route
+    tcfd_is_major = detector.is_tcfd_major_framework(detected_frameworks)
+    tcfd_analysis_route = detector.get_tcfd_analysis_route(detected_frameworks)
+    
+    if tcfd_is_major:
+        logger.info(f"🎯 TCFD detected as major framework - Analysis route: {tcfd_analysis_route}")
+    else:
+        logger.info("📋 TCFD not detected as major framework - Using standard analysis")
+    
+    # --- Step 2: Framework-Aware Fluff Removal ---
+    logger.info("\n🧹 Step 2: Framework-Aware Fluff Removal")
+    logger.info("-" * 40)
+    
+    # Cleaned content depends on the frameworks it preserves and the knowledge base vocabulary
+    frameworks_hash = text_hash(os.getenv("FLUFF_REMOVAL_MODE", "local").lower() + ":" + ",".join(detected_frameworks)
+                                + ":kb" + knowledge_base().version)
+    fluff_stage = checkpoint.load("fluff_removal", frameworks_hash)
+    if fluff_stage is None:
+        fluff_stage = remove_fluff_stage(detector, pdf_path, detected_frameworks)
+        checkpoint.save("fluff_removal", fluff_stage, fluff_stage["seconds"], frameworks_hash)
+    cleaned_content = fluff_stage["cleaned_content"]
+    fluff_time = fluff_stage["seconds"]
     
     logger.info(f"📄 Cleaned content: {len(cleaned_content)} characters")
     
@@ -474,26 +604,53 @@ def run_enhanced_greenwashing_workflow(pdf_path: str) -> str:
     logger.info("-" * 40)
     
     # Process cleaned content for ChatGPT - get all chunks
-    all_chunks = detector.process_all_chunks_for_chatgpt(cleaned_content)
+    all_chunks = checkpoint.stage(
+        "chatgpt_chunks",
+        lambda: {"chunks": detector.process_all_chunks_for_chatgpt(
+            detector.deduplicate_for_stage(cleaned_content, "chatgpt", pdf_path))},
+        # Chunks depend on the near-duplicate setting as well as the cleaned content
+        input_hash=text_hash(f"{stage_max_distance('chatgpt')}:{cleaned_content}")
+    )["chunks"]
     logger.info(f"✅ Created {len(all_chunks)} chunks for ChatGPT processing")
     
     # --- Step 4: ESG Analysis and Claims Validation (ChatGPT) ---
     logger.info("\n🔍 Step 4: ESG Analysis and Claims Validation (ChatGPT)")
     logger.info("-" * 40)
     
-    # Process each chunk separately to avoid token limits
-    all_results = []
+    # Process chunks concurrently; results keep chunk order
+    chatgpt_provider = provider_for_llm(detector.agents_config['esg_analyst'].get('llm'))
+    logger.info(f"⚡ Analysis workers: {workers} (provider: {chatgpt_provider})")
+    chatgpt_start_time = time.time()
+    
+    def validate_sub_chunk(j: int, validation_chunk: str, chunk_num: int, total: int) -> str:
+        logger.info(f"🔍 Processing validation sub-chunk {j} of {total} (chunk {chunk_num})")
+        
+        start_time = time.time()
+        validation_inputs = {
+            "esg_analyst_output": validation_chunk
+        }
+        
+        def run_validation() -> dict:
+            with detector.pooled_crew("claims_validation") as validation_crew:
+                return {"result": result_text(kickoff_crew(validation_crew, validation_inputs, chatgpt_provider,
+                                                           copy=False))}
+        
+        sub_validation_result = checkpoint.stage(f"chunk_{chunk_num:03d}_validation_{j:02d}", run_validation,
+                                                 input_hash=text_hash(validation_chunk))["result"]
+        sub_validation_time = time.time() - start_time
+        
+        logger.info(f"✅ Validation sub-chunk {j} of chunk {chunk_num} completed in {sub_validation_time:.2f} seconds")
+        
+        # Add sub-chunk information to result
+        return f"### Validation Sub-Chunk {j} of {total}\n\n{sub_validation_result}"
     
-    for i, chunk in enumerate(all_chunks, 1):
+    def analyze_chunk(i: int, chunk: str) -> str:
         logger.info(f"📄 Processing chunk {i} of {len(all_chunks)}")
         
         # Use TCFD routing logic if TCFD is a major framework
         if tcfd_is_major:
             logger.info(f"🎯 Using TCFD specialized analysis route: {tcfd_analysis_route}")
             
-            # Create TCFD specialized crew
-            tcfd_crew = detector.create_tcfd_specialized_crew(tcfd_analysis_route)
-            
             start_time = time.time()
             tcfd_inputs = {
                 "file_path": pdf_path,
@@ -501,96 +658,80 @@ def run_enhanced_greenwashing_workflow(pdf_path: str) -> str:
                 "claims_content": chunk
             }
             
-            chunk_result = tcfd_crew.kickoff(inputs=tcfd_inputs)
+            # TCFD specialized crew, built once per run and reused across chunks
+            def run_tcfd() -> dict:
+                with detector.pooled_crew(tcfd_analysis_route) as tcfd_crew:
+                    return {"result": result_text(kickoff_crew(tcfd_crew, tcfd_inputs, chatgpt_provider, copy=False))}
+            
+            chunk_result = checkpoint.stage(f"chunk_{i:03d}_tcfd", run_tcfd, input_hash=text_hash(chunk))["result"]
             chunk_time = time.time() - start_time
             
             logger.info(f"✅ TCFD chunk {i} completed in {chunk_time:.2f} seconds")
-            
-        else:
-            # Use standard analysis for non-TCFD reports
-            logger.info("📋 Using standard analysis approach")
-            
-            # First, run ESG claims extraction
-            esg_crew = Crew(
-                agents=[detector.esg_analyst()],
-                tasks=[detector.extract_esg_claims()],
-                process=Process.sequential,
-                verbose=True
-            )
-            
-            start_time = time.time()
-            esg_inputs = {
-                "file_path": pdf_path,
-                "esg_content": chunk
-            }
-            
-            esg_result = esg_crew.kickoff(inputs=esg_inputs)
-            esg_time = time.time() - start_time
-            
-            logger.info(f"✅ ESG analysis chunk {i} completed in {esg_time:.2f} seconds")
-            
-            # Then, run claims validation with ESG results
-            validation_crew = Crew(
-                agents=[detector.compliance_checker()],
-                tasks=[detector.validate_claims()],
-                process=Process.sequential,
-                verbose=True
-            )
-            
-            # Convert ESG result to string and chunk it for validation
-            esg_output_str = str(esg_result)
-            if hasattr(esg_result, 'raw'):
-                esg_output_str = str(esg_result.raw)
-            
-            # Chunk the ESG output for validation to avoid token limits
-            logger.info(f"🔄 Chunking ESG output for validation (chunk {i})...")
-            validation_chunks = detector.chunk_esg_output_for_validation(esg_output_str)
-            logger.info(f"✅ Created {len(validation_chunks)} validation chunks for chunk {i}")
-            
-            # Process each validation chunk separately
-            all_chunk_validation_results = []
-            
-            for j, validation_chunk in enumerate(validation_chunks, 1):
-                logger.info(f"🔍 Processing validation sub-chunk {j} of {len(validation_chunks)}")
-                
-                validation_inputs = {
-                    "esg_analyst_output": validation_chunk
-                }
-                
-                sub_validation_result = validation_crew.kickoff(inputs=validation_inputs)
-                sub_validation_time = time.time() - start_time
-                
-                logger.info(f"✅ Validation sub-chunk {j} completed in {sub_validation_time:.2f} seconds")
-                
-                # Add sub-chunk information to result
-                sub_result_with_info = f"### Validation Sub-Chunk {j} of {len(validation_chunks)}\n\n"
-                sub_result_with_info += str(sub_validation_result)
-                
-                all_chunk_validation_results.append(sub_result_with_info)
-            
-            # Combine all validation results for this chunk
-            validation_result = f"## Claims Validation Results\n\n"
-            for j, result in enumerate(all_chunk_validation_results, 1):
-                validation_result += result
-                validation_result += "\n\n" + "-"*30 + "\n\n"
-            
-            validation_time = time.time() - start_time
-            
-            logger.info(f"✅ Claims validation chunk {i} completed in {validation_time:.2f} seconds")
-            
-            # Combine ESG and validation results
-            chunk_result = f"## ESG Analysis\n{esg_result}\n\n## Claims Validation\n{validation_result}"
+            return chunk_result
+        
+        # Use standard analysis for non-TCFD reports
+        logger.info("📋 Using standard analysis approach")
+        
+        # First, run ESG claims extraction
+        start_time = time.time()
+        esg_inputs = {
+            "file_path": pdf_path,
+            "esg_content": chunk
+        }
+        
+        def run_esg() -> dict:
+            with detector.pooled_crew("esg_analysis") as esg_crew:
+                return {"result": result_text(kickoff_crew(esg_crew, esg_inputs, chatgpt_provider, copy=False))}
+        
+        esg_result = checkpoint.stage(f"chunk_{i:03d}_esg", run_esg, input_hash=text_hash(chunk))["result"]
+        esg_time = time.time() - start_time
+        
+        logger.info(f"✅ ESG analysis chunk {i} completed in {esg_time:.2f} seconds")
         
-        all_results.append(chunk_result)
+        # Then, run claims validation with ESG results
+        # ESG result is already plain text; chunk it for validation
+        esg_output_str = esg_result
+        
+        # Chunk the ESG output for validation to avoid token limits
+        logger.info(f"🔄 Chunking ESG output for validation (chunk {i})...")
+        validation_chunks = detector.chunk_esg_output_for_validation(esg_output_str)
+        logger.info(f"✅ Created {len(validation_chunks)} validation chunks for chunk {i}")
+        
+        # Sub-chunks run one after another inside this chunk's worker; chunks themselves
+        # already run concurrently, and nesting pools would start up to workers² threads
+        all_chunk_validation_results = [
+            validate_sub_chunk(j, validation_chunk, i, len(validation_chunks))
+            for j, validation_chunk in enumerate(validation_chunks, 1)
+        ]
+        
+        # Combine all validation results for this chunk
+        validation_result = f"## Claims Validation Results\n\n"
+        for j, result in enumerate(all_chunk_validation_results, 1):
+            validation_result += result
+            validation_result += "\n\n" + "-"*30 + "\n\n"
+        
+        validation_time = time.time() - start_time
+        
+        logger.info(f"✅ Claims validation chunk {i} completed in {validation_time:.2f} seconds")
+        
+        # Combine ESG and validation results
+        return f"## ESG Analysis\n{esg_result}\n\n## Claims Validation\n{validation_result}"
+    
+    all_results = map_in_order(analyze_chunk, all_chunks, workers, label="ChatGPT chunks")
     
     # Combine all chunk results
     combined_chatgpt_result = f"# Analysis Results from {len(all_chunks)} Chunks\n\n"
     for i, result in enumerate(all_results, 1):
         combined_chatgpt_result += f"## Chunk {i} Results\n\n"
-        combined_chatgpt_result += result
+        combined_chatgpt_result += str(result)
         combined_chatgpt_result += "\n\n" + "="*50 + "\n\n"
     
-    chatgpt_time = sum([time.time() - start_time for _ in all_results])  # Approximate total time
+    chatgpt_time = time.time() - chatgpt_start_time
+    logger.info(f"⏱️  ChatGPT analysis of {len(all_chunks)} chunks: {chatgpt_time:.2f} seconds wall time")
+    detector.log_crew_pool_stats()
+    log_prompt_metrics()
+    if checkpoint.resumed_stages:
+        logger.info(f"⏭️ {checkpoint.resumed_stages} stages restored from {checkpoint.run_dir}")
     
     total_time = framework_time + fluff_time + chatgpt_time
     
@@ -612,7 +753,7 @@ def run_enhanced_greenwashing_workflow(pdf_path: str) -> str:
         detector.save_agent_output_to_md("compliance_checker", "validate_claims", combined_chatgpt_result, pdf_path)
     
     # Save enhanced workflow summary
-    detector.save_enhanced_workflow_summary_to_md(framework_result, fluff_result, combined_chatgpt_result, pdf_path, total_time)
+    detector.save_enhanced_workflow_summary_to_md(framework_result, cleaned_content, combined_chatgpt_result, pdf_path, total_time)
     
     # Return combined results
     combined_result = f"""
@@ -621,7 +762,7 @@ def run_enhanced_greenwashing_workflow(pdf_path: str) -> str:
 ## Framework Detection (Ollama)
 {framework_result}
 
-## Fluff Removal (Ollama)
+## Fluff Removal
 Content cleaned and prepared for ChatGPT analysis.
 
 ## ESG Analysis and Claims Validation (ChatGPT)
@@ -637,8 +778,8 @@ Content cleaned and prepared for ChatGPT analysis.
     return combined_result
 
 if __name__ == "__main__":
-    # Example usage
-    pdf_file = "uploaded_reports/sustainability_report.pdf"
+    # Example usage; for many reports use `batch <directory or manifest>` (greenwashing_detector.batch)
+    pdf_file = sys.argv[1] if len(sys.argv) > 1 else "uploaded_reports/sustainability_report.pdf"
     
     # Run framework detection with enhanced monitoring
     result = run_framework_detection_with_monitoring(pdf_file)
@@ -5,6 +5,7 @@ from .framework_glossary import FrameworkGlossaryTool
 from .section_extractor import RelevantSectionExtractor
 from .tcfd_analyzer import TCFDAnalyzerTool
 from .gri_analyzer import GRIAnalyzerTool
+from .framework_detector import RuleBasedFrameworkDetector
 
 __all__ = [
     'PDFReportReader', 
@@ -16,5 +17,6 @@ __all__ = [
     'FrameworkGlossaryTool',
     'RelevantSectionExtractor',
     'TCFDAnalyzerTool',
-    'GRIAnalyzerTool'
+    'GRIAnalyzerTool',
+    'RuleBasedFrameworkDetector'
 ]
@@ -0,0 +1,174 @@
+# src/greenwashing_detector/tools/boilerplate.py
+
+import os
+import re
+import hashlib
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from .tokenizer import get_tokenizer
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# A line is boilerplate when it recurs on at least this share of the pages...
+DEFAULT_MIN_PAGE_RATIO = 0.3
+
+# ...and on at least this many pages
+DEFAULT_MIN_PAGES = 3
+
+# Longer lines are body text even when repeated (e.g. a quote reused across chapters)
+MAX_BOILERPLATE_LINE_CHARS = 200
+
+# Lines this close to the top or bottom of a page are header/footer candidates, matched with numbers masked
+EDGE_LINES = 3
+
+# Longer documents are fitted on this many evenly spread pages, so streaming consumers
+# do not have to extract every page before the first one is stripped
+DEFAULT_SAMPLE_PAGES = 60
+
+_DIGITS = re.compile(r'\d+')
+_WHITESPACE = re.compile(r'\s+')
+
+def default_min_page_ratio() -> float:
+    """Share of pages a line must recur on to be boilerplate, overridable with BOILERPLATE_MIN_PAGE_RATIO."""
+    configured = os.getenv("BOILERPLATE_MIN_PAGE_RATIO")
+    if configured:
+        try:
+            return min(1.0, max(0.0, float(configured)))
+        except ValueError:
+            logger.warning(f"⚠️ Invalid BOILERPLATE_MIN_PAGE_RATIO value: {configured}")
+    return DEFAULT_MIN_PAGE_RATIO
+
+def sample_page_numbers(page_count: int, max_pages: int = DEFAULT_SAMPLE_PAGES) -> List[int]:
+    """Evenly spread 0-based page numbers including the first and last page, or every page of shorter documents."""
+    if page_count <= max_pages:
+        return list(range(page_count))
+    step = (page_count - 1) / (max_pages - 1)
+    return sorted({round(i * step) for i in range(max_pages)})
+
+def normalize_line(line: str, mask_numbers: bool = False) -> str:
+    """Normalize a line for repetition matching: case and whitespace are ignored, and numbers when masked."""
+    line = line.lower()
+    if mask_numbers:
+        line = _DIGITS.sub('#', line)
+    return _WHITESPACE.sub(' ', line).strip()
+
+def line_key(line: str, mask_numbers: bool = False) -> str:
+    """Hash of a normalized line."""
+    return hashlib.blake2b(normalize_line(line, mask_numbers).encode("utf-8"), digest_size=8).hexdigest()
+
+class BoilerplateDetector:
+    """
+    Finds running headers, footers, disclaimers and page furniture repeated across pages.
+
+    Every line of every page is normalized and hashed, each hash is counted once per
+    page, and the lines recurring on many pages are stripped from page text before it
+    is chunked, so the same furniture is not sent to the LLMs with every chunk. Lines
+    at the top and bottom of a page are also matched with numbers masked, which
+    catches page numbers and "Report 2023 | 12" style running footers without
+    touching body lines (e.g. table rows) that only differ in their figures.
+    """
+
+    def __init__(self, min_page_ratio: Optional[float] = None, min_pages: int = DEFAULT_MIN_PAGES,
+                 max_line_chars: int = MAX_BOILERPLATE_LINE_CHARS, sample_pages: int = DEFAULT_SAMPLE_PAGES):
+        """
+        Args:
+            min_page_ratio: Share of pages a line must recur on (default: BOILERPLATE_MIN_PAGE_RATIO or 0.3)
+            min_pages: Minimum number of pages a line must recur on
+            max_line_chars: Longer lines are never treated as boilerplate
+            sample_pages: Number of pages a document is fitted on (see sample_page_numbers)
+        """
+        self.min_page_ratio = min_page_ratio if min_page_ratio is not None else default_min_page_ratio()
+        self.min_pages = min_pages
+        self.max_line_chars = max_line_chars
+        self.sample_pages = sample_pages
+        self.keys: Set[str] = set()
+        self.edge_keys: Set[str] = set()
+
+    @property
+    def params(self) -> Dict[str, Any]:
+        return {"min_page_ratio": self.min_page_ratio, "min_pages": self.min_pages,
+                "max_line_chars": self.max_line_chars, "sample_pages": self.sample_pages}
+
+    def fit(self, page_texts: Iterable[str]) -> Set[str]:
+        """
+        Learn the repeated lines of a document.
+
+        Args:
+            page_texts: Text of every page, or of a sample of pages, in any order
+
+        Returns:
+            Hashes of the lines recurring on enough pages
+        """
+        page_counts: Dict[str, int] = {}
+        edge_counts: Dict[str, int] = {}
+        pages = 0
+        for text in page_texts:
+            pages += 1
+            lines = self._candidate_lines(text)
+            for key in {line_key(line) for _, line in lines}:
+                page_counts[key] = page_counts.get(key, 0) + 1
+            for key in {line_key(line, mask_numbers=True) for _, line in self._edge_lines(lines)}:
+                edge_counts[key] = edge_counts.get(key, 0) + 1
+
+        threshold = max(self.min_pages, self.min_page_ratio * pages)
+        self.keys = {key for key, count in page_counts.items() if count >= threshold}
+        self.edge_keys = {key for key, count in edge_counts.items() if count >= threshold}
+        return self.keys | self.edge_keys
+
+    def _candidate_lines(self, text: str) -> List[Tuple[int, str]]:
+        """(line index, stripped line) of the non-empty lines short enough to be boilerplate."""
+        return [(index, line.strip()) for index, line in enumerate(text.split('\n'))
+                if line.strip() and len(line.strip()) <= self.max_line_chars]
+
+    @staticmethod
+    def _edge_lines(lines: List[Tuple[int, str]]) -> List[Tuple[int, str]]:
+        return lines[:EDGE_LINES] + lines[EDGE_LINES:][-EDGE_LINES:]
+
+    def strip(self, text: str) -> Tuple[str, List[str]]:
+        """
+        Remove the repeated lines from a page.
+
+        Returns:
+            (page text without boilerplate lines, removed lines)
+        """
+        if not self.keys and not self.edge_keys:
+            return text, []
+        lines = self._candidate_lines(text)
+        edges = {index for index, _ in self._edge_lines(lines)}
+        drop = {index for index, line in lines
+                if line_key(line) in self.keys
+                or (index in edges and line_key(line, mask_numbers=True) in self.edge_keys)}
+        if not drop:
+            return text, []
+        all_lines = text.split('\n')
+        kept = [line for index, line in enumerate(all_lines) if index not in drop]
+        return "\n".join(kept), [all_lines[index].strip() for index in sorted(drop)]
+
+    def strip_pages(self, page_texts: List[str], model: Optional[str] = None) -> Tuple[List[str], Dict[str, int]]:
+        """
+        Remove the repeated lines from every page and measure what was removed.
+
+        Args:
+            page_texts: Page texts the detector was fitted on
+            model: Model whose tokenizer counts the removed tokens
+
+        Returns:
+            (cleaned page texts, stats with `pages`, `repeated_lines`, `lines_removed`,
+            `chars_removed` and `tokens_removed`)
+        """
+        cleaned, removed = [], []
+        for text in page_texts:
+            page, lines = self.strip(text)
+            cleaned.append(page)
+            removed.extend(lines)
+        stats = {
+            "pages": len(page_texts),
+            "repeated_lines": len(self.keys) + len(self.edge_keys),
+            "lines_removed": len(removed),
+            # Each removed line also took its newline
+            "chars_removed": sum(len(line) + 1 for line in removed),
+            "tokens_removed": get_tokenizer(model).count("\n".join(removed)) if removed else 0
+        }
+        return cleaned, stats
@@ -0,0 +1,136 @@
+# src/greenwashing_detector/tools/chunking.py
+
+import os
+import re
+import logging
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, Optional, Pattern
+from .tokenizer import Tokenizer, context_window, get_tokenizer
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_MODEL = "gpt-3.5-turbo-0125"
+
+# Share of the model's context window filled by chunk text; the rest is left for
+# task instructions, agent backstory and the model's answer
+DEFAULT_FILL_RATIO = 0.3
+
+# How far back from the token budget to look for a sentence end
+SENTENCE_BREAK_WINDOW_TOKENS = 40
+
+# A sentence ends at ., ! or ? followed by whitespace or the end of the text (not "12.5")
+SENTENCE_END = re.compile(r'[.!?](?=\s|$)')
+
+# Markdown level-2 headers, used to keep agent output sections together
+MARKDOWN_SECTION = re.compile(r'^## ', re.MULTILINE)
+
+def sentence_boundaries(text: str) -> List[int]:
+    """Return the character offsets just after every sentence end, in one regex pass."""
+    return [match.end() for match in SENTENCE_END.finditer(text)]
+
+def section_boundaries(text: str, pattern: Pattern = MARKDOWN_SECTION) -> List[int]:
+    """Return the character offsets at which sections matching `pattern` start."""
+    return [match.start() for match in pattern.finditer(text)]
+
+class TokenChunker:
+    """
+    Splits text into chunks measured in real tokens for a target model.
+
+    Chunks are packed up to `max_tokens` tokens (by default a fill ratio of the
+    model's context window), end on a sentence boundary where one is close to the
+    budget, and overlap by `overlap_tokens`. Each chunk is returned with its token
+    count and character span.
+    """
+
+    def __init__(self, model: str = DEFAULT_CHUNK_MODEL, max_tokens: Optional[int] = None,
+                 fill_ratio: Optional[float] = None, overlap_tokens: int = 0,
+                 tokenizer: Optional[Tokenizer] = None):
+        """
+        Args:
+            model: Model the chunks are sent to (sets the tokenizer and context window)
+            max_tokens: Token budget per chunk; overrides the fill ratio
+            fill_ratio: Share of the context window per chunk (env CHUNK_FILL_RATIO, default 0.3)
+            overlap_tokens: Tokens repeated at the start of the next chunk
+            tokenizer: Tokenizer to use instead of the model's default
+        """
+        self.model = model
+        self.tokenizer = tokenizer or get_tokenizer(model)
+        self.context_window = context_window(model)
+        self.fill_ratio = fill_ratio or float(os.getenv("CHUNK_FILL_RATIO", DEFAULT_FILL_RATIO))
+        self.max_tokens = max(1, max_tokens or int(self.context_window * self.fill_ratio))
+        self.overlap_tokens = max(0, min(overlap_tokens, self.max_tokens // 2))
+
+    def count_tokens(self, text: str) -> int:
+        """Return the number of tokens in a text for this chunker's model."""
+        return self.tokenizer.count(text)
+
+    def _last_boundary(self, boundaries: List[int], offsets: List[int], start_token: int,
+                       end_token: int, min_char: int) -> Optional[int]:
+        """Return the token index of the last boundary in (min_char, end of chunk], found by bisection."""
+        position = bisect_right(boundaries, offsets[end_token]) - 1
+        if position < 0 or boundaries[position] <= min_char:
+            return None
+        cut = bisect_left(offsets, boundaries[position], start_token + 1, end_token)
+        return cut if cut > start_token else None
+
+    def chunk(self, text: str, section_pattern: Optional[Pattern] = None) -> List[Dict[str, Any]]:
+        """
+        Split a text into token-bounded chunks.
+
+        Token offsets, sentence ends and (optionally) section starts are computed once
+        for the whole text; each chunk end is then placed by bisection over them, so
+        the cost is linear in the text length. A chunk ends at the last section start
+        within its budget if there is one, otherwise at a sentence end close to the
+        budget, otherwise exactly at the budget.
+
+        Args:
+            text: Text to split
+            section_pattern: Optional regex for section starts to keep sections together
+
+        Returns:
+            List of chunk records with `index` (1-based), `text`, `tokens`, `start` and `end`
+        """
+        offsets = self.tokenizer.token_offsets(text)
+        sentences = sentence_boundaries(text)
+        sections = section_boundaries(text, section_pattern) if section_pattern is not None else []
+        total_tokens = len(offsets)
+        chunks = []
+        start_token = 0
+        previous_end_token = 0
+
+        while start_token < total_tokens:
+            end_token = min(start_token + self.max_tokens, total_tokens)
+            if end_token < total_tokens:
+                window_char = offsets[max(start_token + 1, end_token - SENTENCE_BREAK_WINDOW_TOKENS)] - 1
+                cut = None
+                if sections:
+                    # Only section starts past the overlap, or the chunk would be the overlap alone
+                    floor_char = offsets[min(max(previous_end_token, start_token), end_token - 1)]
+                    cut = self._last_boundary(sections, offsets, start_token, end_token, floor_char)
+                if cut is None:
+                    cut = self._last_boundary(sentences, offsets, start_token, end_token, window_char)
+                end_token = cut or end_token
+
+            start = 0 if start_token == 0 else offsets[start_token]
+            end = offsets[end_token] if end_token < total_tokens else len(text)
+            chunks.append({
+                "index": len(chunks) + 1,
+                "text": text[start:end],
+                "tokens": end_token - start_token,
+                "start": start,
+                "end": end
+            })
+
+            if end_token >= total_tokens:
+                break
+            previous_end_token = end_token
+            start_token = max(end_token - self.overlap_tokens, start_token + 1)
+
+        return chunks
+
+    def describe(self) -> str:
+        """Short description of the chunk budget for log messages."""
+        return (f"{self.max_tokens:,} tokens per chunk ({self.max_tokens / self.context_window:.0%} of "
+                f"{self.model}'s {self.context_window:,}-token window, {self.tokenizer.name} tokenizer)")
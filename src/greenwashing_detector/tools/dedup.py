@@ -0,0 +1,257 @@
+# src/greenwashing_detector/tools/dedup.py
+
+import os
+import re
+import hashlib
+import logging
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional, Tuple
+from .fluff_remover import PARAGRAPH_MIN_CHARS
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_BITS = 64
+
+# Paragraphs whose SimHash fingerprints differ in at most this many bits are near-duplicates
+# (a one-word edit in a 30-word paragraph moves the fingerprint by about 5 bits)
+DEFAULT_MAX_DISTANCE = 6
+
+# Shorter paragraphs (headings, table labels) are never deduplicated
+MIN_DEDUP_CHARS = 80
+
+SHINGLE_WORDS = 3
+
+# Maximum fingerprint distance per LLM stage; None leaves the stage's text as it is.
+# Override with NEAR_DUPLICATE_<STAGE> (a distance, or "off").
+STAGE_MAX_DISTANCE: Dict[str, Optional[int]] = {
+    "esg_analysis": DEFAULT_MAX_DISTANCE,
+    "claims": DEFAULT_MAX_DISTANCE,
+    "chatgpt": DEFAULT_MAX_DISTANCE
+}
+
+# Page headers written by the chunkers, e.g. "=== KEYWORD MATCH: Page 12 (3 framework keywords) ==="
+PAGE_MARKER = re.compile(r'^===.*?\bPage (\d+)\b.*===\s*$', re.MULTILINE)
+
+_SENTENCE_END = re.compile(r'[.!?]["”\')]?\s*$')
+_WORD = re.compile(r'\w+')
+_NUMBER = re.compile(r'\d+(?:[.,]\d+)*')
+
+def stage_max_distance(stage: str) -> Optional[int]:
+    """Near-duplicate distance configured for a stage, or None if deduplication is off for it."""
+    configured = os.getenv(f"NEAR_DUPLICATE_{stage.upper()}")
+    if configured is None:
+        return STAGE_MAX_DISTANCE.get(stage)
+    if configured.lower() in ("off", "false", "no", "none"):
+        return None
+    try:
+        return max(0, min(FINGERPRINT_BITS // 2, int(configured)))
+    except ValueError:
+        logger.warning(f"⚠️ Invalid NEAR_DUPLICATE_{stage.upper()} value: {configured}")
+        return STAGE_MAX_DISTANCE.get(stage)
+
+def paragraph_spans(text: str, min_chars: int = PARAGRAPH_MIN_CHARS) -> List[Tuple[int, int]]:
+    """
+    Locate the paragraphs of a text without altering or filtering any line.
+
+    A paragraph ends at a blank line, or at a line closing a sentence once it has
+    min_chars characters (PDF text rarely has blank lines between paragraphs).
+
+    Returns:
+        (start, end) offsets of each paragraph, excluding the line break that ends it
+    """
+    spans = []
+    start = None
+    offset = 0
+    for line in text.split('\n'):
+        line_end = offset + len(line)
+        if not line.strip():
+            if start is not None:
+                spans.append((start, offset - 1))
+                start = None
+        else:
+            if start is None:
+                start = offset
+            if line_end - start >= min_chars and _SENTENCE_END.search(line):
+                spans.append((start, line_end))
+                start = None
+        offset = line_end + 1
+    if start is not None:
+        spans.append((start, len(text)))
+    return spans
+
+def simhash(text: str) -> int:
+    """
+    64-bit SimHash of a text over word shingles.
+
+    Case, punctuation and whitespace are ignored, so reflowed or lightly edited
+    copies of a paragraph get fingerprints a few bits apart.
+    """
+    words = _WORD.findall(text.lower())
+    if len(words) < SHINGLE_WORDS:
+        shingles = [" ".join(words)]
+    else:
+        shingles = [" ".join(words[i:i + SHINGLE_WORDS]) for i in range(len(words) - SHINGLE_WORDS + 1)]
+    bit_rows = [
+        format(int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big"), "064b")
+        for shingle in shingles
+    ]
+    # Transpose the bit strings so each bit position is counted in one pass
+    majority = len(bit_rows) / 2
+    return int("".join("1" if column.count("1") > majority else "0" for column in zip(*bit_rows)), 2)
+
+class NearDuplicateIndex:
+    """
+    Finds fingerprints within a Hamming distance of earlier ones without comparing all pairs.
+
+    Fingerprints are split into max_distance + 1 bands: two fingerprints at most
+    max_distance bits apart agree exactly on at least one band, so only entries
+    sharing a band are compared.
+    """
+
+    def __init__(self, max_distance: int = DEFAULT_MAX_DISTANCE):
+        self.max_distance = max_distance
+        bands = max_distance + 1
+        self._band_bits = FINGERPRINT_BITS // bands
+        self._bands = bands
+        self._buckets: Dict[Tuple[int, int], List[Tuple[int, Any]]] = {}
+
+    def _band_keys(self, fingerprint: int) -> List[Tuple[int, int]]:
+        mask = (1 << self._band_bits) - 1
+        keys = [(band, (fingerprint >> (band * self._band_bits)) & mask) for band in range(self._bands - 1)]
+        # The last band takes the remaining bits
+        keys.append((self._bands - 1, fingerprint >> ((self._bands - 1) * self._band_bits)))
+        return keys
+
+    def find(self, fingerprint: int) -> Optional[Any]:
+        """Return the item of the closest indexed fingerprint within max_distance, if any."""
+        best = None
+        for key in self._band_keys(fingerprint):
+            for other, item in self._buckets.get(key, ()):
+                distance = (fingerprint ^ other).bit_count()
+                if distance <= self.max_distance and (best is None or distance < best[0]):
+                    best = (distance, item)
+        return best[1] if best else None
+
+    def add(self, fingerprint: int, item: Any):
+        for key in self._band_keys(fingerprint):
+            self._buckets.setdefault(key, []).append((fingerprint, item))
+
+class PageLocator:
+    """Maps paragraphs back to the 1-based page they were taken from."""
+
+    def __init__(self, page_texts: List[str]):
+        self.text = "".join(text + "\n" for text in page_texts)
+        self._page_starts = []
+        offset = 0
+        for text in page_texts:
+            self._page_starts.append(offset)
+            offset += len(text) + 1
+        self._cursor = 0
+
+    def page_of(self, paragraph: str) -> Optional[int]:
+        """
+        Return the page of a paragraph's first line.
+
+        Paragraphs are expected roughly in document order, so the search continues
+        from the last match and only restarts from the beginning when needed.
+        """
+        first_line = paragraph.strip().split('\n', 1)[0].strip()
+        if not first_line:
+            return None
+        position = self.text.find(first_line, self._cursor)
+        if position < 0:
+            position = self.text.find(first_line)
+        if position < 0:
+            return None
+        self._cursor = position + len(first_line)
+        return bisect_right(self._page_starts, position)
+
+def deduplicate_paragraphs(text: str, max_distance: int = DEFAULT_MAX_DISTANCE,
+                           locator: Optional[PageLocator] = None,
+                           min_chars: int = MIN_DEDUP_CHARS) -> Tuple[str, Dict[str, int]]:
+    """
+    Keep one canonical copy of every near-duplicate paragraph.
+
+    The first occurrence is kept where it is, followed by a back-reference to the
+    pages (or, without a page locator, the number of places) the paragraph is
+    repeated on; later copies are removed. Paragraphs only count as duplicates when
+    they state the same figures, so templated paragraphs with different data
+    (e.g. one per site or year) are all kept. Everything else is left byte for byte
+    as it was, so a text without duplicates is returned unchanged.
+
+    Args:
+        text: Text to deduplicate, e.g. the combined chunks sent to an LLM stage
+        max_distance: Maximum SimHash distance in bits between near-duplicates
+        locator: Optional PageLocator for page back-references
+        min_chars: Shorter paragraphs are always kept
+
+    Returns:
+        (deduplicated text, stats with `paragraphs`, `duplicates_removed` and `chars_removed`)
+    """
+    spans = paragraph_spans(text)
+    # One index per set of figures stated in the paragraph
+    indexes: Dict[Tuple[str, ...], NearDuplicateIndex] = {}
+    removed: set = set()
+    repeats: Dict[int, List[Optional[int]]] = {}
+    removed_chars = 0
+
+    for position, (start, end) in enumerate(spans):
+        paragraph = text[start:end]
+        page = locator.page_of(paragraph) if locator else None
+        if len(paragraph.strip()) < min_chars:
+            continue
+        fingerprint = simhash(paragraph)
+        index = indexes.setdefault(tuple(sorted(_NUMBER.findall(paragraph))), NearDuplicateIndex(max_distance))
+        canonical = index.find(fingerprint)
+        if canonical is None:
+            index.add(fingerprint, position)
+            repeats[position] = [page]
+        else:
+            repeats[canonical].append(page)
+            removed.add(position)
+            removed_chars += len(paragraph)
+
+    if not removed:
+        return text, {"paragraphs": len(spans), "duplicates_removed": 0, "chars_removed": 0}
+
+    # Each paragraph owns the separator text up to the next paragraph; removed ones drop both
+    output = [text[:spans[0][0]]]
+    for position, (start, end) in enumerate(spans):
+        if position in removed:
+            continue
+        following = spans[position + 1][0] if position + 1 < len(spans) else len(text)
+        output.append(text[start:end])
+        locations = repeats.get(position, [])
+        if len(locations) > 1:
+            pages = sorted({page for page in locations if page is not None})
+            if len(pages) > 1:
+                output.append(f"\n[Repeated on pages {', '.join(str(page) for page in pages)}]")
+            else:
+                output.append(f"\n[Repeated {len(locations)} times in the report]")
+        output.append(text[end:following])
+
+    stats = {"paragraphs": len(spans), "duplicates_removed": len(removed), "chars_removed": removed_chars}
+    return "".join(output), stats
+
+def trim_chunk_overlaps(chunks: List[str], max_overlap: int) -> List[str]:
+    """
+    Remove from each chunk the text it repeats from the end of the previous chunk.
+
+    Args:
+        chunks: Consecutive chunks produced with an overlap
+        max_overlap: The chunker's overlap in characters
+
+    Returns:
+        Chunks without their leading overlap
+    """
+    trimmed = chunks[:1]
+    for previous, chunk in zip(chunks, chunks[1:]):
+        overlap = 0
+        for size in range(min(max_overlap, len(previous), len(chunk)), 0, -1):
+            if previous.endswith(chunk[:size]):
+                overlap = size
+                break
+        trimmed.append(chunk[overlap:].lstrip())
+    return trimmed
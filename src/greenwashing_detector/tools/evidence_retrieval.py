@@ -0,0 +1,218 @@
+# src/greenwashing_detector/tools/evidence_retrieval.py
+
+import re
+import math
+import heapq
+import logging
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+from .dedup import PAGE_MARKER, paragraph_spans
+from .framework_glossary import GLOSSARY
+from .tokenizer import get_tokenizer
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Passages retrieved per TCFD pillar
+DEFAULT_TOP_K = 5
+
+# Token budget of the evidence sent with one pillar prompt
+MAX_EVIDENCE_TOKENS = 400
+
+# Consecutive paragraphs are grouped into passages of up to this many characters
+PASSAGE_CHARS = 600
+
+# BM25 term-frequency saturation and length normalisation
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+# The pillar question counts this much more than its disclosure criteria when ranking passages
+QUESTION_WEIGHT = 2.0
+
+STOPWORDS = frozenset(
+    "a an and are as at be been but by can could do does for from has have how if in into is it its "
+    "may more not of on or other our over should such than that the their them these they this those "
+    "to under was we were what whether which while who will with would e g i ie eg".split()
+)
+
+_TOKEN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without stopwords, with plurals folded (risks -> risk, opportunities -> opportunity)."""
+    tokens = []
+    for token in _TOKEN.findall(text.lower()):
+        token = token.split("'", 1)[0]
+        if token in STOPWORDS or len(token) < 2:
+            continue
+        if len(token) > 4 and token.endswith("ies"):
+            token = token[:-3] + "y"
+        elif len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+class BM25Index:
+    """
+    Okapi BM25 over a fixed set of passages.
+
+    Postings are built once; a query only touches the passages sharing a term with
+    it, so ranking the same passages for all eleven TCFD pillars stays cheap.
+    """
+
+    def __init__(self, documents: List[str], k1: float = BM25_K1, b: float = BM25_B):
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, List[Tuple[int, int]]] = {}
+        self.lengths: List[int] = []
+        for doc_id, text in enumerate(documents):
+            counts = Counter(tokenize(text))
+            self.lengths.append(sum(counts.values()))
+            for term, frequency in counts.items():
+                self.postings.setdefault(term, []).append((doc_id, frequency))
+        self.average_length = (sum(self.lengths) / len(self.lengths)) if self.lengths else 0.0
+        total = len(documents)
+        self.idf = {term: math.log(1 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+                    for term, postings in self.postings.items()}
+
+    def search(self, query: Dict[str, float], top_k: int) -> List[Tuple[int, float]]:
+        """
+        Rank documents for a weighted query.
+
+        Args:
+            query: Query terms (as produced by tokenize) and their weights
+            top_k: Number of documents to return
+
+        Returns:
+            (document index, score) of the best matching documents, best first
+        """
+        scores: Dict[int, float] = {}
+        for term, weight in query.items():
+            idf = self.idf.get(term)
+            if idf is None:
+                continue
+            for doc_id, frequency in self.postings[term]:
+                norm = 1 - self.b + self.b * self.lengths[doc_id] / (self.average_length or 1)
+                scores[doc_id] = scores.get(doc_id, 0.0) + \
+                    weight * idf * frequency * (self.k1 + 1) / (frequency + self.k1 * norm)
+        return heapq.nlargest(top_k, scores.items(), key=lambda item: item[1])
+
+_pillar_queries: Dict[str, Dict[str, float]] = {}
+
+def pillar_query(pillar: str) -> Dict[str, float]:
+    """
+    Weighted query terms of a TCFD pillar: its question and its disclosure criteria from the glossary.
+
+    Returns:
+        Term weights, empty for an unknown pillar
+    """
+    if pillar not in _pillar_queries:
+        tcfd = GLOSSARY.get("TCFD") or {}
+        question = tcfd.get("queries", {}).get(pillar, "")
+        assessment = tcfd.get("assessments", {}).get(pillar, "")
+        query: Dict[str, float] = {}
+        for term in tokenize(assessment):
+            query[term] = 1.0
+        for term in tokenize(question):
+            query[term] = QUESTION_WEIGHT
+        _pillar_queries[pillar] = query
+    return _pillar_queries[pillar]
+
+def build_passages(segments: List[Tuple[Optional[int], str]], max_chars: int = PASSAGE_CHARS) -> List[Dict[str, Any]]:
+    """
+    Group each segment's paragraphs into passages of up to max_chars, never across segments.
+
+    No line is filtered and line breaks are kept, so table figures (one cell per
+    line) stay in the passages the metrics pillars are answered from.
+
+    Args:
+        segments: (page number or None, text) pairs
+
+    Returns:
+        Passage records with `text` and `page`
+    """
+    passages = []
+    for page, text in segments:
+        current: List[str] = []
+        length = 0
+        for start, end in paragraph_spans(text):
+            paragraph = text[start:end].strip()
+            if current and length + len(paragraph) > max_chars:
+                passages.append({"text": "\n".join(current), "page": page})
+                current, length = [], 0
+            current.append(paragraph)
+            length += len(paragraph) + 1
+        if current:
+            passages.append({"text": "\n".join(current), "page": page})
+    return passages
+
+class TCFDEvidenceRetriever:
+    """
+    Picks the report passages relevant to each TCFD pillar before any LLM call.
+
+    The report is split into passages and indexed once with BM25; each pillar's
+    question and disclosure criteria then retrieve its top-k passages within a token
+    budget, so a pillar prompt carries a few hundred tokens of evidence instead of
+    whole chunks.
+    """
+
+    def __init__(self, passages: List[Dict[str, Any]]):
+        self.passages = passages
+        self.index = BM25Index([passage["text"] for passage in passages])
+
+    @classmethod
+    def from_text(cls, text: str) -> "TCFDEvidenceRetriever":
+        """Index report text, taking page numbers from the chunkers' "=== ... Page N ... ===" headers."""
+        segments: List[Tuple[Optional[int], str]] = []
+        page, start = None, 0
+        for match in PAGE_MARKER.finditer(text):
+            segments.append((page, text[start:match.start()]))
+            page, start = int(match.group(1)), match.end()
+        segments.append((page, text[start:]))
+        return cls(build_passages(segments))
+
+    @classmethod
+    def from_pages(cls, page_texts: List[str]) -> "TCFDEvidenceRetriever":
+        """Index a whole document from its page texts, with exact page numbers."""
+        return cls(build_passages([(number, text) for number, text in enumerate(page_texts, 1)]))
+
+    def evidence(self, pillar: str, top_k: int = DEFAULT_TOP_K, max_tokens: int = MAX_EVIDENCE_TOKENS,
+                 model: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Return the passages most relevant to a pillar, best first.
+
+        Args:
+            pillar: TCFD pillar (tcfd_1 through tcfd_11)
+            top_k: Maximum number of passages
+            max_tokens: Token budget; the best passage is always kept, later ones only if they fit
+            model: Model whose tokenizer counts the budget
+
+        Returns:
+            Passage records with `text`, `page`, `score` and `tokens`
+        """
+        tokenizer = get_tokenizer(model)
+        selected, used = [], 0
+        for doc_id, score in self.index.search(pillar_query(pillar), top_k):
+            passage = self.passages[doc_id]
+            tokens = tokenizer.count(passage["text"])
+            if selected and used + tokens > max_tokens:
+                continue
+            selected.append({**passage, "score": round(score, 3), "tokens": tokens})
+            used += tokens
+        return selected
+
+    def evidence_by_pillar(self, top_k: int = DEFAULT_TOP_K, max_tokens: int = MAX_EVIDENCE_TOKENS,
+                           model: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """Return the evidence of every TCFD pillar in the glossary."""
+        pillars = (GLOSSARY.get("TCFD") or {}).get("queries", {})
+        return {pillar: self.evidence(pillar, top_k, max_tokens, model) for pillar in pillars}
+
+def format_evidence(passages: List[Dict[str, Any]]) -> str:
+    """Render retrieved passages as quoted blocks with their page, for a prompt."""
+    if not passages:
+        return "No relevant passages found in the report content."
+    blocks = []
+    for passage in passages:
+        location = f"[Page {passage['page']}] " if passage.get("page") is not None else ""
+        blocks.append(f"> {location}{passage['text']}".replace("\n", "\n> "))
+    return "\n\n".join(blocks)
@@ -0,0 +1,192 @@
+# src/greenwashing_detector/tools/extraction_cache.py
+
+import os
+import sys
+import gzip
+import json
+import time
+import hashlib
+import argparse
+import logging
+from typing import Any, Dict, List, Optional
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Bump whenever page text, OCR, TOC or section detection output changes shape or content,
+# so stale entries from an older extractor are never served.
+EXTRACTOR_VERSION = "2"
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "greenwashing_detector", "extraction")
+DEFAULT_MAX_MB = 1024
+
+def file_content_hash(file_path: str) -> str:
+    """Return the SHA-256 of a file's content, read in 1 MiB blocks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+class ExtractionCache:
+    """
+    On-disk cache of extraction results keyed by PDF content hash and extractor version.
+
+    Each entry is a gzip-compressed JSON document holding the per-page text, OCR output
+    (per OCR settings), embedded outline, detected TOC entries and framework sections of
+    one report. Entries are evicted least-recently-used first once the cache grows past
+    its size limit.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: Optional[int] = None):
+        self.cache_dir = cache_dir or os.getenv("EXTRACTION_CACHE_DIR", DEFAULT_CACHE_DIR)
+        if max_bytes is None:
+            max_bytes = int(float(os.getenv("EXTRACTION_CACHE_MAX_MB", DEFAULT_MAX_MB)) * 1024 * 1024)
+        self.max_bytes = max_bytes
+
+    def key_for(self, file_path: str) -> str:
+        """Build the cache key for a PDF file."""
+        return f"{file_content_hash(file_path)}-v{EXTRACTOR_VERSION}"
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json.gz")
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for a key, marking it as recently used, or None on a miss."""
+        path = self._entry_path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                entry = json.load(f)
+            os.utime(path, None)  # LRU bookkeeping: last use is the file mtime
+            return entry
+        except Exception as e:
+            logger.warning(f"⚠️ Discarding unreadable extraction cache entry {key}: {e}")
+            self.purge(key)
+            return None
+
+    def store(self, key: str, entry: Dict[str, Any]):
+        """Write an entry atomically, then evict old entries if the cache is over its limit."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._entry_path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not write extraction cache entry {key}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        self.evict()
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """List cache entries, most recently used first."""
+        if not os.path.isdir(self.cache_dir):
+            return []
+        entries = []
+        for filename in os.listdir(self.cache_dir):
+            if not filename.endswith(".json.gz"):
+                continue
+            path = os.path.join(self.cache_dir, filename)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append({
+                "key": filename[:-len(".json.gz")],
+                "size": stat.st_size,
+                "last_used": stat.st_mtime
+            })
+        entries.sort(key=lambda e: e["last_used"], reverse=True)
+        return entries
+
+    def total_size(self) -> int:
+        """Return the total size of all entries in bytes."""
+        return sum(entry["size"] for entry in self.entries())
+
+    def evict(self) -> int:
+        """Delete least-recently-used entries until the cache fits its size limit."""
+        entries = self.entries()
+        total = sum(entry["size"] for entry in entries)
+        removed = 0
+        while entries and total > self.max_bytes:
+            oldest = entries.pop()
+            self.purge(oldest["key"])
+            total -= oldest["size"]
+            removed += 1
+        if removed:
+            logger.info(f"🧹 Evicted {removed} extraction cache entries")
+        return removed
+
+    def purge(self, key: Optional[str] = None) -> int:
+        """Delete one entry, or every entry when no key is given. Returns the number removed."""
+        keys = [key] if key else [entry["key"] for entry in self.entries()]
+        removed = 0
+        for entry_key in keys:
+            path = self._entry_path(entry_key)
+            if os.path.exists(path):
+                os.remove(path)
+                removed += 1
+        return removed
+
+
+_default_cache: Optional[ExtractionCache] = None
+
+def get_extraction_cache() -> Optional[ExtractionCache]:
+    """Return the process-wide extraction cache, or None if EXTRACTION_CACHE_DISABLED is set."""
+    global _default_cache
+    if os.getenv("EXTRACTION_CACHE_DISABLED", "").lower() in ("1", "true", "yes"):
+        return None
+    if _default_cache is None:
+        _default_cache = ExtractionCache()
+    return _default_cache
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line interface to inspect or purge the extraction cache."""
+    parser = argparse.ArgumentParser(description="Inspect or purge the PDF extraction cache.")
+    parser.add_argument("--cache-dir", help="Cache directory (defaults to EXTRACTION_CACHE_DIR or ~/.cache)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("list", help="List cached reports, most recently used first")
+    subparsers.add_parser("stats", help="Show cache size and limits")
+    show_parser = subparsers.add_parser("show", help="Show what a cache entry contains")
+    show_parser.add_argument("key", help="Cache key, or a PDF path to look up")
+    purge_parser = subparsers.add_parser("purge", help="Delete one entry, or everything")
+    purge_parser.add_argument("key", nargs="?", help="Cache key or PDF path (omit to purge all)")
+    args = parser.parse_args(argv)
+
+    cache = ExtractionCache(cache_dir=args.cache_dir)
+
+    def resolve_key(value: str) -> str:
+        return cache.key_for(value) if os.path.isfile(value) else value
+
+    if args.command == "list":
+        for entry in cache.entries():
+            last_used = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(entry["last_used"]))
+            print(f"{entry['key']}  {entry['size'] / 1024:10.1f} KiB  {last_used}")
+    elif args.command == "stats":
+        entries = cache.entries()
+        print(f"Cache directory: {cache.cache_dir}")
+        print(f"Extractor version: {EXTRACTOR_VERSION}")
+        print(f"Entries: {len(entries)}")
+        print(f"Size: {sum(e['size'] for e in entries) / (1024 * 1024):.1f} MiB of {cache.max_bytes / (1024 * 1024):.0f} MiB")
+    elif args.command == "show":
+        entry = cache.load(resolve_key(args.key))
+        if entry is None:
+            print("No cache entry found")
+            return 1
+        print(f"Source file: {entry.get('file_path')}")
+        print(f"Pages: {entry.get('page_count')} ({len(entry.get('pages', {}))} extracted)")
+        print(f"OCR pages: {len(entry.get('ocr', {}))}")
+        print(f"TOC entries: {len(entry.get('artifacts', {}).get('toc_entries') or [])}")
+        print(f"Framework sections: {len(entry.get('artifacts', {}).get('framework_sections') or [])}")
+    elif args.command == "purge":
+        removed = cache.purge(resolve_key(args.key) if args.key else None)
+        print(f"Removed {removed} entries")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,97 @@
 from crewai.tools import BaseTool
-from typing import Type, List, Dict, Any
+from typing import Type, List, Dict, Any, Callable, Mapping, Optional, Tuple
 from pydantic import BaseModel, Field
+import time
 import logging
 import re
+import requests
+from .framework_result import FRAMEWORK_ALIASES
+from .framework_glossary import GLOSSARY
+from .framework_scanner import TermScanner
+from .knowledge_base import knowledge_base
+from ..llm_cache import cached_completion
 
 logger = logging.getLogger(__name__)
 
+# Bump when the paragraph review prompt changes, so cached responses to the old prompt are not reused
+PROMPT_VERSION = "1"
+
+# Paragraph decisions of the local engine
+KEEP, DROP, AMBIGUOUS = "keep", "drop", "ambiguous"
+
+# Paragraphs scoring at least KEEP_SCORE are kept, at most DROP_SCORE removed, the rest are ambiguous
+KEEP_SCORE = 4
+DROP_SCORE = 0
+
+# A paragraph ends at a blank line, or at a sentence end once it has this many characters
+PARAGRAPH_MIN_CHARS = 40
+
+# Characters of ambiguous paragraphs sent to the LLM per review request
+REVIEW_BATCH_CHARS = 6000
+
+# Quantities with a unit, percentage or currency: the numeric facts of a disclosure
+_NUMERIC_FACT = re.compile(
+    r'(?:[$€£]\s?\d[\d,]*(?:\.\d+)?)'
+    r'|(?:\b\d[\d,]*(?:\.\d+)?\s?(?:%|percent\b|per cent\b|tco2e?\b|tco₂e?\b|tonnes?\b|tons?\b|t\b|kt\b|mt\b'
+    r'|mwh\b|gwh\b|kwh\b|twh\b|gj\b|m3\b|m³|litres?\b|liters?\b|megalitres?\b|kg\b|hectares?\b|ha\b'
+    r'|million\b|billion\b|bn\b|employees\b|hours\b|fatalities\b|incidents\b))',
+    re.IGNORECASE
+)
+
+# Lines holding only a figure, as PyMuPDF extracts table cells; two or more count as numeric facts
+_FIGURE_LINE = re.compile(r'^\s*[-–(]?\d[\d,]*(?:\.\d+)?\)?\s*%?\s*$', re.MULTILINE)
+
+# Lines that are layout artifacts rather than report content
+_ARTIFACT_LINES = [
+    # Page numbers in "Page N" or "N of M" form only: a bare number is usually a table cell
+    # (running page numbers at the page edges are stripped by the BoilerplateDetector)
+    re.compile(r'^\s*(?:page\s+\d{1,4}(?:\s*of\s*\d{1,4})?|\d{1,4}\s+of\s+\d{1,4})\s*$', re.IGNORECASE),
+    re.compile(r'^.{0,150}?(?:\.\s?){4,}\s*\d{1,4}\s*$'),                                     # TOC leader lines
+    re.compile(r'^\s*(?:©|\(c\)|copyright\b).{0,150}$', re.IGNORECASE),                         # copyright lines
+    re.compile(r'^\s*(?:https?://|www\.)\S+\s*$', re.IGNORECASE),                                # bare URLs
+    re.compile(r'^[^\w]+$')                                                                    # decorative lines
+]
+
+_SENTENCE_END = re.compile(r'[.!?]["”\')]?\s*$')
+_REVIEW_DECISION = re.compile(r'(\d+)\s*[:.)\-]\s*(KEEP|DROP)', re.IGNORECASE)
+
+def is_layout_artifact(line: str) -> bool:
+    """Return True for page numbers, TOC leader lines, copyright lines, bare URLs and decorative lines."""
+    return any(pattern.match(line) for pattern in _ARTIFACT_LINES)
+
+def split_paragraphs(text: str) -> Tuple[List[List[str]], int]:
+    """
+    Split report text into paragraphs of lines, dropping layout artifact lines.
+
+    PDF text rarely has blank lines between paragraphs, so a paragraph also ends at
+    a line closing a sentence once it is PARAGRAPH_MIN_CHARS long.
+
+    Returns:
+        (paragraphs as lists of lines, number of artifact lines removed)
+    """
+    paragraphs = []
+    current: List[str] = []
+    length = 0
+    artifacts = 0
+    for line in text.split('\n'):
+        stripped = line.strip()
+        if not stripped:
+            if current:
+                paragraphs.append(current)
+                current, length = [], 0
+            continue
+        if is_layout_artifact(stripped):
+            artifacts += 1
+            continue
+        current.append(stripped)
+        length += len(stripped) + 1
+        if length >= PARAGRAPH_MIN_CHARS and _SENTENCE_END.search(stripped):
+            paragraphs.append(current)
+            current, length = [], 0
+    if current:
+        paragraphs.append(current)
+    return paragraphs, artifacts
+
 class FluffRemoverInput(BaseModel):
     """Input for the FluffRemover tool."""
     report_text: str = Field(..., description="The full text of the sustainability report to be cleaned")
@@ -41,51 +127,25 @@ class FluffRemover(BaseTool):
     to ensure downstream analysis has all necessary information.
     """
     
-    def __init__(self):
-        super().__init__()
-        self._framework_content_patterns = self._initialize_framework_patterns()
+    endpoint: str = Field(default="http://localhost:11434/api/generate", description="Ollama endpoint for the paragraph review")
+    model: str = Field(default="llama2:latest", description="Ollama model for the paragraph review")
+    temperature: float = Field(default=0.0, description="Sampling temperature for the paragraph review")
     
-    def _initialize_framework_patterns(self) -> Dict[str, Dict[str, Any]]:
-        """Initialize patterns for framework-specific content that must be preserved."""
-        return {
-            "TCFD": {
-                "keywords": [
-                    "climate-related", "climate risk", "climate scenario", "climate disclosure",
-                    "TCFD", "Task Force", "climate governance", "climate strategy", "climate metrics",
-                    "Scope 1", "Scope 2", "Scope 3", "greenhouse gas", "GHG", "emissions",
-                    "climate resilience", "climate adaptation", "climate mitigation",
-                    "board oversight", "climate committee", "climate working group",
-                    "climate risk assessment", "climate opportunity", "climate target",
-                    "carbon neutral", "net zero", "climate commitment", "climate action"
-                ],
-                "sections": [
-                    "climate", "emissions", "environmental", "governance", "risk management",
-                    "strategy", "metrics", "targets", "scenario", "resilience"
-                ],
-                "indicators": [
-                    "tcfd_1", "tcfd_2", "tcfd_3", "tcfd_4", "tcfd_5", "tcfd_6", "tcfd_7",
-                    "tcfd_8", "tcfd_9", "tcfd_10", "tcfd_11"
-                ]
-            },
-            "GRI": {
-                "keywords": [
-                    "GRI", "Global Reporting Initiative", "sustainability standards",
-                    "material topics", "materiality", "stakeholder engagement",
-                    "GRI 102", "GRI 305", "GRI 403", "GRI 401", "GRI 413", "GRI 414",
-                    "GRI 302", "GRI 306", "GRI 307", "GRI 308",
-                    "emissions", "energy", "waste", "compliance", "supplier",
-                    "occupational health", "safety", "employment", "community"
-                ],
-                "sections": [
-                    "gri", "sustainability", "environmental", "social", "governance",
-                    "materiality", "stakeholder", "disclosure", "reporting", "standards"
-                ],
-                "indicators": [
-                    "GRI 102", "GRI 305", "GRI 403", "GRI 401", "GRI 413", "GRI 414",
-                    "GRI 302", "GRI 306", "GRI 307", "GRI 308"
-                ]
-            }
-        }
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Framework patterns and vocabulary come from the knowledge base on first use
+        self._framework_scanners: Dict[str, TermScanner] = {}
+        self._scanners: Dict[Tuple[str, ...], TermScanner] = {}
+    
+    @property
+    def vocabulary(self) -> Mapping[str, Any]:
+        """ESG, commitment, promotional and boilerplate terms plus framework patterns (the `fluff` section)."""
+        return knowledge_base().section("fluff")
+    
+    @property
+    def framework_patterns(self) -> Mapping[str, Mapping[str, Any]]:
+        """Patterns for framework-specific content that must be preserved."""
+        return self.vocabulary["framework_patterns"]
     
     def _run(self, report_text: str, detected_frameworks: List[str] = None) -> str:
         """
@@ -99,19 +159,7 @@ class FluffRemover(BaseTool):
             Cleaned text containing only relevant ESG information
         """
         try:
-            logger.info("🧹 Starting framework-aware fluff removal process")
-            logger.info(f"📄 Input text length: {len(report_text)} characters")
-            logger.info(f"🎯 Detected frameworks: {detected_frameworks or 'None'}")
-            
-            # This is a placeholder implementation
-            # In a real implementation, you would use the Ollama model to process this
-            # For now, we'll return the text as-is and let the agent handle the processing
-            # The framework-aware prompt will ensure proper preservation of framework content
-            
-            logger.info("✅ Framework-aware fluff removal completed (agent will handle processing)")
-            logger.info(f"📄 Output text length: {len(report_text)} characters")
-            
-            return report_text
+            return self.remove_fluff(report_text, detected_frameworks)["text"]
             
         except Exception as e:
             logger.error(f"❌ Error in fluff removal: {e}")
@@ -119,7 +167,7 @@ class FluffRemover(BaseTool):
     
     def _run_with_ollama(self, report_text: str, detected_frameworks: List[str] = None) -> str:
         """
-        Process the report text using Ollama model for intelligent fluff removal.
+        Process the report text locally, asking the Ollama model only about ambiguous paragraphs.
         
         Args:
             report_text: The full text of the sustainability report
@@ -129,42 +177,174 @@ class FluffRemover(BaseTool):
             Cleaned text containing only relevant ESG information
         """
         try:
-            logger.info("🧹 Starting intelligent framework-aware fluff removal with Ollama")
-            logger.info(f"📄 Input text length: {len(report_text)} characters")
-            logger.info(f"🎯 Detected frameworks: {detected_frameworks or 'None'}")
-            
-            # This would be implemented with actual Ollama API calls
-            # For now, we'll return the text as-is
-            # TODO: Implement Ollama integration for intelligent fluff removal
-            
-            logger.info("✅ Intelligent framework-aware fluff removal completed")
-            logger.info(f"📄 Output text length: {len(report_text)} characters")
-            
-            return report_text
+            return self.remove_fluff(report_text, detected_frameworks, review=self._review_with_ollama)["text"]
             
         except Exception as e:
             logger.error(f"❌ Error in intelligent fluff removal: {e}")
             return f"Error processing report text with Ollama: {str(e)}"
 
-    def _contains_framework_content(self, text: str, framework: str) -> bool:
-        """Check if text contains content relevant to a specific framework."""
-        if framework not in self._framework_content_patterns:
-            return False
+    def remove_fluff(self, report_text: str, detected_frameworks: List[str] = None,
+                     review: Optional[Callable[[List[str], List[str]], List[bool]]] = None) -> Dict[str, Any]:
+        """
+        Remove fluff locally: drop layout artifacts, then score and filter paragraphs.
         
-        patterns = self._framework_content_patterns[framework]
-        text_lower = text.lower()
+        Paragraphs with framework content, ESG vocabulary backed by numbers or
+        commitments are kept; promotional and legal boilerplate without ESG content is
+        removed. Ambiguous paragraphs are kept unless a `review` callable (e.g. the
+        Ollama review) is given, which decides them.
         
-        # Check for keywords
-        for keyword in patterns["keywords"]:
-            if keyword.lower() in text_lower:
-                return True
+        Args:
+            report_text: The full text of the sustainability report
+            detected_frameworks: List of detected frameworks (GRI, TCFD, etc.)
+            review: Optional callable(paragraphs, detected_frameworks) -> keep flags for ambiguous paragraphs
+            
+        Returns:
+            Dict with the cleaned `text` and `stats` (paragraph counts, characters in and out, seconds)
+        """
+        start_time = time.time()
+        detected_frameworks = detected_frameworks or []
+        logger.info("🧹 Starting framework-aware fluff removal process")
+        logger.info(f"📄 Input text length: {len(report_text)} characters")
+        logger.info(f"🎯 Detected frameworks: {detected_frameworks or 'None'}")
+        
+        paragraphs, artifact_lines = split_paragraphs(report_text)
+        texts = ["\n".join(lines) for lines in paragraphs]
+        decisions = [self.classify_paragraph(text, detected_frameworks)[0] for text in texts]
+        
+        ambiguous = [index for index, decision in enumerate(decisions) if decision == AMBIGUOUS]
+        reviewed = 0
+        if review and ambiguous:
+            logger.info(f"🤔 Reviewing {len(ambiguous)} ambiguous paragraphs with the LLM")
+            keep_flags = review([texts[index] for index in ambiguous], detected_frameworks)
+            for index, keep in zip(ambiguous, keep_flags):
+                decisions[index] = KEEP if keep else DROP
+            reviewed = len(ambiguous)
+        
+        cleaned = "\n\n".join(text for text, decision in zip(texts, decisions) if decision != DROP)
+        stats = {
+            "paragraphs": len(texts),
+            "kept": sum(1 for decision in decisions if decision == KEEP),
+            "dropped": sum(1 for decision in decisions if decision == DROP),
+            "ambiguous": len(ambiguous),
+            "reviewed": reviewed,
+            "artifact_lines": artifact_lines,
+            "chars_in": len(report_text),
+            "chars_out": len(cleaned),
+            "seconds": round(time.time() - start_time, 3)
+        }
         
-        # Check for indicators
-        for indicator in patterns["indicators"]:
-            if indicator.lower() in text_lower:
-                return True
+        logger.info(f"✅ Framework-aware fluff removal completed in {stats['seconds']:.2f}s: "
+                    f"{stats['kept']} kept, {stats['dropped']} dropped, {stats['ambiguous']} ambiguous "
+                    f"of {stats['paragraphs']} paragraphs, {artifact_lines} layout lines removed")
+        logger.info(f"📄 Output text length: {len(cleaned)} characters")
+        return {"text": cleaned, "stats": stats}
+
+    def _scanner(self, detected_frameworks: List[str]) -> TermScanner:
+        """Paragraph vocabulary for a set of detected frameworks, compiled once per set."""
+        key = tuple(sorted({GLOSSARY.resolve(framework) or framework.upper() for framework in detected_frameworks}))
+        if key not in self._scanners:
+            terms = [(alias, "framework") for aliases in FRAMEWORK_ALIASES.values() for alias in aliases]
+            for framework in key:
+                patterns = self.framework_patterns.get(framework)
+                if patterns:
+                    terms += [(term, "framework") for term in patterns["keywords"] + patterns["indicators"]]
+                terms += [(term, "framework") for term in GLOSSARY.keywords(framework)]
+            for label in ("esg", "commitment", "promotional", "boilerplate"):
+                terms += [(term, label) for term in self.vocabulary[f"{label}_terms"]]
+            self._scanners[key] = TermScanner(terms, plurals=True)
+        return self._scanners[key]
+
+    def classify_paragraph(self, text: str, detected_frameworks: List[str] = None) -> Tuple[str, int]:
+        """
+        Score a paragraph and decide whether to keep it.
+        
+        Framework content (any framework name, or the keywords and indicators of a
+        detected framework) is always kept. Otherwise each distinct ESG term scores 2
+        (up to three), numeric facts (or table figures) 2 and commitments 1; promotional phrases cost 2
+        and legal or navigation boilerplate 4.
+        
+        Returns:
+            (KEEP, DROP or AMBIGUOUS, score)
+        """
+        found: Dict[str, set] = {}
+        for hit in self._scanner(detected_frameworks or []).iter_hits(text):
+            for label in hit["labels"]:
+                found.setdefault(label, set()).add(hit["term"].lower())
+        
+        score = 2 * min(len(found.get("esg", ())), 3)
+        score += 2 if _NUMERIC_FACT.search(text) or len(_FIGURE_LINE.findall(text)) >= 2 else 0
+        score += 1 if "commitment" in found else 0
+        score -= 2 * len(found.get("promotional", ()))
+        score -= 4 if "boilerplate" in found else 0
+        
+        if "framework" in found or score >= KEEP_SCORE:
+            return KEEP, score
+        if score <= DROP_SCORE:
+            return DROP, score
+        return AMBIGUOUS, score
+
+    def _review_with_ollama(self, paragraphs: List[str], detected_frameworks: List[str]) -> List[bool]:
+        """Ask the Ollama model to keep or drop ambiguous paragraphs, in batches; unanswered paragraphs are kept."""
+        keep_flags = [True] * len(paragraphs)
+        batch: List[int] = []
+        batch_chars = 0
+        for index, paragraph in enumerate(paragraphs + [None]):
+            if paragraph is not None and (not batch or batch_chars + len(paragraph) <= REVIEW_BATCH_CHARS):
+                batch.append(index)
+                batch_chars += len(paragraph)
+                continue
+            prompt = self._review_prompt([paragraphs[i] for i in batch], detected_frameworks)
+            try:
+                answer = self._generate(prompt)
+                for match in _REVIEW_DECISION.finditer(answer):
+                    number = int(match.group(1)) - 1
+                    if 0 <= number < len(batch):
+                        keep_flags[batch[number]] = match.group(2).upper() == "KEEP"
+            except Exception as e:
+                logger.warning(f"⚠️ Paragraph review failed, keeping {len(batch)} ambiguous paragraphs: {e}")
+            if paragraph is not None:
+                batch, batch_chars = [index], len(paragraph)
+        return keep_flags
+
+    def _generate(self, prompt: str) -> str:
+        payload = {"model": self.model, "prompt": prompt, "stream": False, "temperature": self.temperature}
+        
+        def generate() -> str:
+            response = requests.post(self.endpoint, json=payload, timeout=120)
+            response.raise_for_status()
+            return response.json()["response"]
+        
+        return cached_completion(self.model, PROMPT_VERSION, prompt, {"temperature": self.temperature}, generate)
+
+    def _review_prompt(self, paragraphs: List[str], detected_frameworks: List[str]) -> str:
+        numbered = "\n\n".join(f"[{number}]\n{paragraph}" for number, paragraph in enumerate(paragraphs, 1))
+        frameworks = ", ".join(detected_frameworks) or "none"
+        return f"""
+You are an ESG compliance analyst cleaning a sustainability report for greenwashing review.
+Detected reporting frameworks: {frameworks}.
+
+For each numbered paragraph below, answer KEEP if it contains anything that could be material
+or scrutinised later (ESG data, disclosures, framework content, commitments, even vague
+sustainability claims), or DROP if it is only promotional language, company history,
+navigation or legal boilerplate. When unsure, answer KEEP.
+
+Answer with one line per paragraph in the form "<number>: KEEP" or "<number>: DROP" and nothing else.
+
+{numbered}
+""".strip()
+
+    def _contains_framework_content(self, text: str, framework: str) -> bool:
+        """Check if text contains content relevant to a specific framework."""
+        if framework not in self.framework_patterns:
+            return False
         
-        return False
+        # Keywords and indicators in one pass
+        if framework not in self._framework_scanners:
+            patterns = self.framework_patterns[framework]
+            self._framework_scanners[framework] = TermScanner(
+                [(term, framework) for term in patterns["keywords"] + patterns["indicators"]], plurals=True
+            )
+        return self._framework_scanners[framework].search(text) is not None
 
     def _get_framework_aware_prompt(self, detected_frameworks: List[str] = None) -> str:
         """Generate a framework-aware fluff removal prompt."""
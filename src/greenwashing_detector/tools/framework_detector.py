@@ -0,0 +1,539 @@
+# src/greenwashing_detector/tools/framework_detector.py
+
+import os
+import time
+import logging
+from datetime import datetime
+from typing import Annotated, Dict, List, Optional, Tuple
+from crewai.tools import BaseTool
+from .framework_result import FrameworkDetectionResult
+from .framework_scanner import SentenceLocator, TermScanner
+from .pdf_document import load_pdf_document
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Rule-based results below this confidence (or without a primary framework) are
+# ambiguous and are handed to the LLM framework detector
+DEFAULT_MIN_CONFIDENCE = 70
+
+# Search patterns per framework, matched case-insensitively on word boundaries
+FRAMEWORK_PATTERNS = {
+    'GRI': {
+        'search_patterns': [
+            {'type': 'exact', 'text': 'GRI'},
+            {'type': 'phrase', 'text': 'Global Reporting Initiative'},
+            {'type': 'standard', 'text': 'GRI Standards'},
+            {'type': 'standard', 'text': 'GRI Universal Standards'},
+            {'type': 'standard', 'text': 'GRI Topic Standards'}
+        ]
+    },
+    'TCFD': {
+        'search_patterns': [
+            {'type': 'exact', 'text': 'TCFD'},
+            {'type': 'phrase', 'text': 'Task Force on Climate-related Financial Disclosures'}
+        ]
+    },
+    'SASB': {
+        'search_patterns': [
+            {'type': 'exact', 'text': 'SASB'},
+            {'type': 'phrase', 'text': 'Sustainability Accounting Standards Board'},
+            {'type': 'standard', 'text': 'SASB Standards'}
+        ]
+    },
+    'CDP': {
+        'search_patterns': [
+            {'type': 'exact', 'text': 'CDP'},
+            {'type': 'phrase', 'text': 'Carbon Disclosure Project'}
+        ]
+    },
+    'ISO': {
+        'search_patterns': [
+            {'type': 'standard', 'text': 'ISO 14064'},
+            {'type': 'standard', 'text': 'ISO 14001'},
+            {'type': 'standard', 'text': 'ISO 26000'},
+            {'type': 'standard', 'text': 'ISO 50001'}
+        ]
+    },
+    'IFRS': {
+        'search_patterns': [
+            {'type': 'standard', 'text': 'IFRS S1'},
+            {'type': 'standard', 'text': 'IFRS S2'},
+            {'type': 'phrase', 'text': 'International Financial Reporting Standards'}
+        ]
+    },
+    'CSRD': {
+        'search_patterns': [
+            {'type': 'exact', 'text': 'CSRD'},
+            {'type': 'phrase', 'text': 'Corporate Sustainability Reporting Directive'},
+            {'type': 'exact', 'text': 'ESRS'}
+        ]
+    }
+}
+
+# Evidence indicators per framework, weighted primary > compliance > secondary
+EVIDENCE_INDICATORS = {
+    'GRI': {
+        'primary': [
+            'gri standards', 'global reporting initiative', 'in accordance', 
+            'prepared following', 'meets requirements', 'reporting framework'
+        ],
+        'secondary': [
+            'gri', 'reporting', 'disclosure', 'sustainability'
+        ],
+        'compliance': [
+            'compliance', 'certified', 'audited', 'verified'
+        ]
+    },
+    'ISO': {
+        'primary': [
+            'report prepared following iso', 'report in accordance with iso', 
+            'sustainability report based on iso', 'esg reporting following iso',
+            'iso reporting framework', 'iso sustainability standards'
+        ],
+        'secondary': [
+            'iso 14001', 'iso 14064', 'iso 26000', 'iso 50001',
+            'iso certification', 'iso management system', 'iso environmental management',
+            'iso quality management', 'iso energy management'
+        ],
+        'compliance': [
+            'iso certified', 'iso audited', 'iso verified', 'iso accredited'
+        ]
+    },
+    'IFRS': {
+        'primary': [
+            'international financial reporting standards', 'ifrs s1', 'ifrs s2'
+        ],
+        'secondary': [
+            'ifrs financial reporting', 'ifrs accounting standards', 'ifrs financial statements'
+        ],
+        'compliance': [
+            'ifrs compliance', 'ifrs adoption', 'ifrs implementation'
+        ]
+    },
+    'TCFD': {
+        'primary': [
+            'task force on climate-related financial disclosures', 'tcfd'
+        ],
+        'secondary': [
+            'climate risk', 'climate disclosure', 'climate-related'
+        ],
+        'compliance': [
+            'compliance', 'alignment', 'adoption'
+        ]
+    },
+    'SASB': {
+        'primary': [
+            'sustainability accounting standards board', 'sasb standards'
+        ],
+        'secondary': [
+            'sasb', 'accounting standards', 'sustainability accounting'
+        ],
+        'compliance': [
+            'compliance', 'adoption', 'implementation'
+        ]
+    },
+    'CDP': {
+        'primary': [
+            'carbon disclosure project', 'cdp'
+        ],
+        'secondary': [
+            'carbon disclosure', 'climate disclosure', 'emissions disclosure'
+        ],
+        'compliance': [
+            'response', 'submission', 'participation'
+        ]
+    },
+    'CSRD': {
+        'primary': [
+            'corporate sustainability reporting directive', 'csrd', 'esrs'
+        ],
+        'secondary': [
+            'sustainability reporting', 'esg reporting', 'non-financial reporting'
+        ],
+        'compliance': [
+            'compliance', 'implementation', 'adoption'
+        ]
+    }
+}
+
+
+# Pattern types that are searched for; all of them match on word boundaries
+PATTERN_TYPES = ('exact', 'phrase', 'standard')
+
+_default_scanner: Optional[TermScanner] = None
+
+def build_framework_scanner(framework_patterns: Dict = FRAMEWORK_PATTERNS) -> TermScanner:
+    """Compile every framework search pattern into one scanner, labelled (framework, pattern, type)."""
+    return TermScanner([
+        (pattern_info['text'], (framework_name, pattern_info['text'], pattern_info['type']))
+        for framework_name, patterns in framework_patterns.items()
+        for pattern_info in patterns['search_patterns']
+        if pattern_info['type'] in PATTERN_TYPES
+    ])
+
+def get_framework_scanner() -> TermScanner:
+    """Return the shared scanner for FRAMEWORK_PATTERNS, compiled on first use."""
+    global _default_scanner
+    if _default_scanner is None:
+        _default_scanner = build_framework_scanner()
+    return _default_scanner
+
+def find_framework_occurrences_smart(content: str, framework_patterns: Dict = FRAMEWORK_PATTERNS) -> List[Dict]:
+    """
+    Find framework occurrences with smart patterns and word boundaries.
+
+    The document is scanned once for all patterns; occurrences are returned grouped
+    by framework and pattern (in definition order), then by position.
+    """
+    scanner = get_framework_scanner() if framework_patterns is FRAMEWORK_PATTERNS \
+        else build_framework_scanner(framework_patterns)
+    sentences = SentenceLocator(content)
+    pattern_order = {label: rank for rank, label in enumerate(
+        label for term in scanner.terms for label in scanner.labels(term))}
+    
+    occurrences = []
+    for hit in scanner.iter_hits(content):
+        sentence, context = sentences.context(hit['start'], hit['end'])
+        for framework_name, pattern_text, pattern_type in hit['labels']:
+            occurrences.append({
+                'framework': framework_name,
+                'pattern': pattern_text,
+                'pattern_type': pattern_type,
+                'start': hit['start'],
+                'end': hit['end'],
+                'sentence': sentence,
+                'full_context': context
+            })
+    
+    occurrences.sort(key=lambda occurrence: (
+        pattern_order[(occurrence['framework'], occurrence['pattern'], occurrence['pattern_type'])],
+        occurrence['start']
+    ))
+    return occurrences
+
+def analyze_framework_context_smart(occurrences: List[Dict], evidence_indicators: Dict = EVIDENCE_INDICATORS) -> Dict:
+    """Analyze context for each framework with intelligent evidence classification."""
+    framework_analysis = {}
+    
+    for occurrence in occurrences:
+        framework = occurrence['framework']
+        sentence = occurrence['sentence'].lower()
+        
+        if framework not in framework_analysis:
+            framework_analysis[framework] = {
+                'total_occurrences': 0,
+                'relevant_occurrences': 0,
+                'primary_evidence': 0,
+                'secondary_evidence': 0,
+                'compliance_evidence': 0,
+                'evidence': [],
+                'occurrences': []
+            }
+        
+        framework_analysis[framework]['total_occurrences'] += 1
+        
+        # Check for evidence indicators
+        primary_found = []
+        secondary_found = []
+        compliance_found = []
+        
+        if framework in evidence_indicators:
+            indicators = evidence_indicators[framework]
+            
+            # Check primary indicators
+            for indicator in indicators['primary']:
+                if indicator in sentence:
+                    primary_found.append(indicator)
+            
+            # Check secondary indicators
+            for indicator in indicators['secondary']:
+                if indicator in sentence:
+                    secondary_found.append(indicator)
+            
+            # Check compliance indicators
+            for indicator in indicators['compliance']:
+                if indicator in sentence:
+                    compliance_found.append(indicator)
+        
+        # Determine if this occurrence is relevant
+        is_relevant = len(primary_found) > 0 or len(secondary_found) > 0 or len(compliance_found) > 0
+        
+        if is_relevant:
+            framework_analysis[framework]['relevant_occurrences'] += 1
+            framework_analysis[framework]['primary_evidence'] += len(primary_found)
+            framework_analysis[framework]['secondary_evidence'] += len(secondary_found)
+            framework_analysis[framework]['compliance_evidence'] += len(compliance_found)
+            
+            framework_analysis[framework]['evidence'].append({
+                'sentence': occurrence['sentence'],
+                'primary_indicators': primary_found,
+                'secondary_indicators': secondary_found,
+                'compliance_indicators': compliance_found,
+                'pattern': occurrence['pattern'],
+                'pattern_type': occurrence['pattern_type'],
+                'start': occurrence['start'],
+                'end': occurrence['end']
+            })
+        
+        framework_analysis[framework]['occurrences'].append({
+            'sentence': occurrence['sentence'],
+            'is_relevant': is_relevant,
+            'primary_indicators': primary_found,
+            'secondary_indicators': secondary_found,
+            'compliance_indicators': compliance_found,
+            'pattern': occurrence['pattern'],
+            'pattern_type': occurrence['pattern_type'],
+            'start': occurrence['start'],
+            'end': occurrence['end']
+        })
+    
+    return framework_analysis
+
+def calculate_framework_confidence_smart(framework_analysis: Dict) -> Dict:
+    """Calculate confidence scores with corrected classification logic."""
+    results = {}
+    
+    for framework_name, analysis in framework_analysis.items():
+        total_occurrences = analysis['total_occurrences']
+        relevant_occurrences = analysis['relevant_occurrences']
+        primary_evidence = analysis['primary_evidence']
+        secondary_evidence = analysis['secondary_evidence']
+        compliance_evidence = analysis['compliance_evidence']
+        
+        if total_occurrences == 0:
+            continue
+        
+        # Calculate evidence strength
+        evidence_strength = (
+            primary_evidence * 25 +      # Primary indicators are strongest
+            compliance_evidence * 20 +   # Compliance indicators are strong
+            secondary_evidence * 10      # Secondary indicators are weaker
+        )
+        
+        # Calculate relevance ratio
+        relevance_ratio = relevant_occurrences / total_occurrences if total_occurrences > 0 else 0
+        
+        # Calculate confidence based on evidence quality and quantity
+        if relevant_occurrences == 0:
+            confidence = min(10, total_occurrences * 2)
+        elif relevant_occurrences == 1:
+            if primary_evidence > 0:
+                confidence = min(50 + evidence_strength, 70)
+            else:
+                confidence = min(30 + evidence_strength, 50)
+        elif relevant_occurrences >= 2:
+            if primary_evidence > 0:
+                confidence = min(60 + evidence_strength, 85)
+            else:
+                confidence = min(40 + evidence_strength, 60)
+        else:
+            confidence = min(evidence_strength, 40)
+        
+        # CORRECTED: Determine role based on evidence quality
+        # Only frameworks with strong primary evidence should be primary
+        if primary_evidence >= 5:  # Require significant primary evidence for primary classification
+            role = "primary"
+        elif primary_evidence > 0 or compliance_evidence > 0:
+            role = "secondary"
+        else:
+            role = "reference"
+        
+        results[framework_name] = {
+            'confidence': confidence,
+            'role': role,
+            'total_occurrences': total_occurrences,
+            'relevant_occurrences': relevant_occurrences,
+            'relevance_ratio': relevance_ratio,
+            'evidence_strength': evidence_strength,
+            'primary_evidence': primary_evidence,
+            'secondary_evidence': secondary_evidence,
+            'compliance_evidence': compliance_evidence,
+            'evidence': analysis['evidence'],
+            'all_occurrences': analysis['occurrences']
+        }
+    
+    return results
+
+def detect_frameworks_smart(content: str) -> Dict:
+    """Smart framework detection with proper word boundaries and intelligent analysis."""
+    logger.info("🧠 Starting smart framework detection with word boundaries")
+    
+    # Find all framework occurrences with smart patterns
+    all_occurrences = find_framework_occurrences_smart(content)
+    
+    logger.info(f"📊 Found {len(all_occurrences)} total framework occurrences with word boundaries")
+    
+    # Analyze context for each framework
+    framework_analysis = analyze_framework_context_smart(all_occurrences)
+    
+    # Calculate confidence scores
+    results = calculate_framework_confidence_smart(framework_analysis)
+    
+    # Convert to list format for consistency
+    detected_frameworks = []
+    for framework_name, result in results.items():
+        if result['confidence'] > 0:
+            detected_frameworks.append({
+                'framework': framework_name,
+                'confidence': result['confidence'],
+                'role': result['role'],
+                'total_occurrences': result['total_occurrences'],
+                'relevant_occurrences': result['relevant_occurrences'],
+                'relevance_ratio': result['relevance_ratio'],
+                'evidence_strength': result['evidence_strength'],
+                'primary_evidence': result['primary_evidence'],
+                'secondary_evidence': result['secondary_evidence'],
+                'compliance_evidence': result['compliance_evidence'],
+                'evidence': result['evidence'],
+                'all_occurrences': result['all_occurrences']
+            })
+    
+    # Sort by confidence
+    detected_frameworks.sort(key=lambda x: x['confidence'], reverse=True)
+    
+    return {
+        'frameworks': detected_frameworks,
+        'total_detected': len(detected_frameworks),
+        'primary_frameworks': [f for f in detected_frameworks if f['role'] == 'primary'],
+        'secondary_frameworks': [f for f in detected_frameworks if f['role'] == 'secondary'],
+        'reference_frameworks': [f for f in detected_frameworks if f['role'] == 'reference'],
+        'total_occurrences': len(all_occurrences)
+    }
+
+def generate_smart_report(detection_results: Dict) -> str:
+    """Generate a comprehensive report for the smart framework detection."""
+    report = []
+    report.append("# Smart Framework Detection Report - FINAL CORRECTED")
+    report.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    report.append("")
+    report.append("## Key Improvements")
+    report.append("- ✅ Uses proper word boundaries (\\b) to avoid false matches")
+    report.append("- ✅ Regex patterns prevent matching 'gri' in 'integrity' or 'agriculture'")
+    report.append("- ✅ Intelligent context analysis with framework-specific indicators")
+    report.append("- ✅ Evidence quality weighting (primary > compliance > secondary)")
+    report.append("- ✅ CORRECTED: Proper primary/secondary classification logic")
+    report.append("- ✅ CORRECTED: Only frameworks with strong primary evidence are primary")
+    report.append("")
+    
+    # Summary
+    report.append("## Summary")
+    report.append(f"- Total frameworks detected: {detection_results['total_detected']}")
+    report.append(f"- Primary frameworks: {len(detection_results['primary_frameworks'])}")
+    report.append(f"- Secondary frameworks: {len(detection_results['secondary_frameworks'])}")
+    report.append(f"- Reference frameworks: {len(detection_results['reference_frameworks'])}")
+    report.append(f"- Total framework occurrences found: {detection_results['total_occurrences']}")
+    report.append("")
+    
+    # Framework details
+    for framework in detection_results['frameworks']:
+        report.append(f"## {framework['framework']}")
+        report.append(f"- **Confidence**: {framework['confidence']:.1f}%")
+        report.append(f"- **Role**: {framework['role']}")
+        report.append(f"- **Total Occurrences**: {framework['total_occurrences']}")
+        report.append(f"- **Relevant Occurrences**: {framework['relevant_occurrences']}")
+        report.append(f"- **Relevance Ratio**: {framework['relevance_ratio']:.2f}")
+        report.append(f"- **Evidence Strength**: {framework['evidence_strength']:.1f}")
+        report.append(f"- **Primary Evidence**: {framework['primary_evidence']}")
+        report.append(f"- **Secondary Evidence**: {framework['secondary_evidence']}")
+        report.append(f"- **Compliance Evidence**: {framework['compliance_evidence']}")
+        report.append("")
+        
+        # Relevant evidence
+        if framework['evidence']:
+            report.append("### Relevant Evidence")
+            for i, evidence in enumerate(framework['evidence'], 1):
+                report.append(f"#### Evidence {i}")
+                report.append(f"- **Sentence**: {evidence['sentence']}")
+                if evidence['primary_indicators']:
+                    report.append(f"- **Primary Indicators**: {', '.join(evidence['primary_indicators'])}")
+                if evidence['secondary_indicators']:
+                    report.append(f"- **Secondary Indicators**: {', '.join(evidence['secondary_indicators'])}")
+                if evidence['compliance_indicators']:
+                    report.append(f"- **Compliance Indicators**: {', '.join(evidence['compliance_indicators'])}")
+                report.append(f"- **Pattern Matched**: {evidence['pattern']}")
+                report.append("")
+        
+        # All occurrences (first 50 to avoid huge reports)
+        report.append("### All Occurrences")
+        for i, occurrence in enumerate(framework['all_occurrences'][:50], 1):
+            status = "✅ RELEVANT" if occurrence['is_relevant'] else "❌ NOT RELEVANT"
+            report.append(f"#### Occurrence {i} - {status}")
+            report.append(f"- **Pattern**: {occurrence['pattern']} ({occurrence['pattern_type']})")
+            report.append(f"- **Sentence**: {occurrence['sentence']}")
+            if occurrence['primary_indicators']:
+                report.append(f"- **Primary Indicators**: {', '.join(occurrence['primary_indicators'])}")
+            if occurrence['secondary_indicators']:
+                report.append(f"- **Secondary Indicators**: {', '.join(occurrence['secondary_indicators'])}")
+            if occurrence['compliance_indicators']:
+                report.append(f"- **Compliance Indicators**: {', '.join(occurrence['compliance_indicators'])}")
+            report.append("")
+        
+        if len(framework['all_occurrences']) > 50:
+            report.append(f"*... and {len(framework['all_occurrences']) - 50} more occurrences*")
+            report.append("")
+    
+    return "\n".join(report)
+
+def assess_detection(detection_results: Dict, min_confidence: Optional[float] = None) -> Tuple[bool, str]:
+    """
+    Decide whether a rule-based detection is conclusive or should go to the LLM detector.
+
+    Args:
+        detection_results: Output of detect_frameworks_smart()
+        min_confidence: Confidence the leading primary framework needs (env
+            FRAMEWORK_RULES_MIN_CONFIDENCE, default 70)
+
+    Returns:
+        (ambiguous, reason)
+    """
+    if min_confidence is None:
+        min_confidence = float(os.getenv("FRAMEWORK_RULES_MIN_CONFIDENCE", DEFAULT_MIN_CONFIDENCE))
+    if not detection_results['frameworks']:
+        return True, "no framework mentions found"
+    if not detection_results['primary_frameworks']:
+        return True, "no framework has enough primary evidence"
+    leading = detection_results['primary_frameworks'][0]
+    if leading['confidence'] < min_confidence:
+        return True, f"{leading['framework']} confidence {leading['confidence']:.0f}% is below {min_confidence:.0f}%"
+    return False, f"{leading['framework']} is primary with {leading['confidence']:.0f}% confidence"
+
+def detect_frameworks_rule_based(content: str, min_confidence: Optional[float] = None) -> Dict:
+    """
+    Run the rule-based detector and assess whether its result is conclusive.
+
+    Returns:
+        Dict with `detection` (detect_frameworks_smart output), `result` (the
+        FrameworkDetectionResult), `ambiguous`, `reason` and `seconds`
+    """
+    start_time = time.perf_counter()
+    detection = detect_frameworks_smart(content)
+    ambiguous, reason = assess_detection(detection, min_confidence)
+    elapsed = time.perf_counter() - start_time
+    logger.info(f"📏 Rule-based framework detection in {elapsed * 1000:.0f} ms: "
+                f"{'ambiguous' if ambiguous else 'conclusive'} ({reason})")
+    return {
+        "detection": detection,
+        "result": FrameworkDetectionResult.from_rule_detection(detection),
+        "ambiguous": ambiguous,
+        "reason": reason,
+        "seconds": elapsed
+    }
+
+class RuleBasedFrameworkDetector(BaseTool):
+    """Tool for deterministic, regex and evidence based framework detection."""
+    
+    name: Annotated[str, "RuleBasedFrameworkDetector"] = "RuleBasedFrameworkDetector"
+    description: Annotated[str, "Tool description"] = """
+    Detects ESG reporting frameworks (GRI, TCFD, SASB, CDP, ISO, IFRS, CSRD) in a PDF report
+    using word-boundary patterns and evidence scoring. Returns each framework with its role
+    (primary, secondary or reference) and confidence, and whether the result is ambiguous.
+    Input is the path to the PDF file.
+    """
+
+    def _run(self, file_path: str) -> str:
+        """Detect frameworks in the report at `file_path`."""
+        result = detect_frameworks_rule_based(load_pdf_document(file_path).full_text)
+        verdict = "AMBIGUOUS" if result["ambiguous"] else "CONCLUSIVE"
+        return f"{result['result'].to_markdown()}\n\nAssessment: {verdict} - {result['reason']}"
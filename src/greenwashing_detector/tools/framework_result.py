@@ -0,0 +1,241 @@
+# src/greenwashing_detector/tools/framework_result.py
+
+import re
+import json
+import logging
+from typing import Any, Dict, List, Literal, Optional
+from pydantic import BaseModel, Field, ValidationError
+from .framework_scanner import TermScanner
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+ROLES = ("primary", "secondary", "reference")
+
+# Frameworks recognised in detection output, with the names they go by
+FRAMEWORK_ALIASES = {
+    "GRI": ["GRI", "Global Reporting Initiative"],
+    "TCFD": ["TCFD", "Task Force on Climate-related Financial Disclosures"],
+    "SASB": ["SASB", "Sustainability Accounting Standards Board"],
+    "CDP": ["CDP", "Carbon Disclosure Project"],
+    "CSRD": ["CSRD", "Corporate Sustainability Reporting Directive"],
+    "ESRS": ["ESRS", "European Sustainability Reporting Standards"],
+    "ISO": ["ISO 14064", "ISO 14001", "ISO 26000", "ISO 50001"],
+    "IFRS": ["IFRS S1", "IFRS S2", "ISSB", "International Financial Reporting Standards"],
+    "SDG": ["SDG", "Sustainable Development Goals"]
+}
+
+# Phrases marking a framework's role in a line of detection output, strongest first
+ROLE_INDICATORS = {
+    "primary": ["(primary)", "primary", "prepared in accordance with", "this report follows",
+                "we report in accordance with", "the report is prepared following"],
+    "secondary": ["(secondary)", "secondary", "voluntary", "publish against", "additional",
+                  "supplementary", "aligned with", "consistent with"],
+    "reference": ["(reference)", "reference", "consideration to", "mentioned for context",
+                  "but do not align in full with"]
+}
+
+# TCFD gets the specialised crews only from this confidence on
+MAJOR_FRAMEWORK_CONFIDENCE = 70
+
+# Frameworks without a stated role are kept as secondary unless their confidence is below this
+MIN_UNQUALIFIED_CONFIDENCE = 40
+
+_EXPLICIT_ROLE = re.compile(r'\((primary|secondary|reference)\)', re.IGNORECASE)
+_CONFIDENCE = re.compile(r'(\d{1,3}(?:\.\d+)?)\s*%')
+_QUOTE = re.compile(r'["“]([^"”]{10,})["”]')
+_BOLD = re.compile(r'\*\*(.+?)\*\*')
+_JSON_BLOCK = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+# Lines stating that a framework is absent, e.g. "- TCFD: No TCFD disclosures were found in the report."
+_NEGATION = re.compile(
+    r'\bno\s+(?:\w+\s+){0,3}?(?:disclosures?|mentions?|references?|evidence|indications?)\b'
+    r'|\bnot\s+(?:\w+\s+){0,2}?(?:found|referenced|mentioned|detected|identified|implied|present|disclosed|applied)\b'
+    r'|\bdoes\s+not\s+(?:reference|mention|use|follow|report)\b',
+    re.IGNORECASE
+)
+
+_alias_scanner = TermScanner([(alias, name) for name, aliases in FRAMEWORK_ALIASES.items() for alias in aliases],
+                             plurals=True)
+
+class EvidenceSpan(BaseModel):
+    """A passage supporting a framework detection, with the offsets of the framework mention when known."""
+
+    text: str
+    start: Optional[int] = None
+    end: Optional[int] = None
+
+class DetectedFramework(BaseModel):
+    """One framework found in a report, with its role and confidence."""
+
+    name: str
+    role: Literal["primary", "secondary", "reference"] = "secondary"
+    confidence: Optional[float] = Field(default=None, ge=0, le=100)
+    evidence: List[EvidenceSpan] = Field(default_factory=list)
+
+class FrameworkDetectionResult(BaseModel):
+    """
+    Typed result of the framework detection stage.
+
+    Built once, from the rule-based detector or by parsing the framework detector
+    agent's output, and then used for routing, fluff removal and reporting without
+    re-reading the free text.
+    """
+
+    frameworks: List[DetectedFramework] = Field(default_factory=list)
+    method: Literal["rules", "llm"] = "llm"
+    raw: str = ""
+
+    def get(self, name: str) -> Optional[DetectedFramework]:
+        """Return the detected framework with this name, if any."""
+        return next((framework for framework in self.frameworks if framework.name == name), None)
+
+    def by_role(self, role: str) -> List[DetectedFramework]:
+        return [framework for framework in self.frameworks if framework.role == role]
+
+    @property
+    def framework_names(self) -> List[str]:
+        """Framework names, primary first, then secondary, then reference."""
+        return [framework.name for role in ROLES for framework in self.by_role(role)]
+
+    def is_major(self, name: str, min_confidence: float = MAJOR_FRAMEWORK_CONFIDENCE) -> bool:
+        """A framework is major if detected with at least `min_confidence`, or as primary/secondary without a score."""
+        framework = self.get(name)
+        if framework is None:
+            return False
+        if framework.confidence is not None:
+            return framework.confidence >= min_confidence
+        return framework.role != "reference"
+
+    def tcfd_analysis_route(self) -> str:
+        """Return 'tcfd_primary', 'tcfd_secondary' or 'standard' from TCFD's role."""
+        tcfd = self.get("TCFD")
+        if tcfd is None:
+            return "standard"
+        return "tcfd_primary" if tcfd.role == "primary" else "tcfd_secondary"
+
+    def to_markdown(self) -> str:
+        """Render as the framework detector's markdown bullet list."""
+        if not self.frameworks:
+            return "No reporting frameworks detected."
+        lines = []
+        for framework in self.frameworks:
+            line = f"- **{framework.name} ({framework.role.upper()})**"
+            if framework.evidence:
+                line += f': "{framework.evidence[0].text}"'
+            if framework.confidence is not None:
+                line += f" **Confidence**: {framework.confidence:.0f}%"
+            lines.append(line)
+        return "\n".join(lines)
+
+    @classmethod
+    def from_rule_detection(cls, detection: Dict[str, Any], max_evidence: int = 3) -> "FrameworkDetectionResult":
+        """Build a result from detect_frameworks_smart() output."""
+        frameworks = []
+        for framework in detection['frameworks']:
+            spans = [EvidenceSpan(text=occurrence['sentence'], start=occurrence.get('start'), end=occurrence.get('end'))
+                     for occurrence in framework['all_occurrences'] if occurrence['is_relevant']]
+            frameworks.append(DetectedFramework(
+                name=framework['framework'],
+                role=framework['role'],
+                confidence=framework['confidence'],
+                evidence=spans[:max_evidence]
+            ))
+        result = cls(frameworks=frameworks, method="rules")
+        result.raw = result.to_markdown()
+        return result
+
+    @classmethod
+    def from_llm_output(cls, output: Any) -> "FrameworkDetectionResult":
+        """
+        Read the framework detector agent's output, once.
+
+        The detection task asks for this model as structured output, so the crew's
+        pydantic result is used as it is. A JSON object matching this schema (bare or
+        in a ```json block) is validated directly. Otherwise the markdown is read line
+        by line: the framework named in a bullet's bold heading (or, without one,
+        anywhere on the line) takes the role stated in parentheses or by the role
+        phrases on that line, and the first percentage as its confidence. Lines saying
+        a framework is absent are skipped, and frameworks without a stated role are
+        kept as secondary unless their confidence is below 40%.
+        """
+        structured = getattr(output, 'pydantic', None)
+        if isinstance(structured, cls):
+            return cls._normalised(structured)
+
+        text = str(output.raw) if hasattr(output, 'raw') else str(output)
+        parsed = cls._from_json(text)
+        if parsed is not None:
+            return cls._normalised(parsed)
+        logger.warning("⚠️ Framework detection output is not structured, parsing it as markdown")
+
+        found: Dict[str, Dict[str, Any]] = {}
+        for line in text.split('\n'):
+            bold = _BOLD.search(line)
+            names = _alias_scanner.found_labels(bold.group(1)) if bold else set()
+            if not names:
+                names = _alias_scanner.found_labels(line)
+            if not names:
+                continue
+
+            role = cls._line_role(line)
+            if _NEGATION.search(line) and not _EXPLICIT_ROLE.search(line):
+                continue
+            confidence_match = _CONFIDENCE.search(line)
+            confidence = min(100.0, float(confidence_match.group(1))) if confidence_match else None
+            quote = _QUOTE.search(line)
+            for name in sorted(names):
+                entry = found.setdefault(name, {"role": None, "confidence": None, "evidence": []})
+                if entry["role"] is None and role is not None:
+                    entry["role"] = role
+                if entry["confidence"] is None and confidence is not None:
+                    entry["confidence"] = confidence
+                if quote and len(entry["evidence"]) < 3:
+                    entry["evidence"].append(EvidenceSpan(text=quote.group(1).strip()))
+
+        frameworks = []
+        for name, entry in found.items():
+            if entry["role"] is None and entry["confidence"] is not None \
+                    and entry["confidence"] < MIN_UNQUALIFIED_CONFIDENCE:
+                continue
+            frameworks.append(DetectedFramework(name=name, role=entry["role"] or "secondary",
+                                                confidence=entry["confidence"], evidence=entry["evidence"]))
+        return cls(frameworks=frameworks, method="llm", raw=text)
+
+    @classmethod
+    def _normalised(cls, result: "FrameworkDetectionResult") -> "FrameworkDetectionResult":
+        """Map framework names to their short names (e.g. "GRI Standards" -> GRI) and render the markdown."""
+        frameworks = []
+        for framework in result.frameworks:
+            labels = _alias_scanner.found_labels(framework.name)
+            name = labels.pop() if len(labels) == 1 else framework.name
+            if any(kept.name == name for kept in frameworks):
+                continue
+            frameworks.append(framework.model_copy(update={"name": name}))
+        normalised = cls(frameworks=frameworks, method="llm")
+        normalised.raw = normalised.to_markdown()
+        return normalised
+
+    @staticmethod
+    def _line_role(line: str) -> Optional[str]:
+        explicit = _EXPLICIT_ROLE.search(line)
+        if explicit:
+            return explicit.group(1).lower()
+        line_lower = line.lower()
+        for role in ROLES:
+            if any(indicator in line_lower for indicator in ROLE_INDICATORS[role]):
+                return role
+        return None
+
+    @classmethod
+    def _from_json(cls, text: str) -> Optional["FrameworkDetectionResult"]:
+        block = _JSON_BLOCK.search(text)
+        candidate = block.group(1) if block else text.strip()
+        if not candidate.startswith('{'):
+            return None
+        try:
+            data = json.loads(candidate)
+            return cls.model_validate(data)
+        except (ValueError, ValidationError) as e:
+            logger.warning(f"⚠️ Framework detection JSON did not match the schema, parsing as text: {e}")
+            return None
@@ -0,0 +1,202 @@
+# src/greenwashing_detector/tools/framework_scanner.py
+
+import re
+import logging
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONTEXT_WINDOW = 200
+
+class TermScanner:
+    """
+    Finds every occurrence of a vocabulary of terms in one pass over a text.
+
+    All terms (framework acronyms, phrases, indicator IDs, keywords) are compiled into
+    a single regex shaped as a prefix trie, so a text is scanned once no matter how
+    many terms there are and each position only tries the terms sharing its first
+    characters. The longest term matching at a position wins. Each term carries a
+    label (e.g. the framework or indicator it identifies). Shorter terms starting
+    the match ("GRI" in "GRI Standards") are reported with it, and scanning resumes
+    inside the match, so terms nested in it or overlapping its end ("risk management"
+    in "climate risk management") are found too: the hits are the same as scanning
+    for each term separately.
+    """
+
+    def __init__(self, terms: Iterable[Tuple[str, Any]], word_boundaries: bool = True,
+                 plurals: bool = False, ignore_case: bool = True):
+        """
+        Args:
+            terms: (term, label) pairs; a term may appear under several labels
+            word_boundaries: Only match whole words (no "gri" in "integrity")
+            plurals: Also match the term followed by "s" ("standard" -> "standards")
+            ignore_case: Match case-insensitively
+        """
+        self.word_boundaries = word_boundaries
+        self.plurals = plurals
+        self.flags = re.IGNORECASE if ignore_case else 0
+        self._labels: Dict[str, List[Any]] = {}
+        self._terms: List[str] = []
+        for term, label in terms:
+            key = self._key(term)
+            if key not in self._labels:
+                self._labels[key] = []
+                self._terms.append(term)
+            if label not in self._labels[key]:
+                self._labels[key].append(label)
+
+        self._by_key = {self._key(term): term for term in self._terms}
+        self.pattern = re.compile(self._bounded(f"(?:{self._trie_pattern()})"), self.flags) if self._terms else None
+        self._prefixes = {self._key(term): self._prefix_terms(term) for term in self._terms}
+
+    def _key(self, term: str) -> str:
+        return term.lower() if self.flags else term
+
+    def _trie_pattern(self) -> str:
+        """
+        Regex matching any term, with shared prefixes factored out.
+
+        Optional continuations are greedy, so "GRI Standards" is preferred over "GRI",
+        falling back to the shorter term when the longer one does not end on a word
+        boundary.
+        """
+        trie: Dict[str, Any] = {}
+        for term in self._terms:
+            node = trie
+            for char in self._key(term):
+                node = node.setdefault(char, {})
+            node[""] = True
+
+        def build(node: Dict[str, Any]) -> str:
+            branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+            if not branches:
+                return "s?" if self.plurals else ""
+            if "" in node:
+                # A term ends here: the longer terms, its plural, or nothing
+                return f"(?:{'|'.join(branches + (['s'] if self.plurals else []))})?"
+            return branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+
+        return build(trie)
+
+    def _term_of(self, found: str) -> str:
+        """Registered term for the text of a match (which may be a plural)."""
+        key = self._key(found)
+        if key not in self._by_key and self.plurals:
+            key = key[:-1]
+        return self._by_key[key]
+
+    def _term_pattern(self, term: str) -> str:
+        return re.escape(term) + ("s?" if self.plurals else "")
+
+    def _bounded(self, pattern: str) -> str:
+        # A leading lookbehind rather than \b lets the regex engine skip ahead to
+        # candidate first characters, several times faster on long documents
+        return r'(?<!\w)' + pattern + r'(?!\w)' if self.word_boundaries else pattern
+
+    def _prefix_terms(self, term: str) -> List[Tuple[int, str]]:
+        """Shorter terms that `term` starts with, on a word boundary, as (end offset, term)."""
+        prefixes = []
+        for other in self._terms:
+            if len(other) >= len(term):
+                continue
+            match = re.match(self._bounded(self._term_pattern(other)), term, self.flags)
+            if match:
+                prefixes.append((match.end(), other))
+        return prefixes
+
+    @property
+    def terms(self) -> List[str]:
+        return list(self._terms)
+
+    def labels(self, term: str) -> List[Any]:
+        """Return the labels registered for a term."""
+        return self._labels.get(self._key(term), [])
+
+    def iter_hits(self, text: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yield every term occurrence in a text, in text order.
+
+        Returns:
+            Iterator of hit records with `term` (as registered), `labels`, `start`, `end` and `text` (as found)
+        """
+        if self.pattern is None:
+            return
+        position = 0
+        while True:
+            match = self.pattern.search(text, position)
+            if match is None:
+                return
+            term = self._term_of(match.group())
+            start = match.start()
+            yield {"term": term, "labels": self._labels[self._key(term)], "start": start,
+                   "end": match.end(), "text": match.group()}
+            for prefix_end, prefix in self._prefixes[self._key(term)]:
+                yield {"term": prefix, "labels": self._labels[self._key(prefix)], "start": start,
+                       "end": start + prefix_end, "text": text[start:start + prefix_end]}
+            # Resume inside the match, for terms starting within it
+            position = start + 1
+
+    def scan(self, text: str) -> List[Dict[str, Any]]:
+        """Return every term occurrence in a text (see iter_hits)."""
+        return list(self.iter_hits(text))
+
+    def search(self, text: str) -> Optional[Dict[str, Any]]:
+        """Return the first hit in a text, or None if no term occurs."""
+        return next(self.iter_hits(text), None)
+
+    def found_terms(self, text: str) -> Set[str]:
+        """Return the distinct terms occurring in a text."""
+        return {hit["term"] for hit in self.iter_hits(text)}
+
+    def found_labels(self, text: str) -> Set[Any]:
+        """Return the distinct labels of the terms occurring in a text."""
+        return {label for hit in self.iter_hits(text) for label in hit["labels"]}
+
+    def positions_by_label(self, text: str) -> Dict[Any, List[int]]:
+        """Return the start offsets of all hits per label, from one scan."""
+        positions: Dict[Any, List[int]] = {}
+        for hit in self.iter_hits(text):
+            for label in hit["labels"]:
+                positions.setdefault(label, []).append(hit["start"])
+        return positions
+
+class SentenceLocator:
+    """
+    Finds the sentence around a position by bisection over precomputed periods.
+
+    The period positions of a text are collected once, so the context of every hit
+    is found in O(log n) instead of searching the surrounding text each time.
+    """
+
+    def __init__(self, text: str, window: int = DEFAULT_CONTEXT_WINDOW):
+        self.text = text
+        self.window = window
+        self._periods = [match.start() for match in re.finditer(r'\.', text)]
+
+    def context(self, start: int, end: int) -> Tuple[str, str]:
+        """
+        Return (sentence, full context) around the span [start, end).
+
+        The context extends `window` characters either side of the span; the sentence
+        runs from after the last period before the span to the first period from its
+        start, both within the context.
+        """
+        context_start = max(0, start - self.window)
+        context_end = min(len(self.text), end + self.window)
+
+        before = bisect_left(self._periods, start) - 1
+        if before >= 0 and self._periods[before] >= context_start:
+            sentence_start = self._periods[before] + 1
+        else:
+            sentence_start = context_start
+
+        after = bisect_left(self._periods, start)
+        if after < len(self._periods) and self._periods[after] < context_end:
+            sentence_end = self._periods[after]
+        else:
+            sentence_end = context_end
+
+        return self.text[sentence_start:sentence_end].strip(), self.text[context_start:context_end]
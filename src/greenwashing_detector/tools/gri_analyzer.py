@@ -4,13 +4,89 @@ GRI Analyzer Tool for comprehensive GRI compliance assessment.
 """
 
 import json
+import hashlib
 import logging
-from typing import Any, Annotated, Dict, List, Optional
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Any, Annotated, Dict, List, Optional, Sequence
 from crewai.tools import BaseTool
-from .framework_glossary import FrameworkGlossaryTool
+from .framework_glossary import GLOSSARY
+from .knowledge_base import knowledge_base
+from .framework_scanner import TermScanner
+from .dedup import PAGE_MARKER
 
 logger = logging.getLogger(__name__)
 
+# Indicator indexes kept per tool, keyed by the hash of the text they were built from
+INDEX_CACHE_SIZE = 32
+
+class GRIIndicatorIndex:
+    """
+    Where each GRI indicator is mentioned in a document, from a single scan.
+
+    Records per-indicator hit counts, start offsets, page numbers and the terms
+    (indicator IDs or keywords) that matched, so detection, scoring and reporting
+    read the index instead of rescanning the text.
+    """
+
+    def __init__(self, indicator_ids: Sequence[str]):
+        self.indicator_ids = list(indicator_ids)
+        self.counts: Dict[str, int] = {}
+        self.positions: Dict[str, List[int]] = {}
+        self.pages: Dict[str, List[int]] = {}
+        self.terms: Dict[str, List[str]] = {}
+
+    @classmethod
+    def build(cls, scanner: TermScanner, indicator_ids: Sequence[str], text: str,
+              page_starts: Optional[List[int]] = None, first_page: int = 1) -> "GRIIndicatorIndex":
+        """
+        Scan a text once and index every indicator hit.
+
+        Args:
+            scanner: Scanner labelling indicator IDs and keywords with their indicator ID
+            indicator_ids: All known indicator IDs, in reporting order
+            text: Text to scan
+            page_starts: Offsets at which each page starts in the text; without them,
+                pages are read from the chunkers' "=== ... Page N ... ===" headers
+            first_page: Number of the page starting at page_starts[0]
+        """
+        index = cls(indicator_ids)
+        if page_starts is None:
+            markers = [(match.start(), int(match.group(1))) for match in PAGE_MARKER.finditer(text)]
+            page_starts = [offset for offset, _ in markers]
+            page_numbers = [page for _, page in markers]
+        else:
+            page_numbers = list(range(first_page, first_page + len(page_starts)))
+
+        for hit in scanner.iter_hits(text):
+            page_slot = bisect_right(page_starts, hit["start"]) - 1
+            page = page_numbers[page_slot] if page_slot >= 0 else None
+            for indicator_id in hit["labels"]:
+                index.counts[indicator_id] = index.counts.get(indicator_id, 0) + 1
+                index.positions.setdefault(indicator_id, []).append(hit["start"])
+                pages = index.pages.setdefault(indicator_id, [])
+                if page is not None and page not in pages:
+                    pages.append(page)
+                terms = index.terms.setdefault(indicator_id, [])
+                if hit["term"] not in terms:
+                    terms.append(hit["term"])
+        return index
+
+    @property
+    def detected(self) -> List[str]:
+        """Indicators mentioned at least once, in reporting order."""
+        return [indicator_id for indicator_id in self.indicator_ids if indicator_id in self.counts]
+
+    def describe(self, indicator_id: str) -> str:
+        """One-line summary of an indicator's mentions, e.g. "GRI 305: 12 mentions on pages 4, 7"."""
+        count = self.counts.get(indicator_id, 0)
+        summary = f"{indicator_id}: {count} mention{'s' if count != 1 else ''}"
+        pages = sorted(self.pages.get(indicator_id, []))
+        if pages:
+            summary += f" on page{'s' if len(pages) > 1 else ''} {', '.join(str(page) for page in pages)}"
+        return summary
+
 class GRIAnalyzerTool(BaseTool):
     """Tool for analyzing GRI compliance in sustainability reports."""
     
@@ -23,15 +99,10 @@ class GRIAnalyzerTool(BaseTool):
 
     def __init__(self):
         super().__init__()
-        self._framework_glossary = None
         self._gri_data = None
-
-    @property
-    def framework_glossary(self):
-        """Get the framework glossary tool."""
-        if self._framework_glossary is None:
-            self._framework_glossary = FrameworkGlossaryTool()
-        return self._framework_glossary
+        self._indicator_scanner = None
+        self._indexes: "OrderedDict[str, GRIIndicatorIndex]" = OrderedDict()
+        self._indexes_lock = threading.Lock()
 
     @property
     def gri_data(self):
@@ -40,151 +111,45 @@ class GRIAnalyzerTool(BaseTool):
             self._gri_data = self._get_gri_framework_data()
         return self._gri_data
 
+    @property
+    def indicator_scanner(self) -> TermScanner:
+        """Scanner for every GRI indicator ID and keyword, labelled with the indicator ID."""
+        if self._indicator_scanner is None:
+            terms = []
+            for indicator_id, data in self.gri_data["indicators"].items():
+                terms.append((indicator_id, indicator_id))
+                terms.extend((keyword, indicator_id) for keyword in data.get("keywords", []))
+            self._indicator_scanner = TermScanner(terms, plurals=True)
+        return self._indicator_scanner
+
+    def indicator_index(self, report_content: str) -> GRIIndicatorIndex:
+        """
+        Return the indicator index of a text, scanning it only the first time it is seen.
+
+        Agents often pass the same chunk several times (once per analysis type), so the
+        most recent indexes are kept, keyed by a hash of the text.
+        """
+        key = hashlib.blake2b(report_content.encode("utf-8"), digest_size=16).hexdigest()
+        with self._indexes_lock:
+            index = self._indexes.get(key)
+            if index is not None:
+                self._indexes.move_to_end(key)
+                return index
+        index = GRIIndicatorIndex.build(self.indicator_scanner, list(self.gri_data["indicators"]), report_content)
+        with self._indexes_lock:
+            self._indexes[key] = index
+            while len(self._indexes) > INDEX_CACHE_SIZE:
+                self._indexes.popitem(last=False)
+        return index
+
     def _get_gri_framework_data(self) -> Dict[str, Any]:
-        """Get GRI framework data from the framework glossary."""
+        """Get GRI framework data from the framework glossary and the knowledge base."""
         try:
-            # Access the GRI data from the framework glossary
-            gri_info = self.framework_glossary._run("GRI")
+            # Access the GRI data from the shared framework glossary
+            gri_info = GLOSSARY.describe("GRI")
             
-            # Common GRI indicators and their requirements
-            gri_indicators = {
-                "GRI 102": {
-                    "name": "General Disclosures",
-                    "requirements": """
-                    - Organizational profile and scale
-                    - Strategy and analysis
-                    - Ethics and integrity
-                    - Governance
-                    - Stakeholder engagement
-                    - Reporting practice
-                    - Material topics and their boundaries
-                    """,
-                    "keywords": ["organizational profile", "strategy", "governance", "stakeholders", "material topics"]
-                },
-                "GRI 305": {
-                    "name": "Emissions",
-                    "requirements": """
-                    - Direct greenhouse gas (GHG) emissions (Scope 1)
-                    - Energy indirect GHG emissions (Scope 2)
-                    - Other indirect GHG emissions (Scope 3)
-                    - GHG emissions intensity
-                    - Reduction of GHG emissions
-                    - Emissions of ozone-depleting substances (ODS)
-                    - Nitrogen oxides (NOX), sulfur oxides (SOX), and other significant air emissions
-                    """,
-                    "keywords": ["emissions", "greenhouse gas", "GHG", "Scope 1", "Scope 2", "Scope 3", "carbon footprint"]
-                },
-                "GRI 403": {
-                    "name": "Occupational Health and Safety",
-                    "requirements": """
-                    - Occupational health and safety management system
-                    - Hazard identification, risk assessment, and incident investigation
-                    - Occupational health services
-                    - Worker participation, consultation, and communication on occupational health and safety
-                    - Worker training on occupational health and safety
-                    - Promotion of worker health
-                    - Prevention and mitigation of occupational health and safety impacts directly linked by business relationships
-                    - Workers covered by an occupational health and safety management system
-                    - Work-related injuries
-                    - Work-related ill health
-                    """,
-                    "keywords": ["health and safety", "occupational health", "workplace safety", "injuries", "ill health"]
-                },
-                "GRI 401": {
-                    "name": "Employment",
-                    "requirements": """
-                    - New employee hires and employee turnover
-                    - Benefits provided to full-time employees that are not provided to temporary or part-time employees
-                    - Parental leave
-                    """,
-                    "keywords": ["employment", "hires", "turnover", "benefits", "parental leave"]
-                },
-                "GRI 413": {
-                    "name": "Local Communities",
-                    "requirements": """
-                    - Operations with local community engagement, impact assessments, and development programs
-                    - Operations with significant actual and potential negative impacts on local communities
-                    """,
-                    "keywords": ["local communities", "community engagement", "impact assessment", "development programs"]
-                },
-                "GRI 414": {
-                    "name": "Supplier Social Assessment",
-                    "requirements": """
-                    - New suppliers that were screened using social criteria
-                    - Negative social impacts in the supply chain and actions taken
-                    """,
-                    "keywords": ["suppliers", "supply chain", "social criteria", "negative impacts"]
-                },
-                "GRI 302": {
-                    "name": "Energy",
-                    "requirements": """
-                    - Energy consumption within the organization
-                    - Energy consumption outside of the organization
-                    - Energy intensity
-                    - Reduction of energy consumption
-                    - Reductions in energy requirements of products and services
-                    """,
-                    "keywords": ["energy consumption", "energy efficiency", "renewable energy", "energy intensity", "energy reduction"],
-                    "risk_factors": [
-                        "Vague claims about using renewable energy without specifying percentage or source",
-                        "Energy efficiency claims without baseline comparisons"
-                    ],
-                    "red_flags": [
-                        "Terms like 'green energy' or 'clean energy' with no quantitative backing",
-                        "Statements like 'we are energy efficient' without data"
-                    ]
-                },
-                "GRI 306": {
-                    "name": "Waste",
-                    "requirements": """
-                    - Waste generation and significant waste-related impacts
-                    - Management of significant waste-related impacts
-                    - Waste diverted from disposal
-                    - Waste directed to disposal
-                    """,
-                    "keywords": ["waste", "zero waste", "recycling", "landfill", "disposal"],
-                    "risk_factors": [
-                        "Zero-waste claims without lifecycle evidence",
-                        "Generic references to 'recycling' without scope or data"
-                    ],
-                    "red_flags": [
-                        "Use of aspirational language without current performance data (e.g., 'working towards zero waste')",
-                        "No mention of hazardous waste or e-waste handling"
-                    ]
-                },
-                "GRI 307": {
-                    "name": "Environmental Compliance",
-                    "requirements": """
-                    - Non-compliance with environmental laws and regulations
-                    - Significant fines or sanctions for non-compliance
-                    """,
-                    "keywords": ["compliance", "regulation", "environmental law", "fines", "sanctions"],
-                    "risk_factors": [
-                        "Statements like 'we comply with all laws' without specifics",
-                        "Lack of historical context on violations or penalties"
-                    ],
-                    "red_flags": [
-                        "No mention of whether compliance was independently verified",
-                        "Omission of past environmental violations in sectors with known exposure"
-                    ]
-                },
-                "GRI 308": {
-                    "name": "Supplier Environmental Assessment",
-                    "requirements": """
-                    - New suppliers screened using environmental criteria
-                    - Negative environmental impacts in supply chain and actions taken
-                    """,
-                    "keywords": ["supplier screening", "environmental criteria", "supply chain", "impacts"],
-                    "risk_factors": [
-                        "Blanket claims of supplier compliance with no audit or verification details",
-                        "Generic commitment to 'sustainable sourcing' without tangible mechanisms"
-                    ],
-                    "red_flags": [
-                        "No data on how many suppliers were actually assessed",
-                        "Phrases like 'we ensure our suppliers are green' without evidence"
-                    ]
-                }
-            }
+            # GRI indicators and their requirements, from the knowledge base
+            gri_indicators = knowledge_base().section("gri_indicators")
             
             return {
                 "info": gri_info,
@@ -240,8 +205,7 @@ class GRIAnalyzerTool(BaseTool):
             requirements = indicator_data.get("requirements", "Requirements not available")
             
             # Get the analysis prompt from framework glossary
-            gri_framework = self._get_gri_framework_data()
-            analysis_prompt = gri_framework.get("analysis_prompt", "")
+            analysis_prompt = self.gri_data.get("analysis_prompt", "")
             
             # Format the prompt with actual data
             formatted_prompt = analysis_prompt.format(
@@ -274,7 +238,8 @@ Return results in the specified JSON format with compliance score (0-100)."""
     def _analyze_comprehensive_gri(self, report_content: str, company_info: Dict[str, str]) -> str:
         """Perform comprehensive GRI analysis across all detected indicators."""
         try:
-            detected_indicators = self._detect_gri_indicators(report_content)
+            index = self.indicator_index(report_content)
+            detected_indicators = index.detected
             
             analysis_results = []
             for indicator_id in detected_indicators:
@@ -284,7 +249,7 @@ Return results in the specified JSON format with compliance score (0-100)."""
                 analysis_results.append(f"\n--- {indicator_id} ---\n{indicator_analysis}")
             
             # Calculate overall compliance score
-            overall_score = self._calculate_overall_compliance_score(detected_indicators)
+            overall_score = self._calculate_overall_compliance_score(index)
             
             return f"""**COMPREHENSIVE GRI ANALYSIS**
 
@@ -295,7 +260,7 @@ Return results in the specified JSON format with compliance score (0-100)."""
 
 **DETECTED GRI INDICATORS**:
 {', '.join(detected_indicators) if detected_indicators else 'No GRI indicators detected'}
-
+{self._format_mentions(index)}
 **OVERALL COMPLIANCE SCORE**: {overall_score}/100
 
 **INDICATOR-SPECIFIC ANALYSES**:
@@ -313,7 +278,8 @@ Focus on evidence quality, greenwashing risk, and specific compliance requiremen
     def _analyze_gri_summary(self, report_content: str, company_info: Dict[str, str]) -> str:
         """Provide a summary of GRI compliance."""
         try:
-            detected_indicators = self._detect_gri_indicators(report_content)
+            index = self.indicator_index(report_content)
+            detected_indicators = index.detected
             
             return f"""**GRI COMPLIANCE SUMMARY**
 
@@ -323,7 +289,7 @@ Focus on evidence quality, greenwashing risk, and specific compliance requiremen
 
 **DETECTED GRI INDICATORS**: {len(detected_indicators)}
 **INDICATORS**: {', '.join(detected_indicators) if detected_indicators else 'None detected'}
-
+{self._format_mentions(index)}
 **COMPLIANCE ASSESSMENT**:
 - **Coverage**: {'Good' if len(detected_indicators) >= 3 else 'Limited' if len(detected_indicators) >= 1 else 'Poor'}
 - **Key Areas**: {self._identify_key_areas(detected_indicators)}
@@ -336,23 +302,17 @@ For detailed analysis of specific indicators, use the indicator-specific analysi
             logger.error(f"Error in GRI summary analysis: {e}")
             return f"Error in GRI summary analysis: {str(e)}"
 
-    def _detect_gri_indicators(self, report_content: str) -> List[str]:
-        """Detect GRI indicators mentioned in the report content."""
-        detected = []
-        content_lower = report_content.lower()
-        
-        for indicator_id, data in self.gri_data["indicators"].items():
-            # Check for indicator ID mentions
-            if indicator_id.lower() in content_lower:
-                detected.append(indicator_id)
-            # Check for keyword mentions
-            elif any(keyword.lower() in content_lower for keyword in data.get("keywords", [])):
-                detected.append(indicator_id)
-        
-        return list(set(detected))  # Remove duplicates
-
-    def _calculate_overall_compliance_score(self, detected_indicators: List[str]) -> int:
-        """Calculate overall GRI compliance score based on detected indicators."""
+    def _format_mentions(self, index: GRIIndicatorIndex) -> str:
+        """Bullet list of each detected indicator's mention count and pages, or an empty string."""
+        if not index.detected:
+            return ""
+        return "\n**INDICATOR MENTIONS**:\n" + "\n".join(
+            f"- {index.describe(indicator_id)}" for indicator_id in index.detected
+        ) + "\n"
+
+    def _calculate_overall_compliance_score(self, index: GRIIndicatorIndex) -> int:
+        """Calculate overall GRI compliance score based on the indexed indicators."""
+        detected_indicators = index.detected
         if not detected_indicators:
             return 0
         
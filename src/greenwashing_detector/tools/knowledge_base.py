@@ -0,0 +1,203 @@
+# src/greenwashing_detector/tools/knowledge_base.py
+
+import os
+import json
+import hashlib
+import logging
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Bump whenever the compiled section format changes, so stale compiled sections are never loaded
+COMPILED_FORMAT_VERSION = "2"
+
+# Knowledge base shipped with the package
+BUNDLED_KNOWLEDGE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "knowledge")
+
+# Project-level definitions extending the bundled ones, alongside crewAI's knowledge sources
+DEFAULT_USER_KNOWLEDGE_DIR = "knowledge"
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "greenwashing_detector", "knowledge")
+
+SOURCE_EXTENSIONS = (".yaml", ".yml", ".json")
+
+def freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+def merge(base: Any, override: Any) -> Any:
+    """
+    Merge knowledge base definitions from a later root into earlier ones.
+
+    Mappings are merged key by key, lists are extended with the items they do not
+    contain yet, and any other value is replaced.
+    """
+    if isinstance(base, dict) and isinstance(override, dict):
+        merged = dict(base)
+        for key, value in override.items():
+            merged[key] = merge(base[key], value) if key in base else value
+        return merged
+    if isinstance(base, list) and isinstance(override, list):
+        return base + [item for item in override if item not in base]
+    return override
+
+def _read_source(path: str) -> Dict[str, Any]:
+    """Parse one YAML or JSON source file, which must hold a mapping."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            if path.endswith(".json"):
+                data = json.load(f)
+            else:
+                # Only needed when a section is compiled, not on every import
+                import yaml
+                data = yaml.safe_load(f)
+    except (OSError, ValueError) as e:
+        raise ValueError(f"Invalid knowledge base file {path}: {e}") from e
+    if data is None:
+        return {}
+    if not isinstance(data, dict):
+        raise ValueError(f"Invalid knowledge base file {path}: expected a mapping, got {type(data).__name__}")
+    return data
+
+class KnowledgeBase:
+    """
+    Versioned, on-disk framework knowledge base, loaded one section at a time.
+
+    A section is a YAML/JSON file named after it (e.g. `gri_indicators.yaml`), or a
+    directory of files whose names become its keys (e.g. `frameworks/TCFD.yaml`).
+    The package's bundled definitions are extended or overridden by the same layout
+    under FRAMEWORK_KNOWLEDGE_DIR (default: ./knowledge), so frameworks, indicators and
+    keyword lists can be added without code changes. A section is only read on first
+    use: its merged definitions are compiled to a JSON file keyed by the sources' sizes
+    and modification times, so later runs skip the YAML parsing entirely. JSON rather
+    than pickle keeps a tampered file in the user-writable cache directory from
+    running code when it is loaded.
+    """
+
+    def __init__(self, roots: Optional[List[str]] = None, cache_dir: Optional[str] = None):
+        """
+        Args:
+            roots: Knowledge directories in merge order (default: bundled, then FRAMEWORK_KNOWLEDGE_DIR if present)
+            cache_dir: Directory of compiled sections (default: KNOWLEDGE_CACHE_DIR or ~/.cache/...)
+        """
+        if roots is None:
+            roots = [BUNDLED_KNOWLEDGE_DIR]
+            user_dir = os.path.abspath(os.getenv("FRAMEWORK_KNOWLEDGE_DIR", DEFAULT_USER_KNOWLEDGE_DIR))
+            if os.path.isdir(user_dir) and user_dir != BUNDLED_KNOWLEDGE_DIR:
+                roots.append(user_dir)
+        self.roots = roots
+        self.cache_dir = cache_dir or os.getenv("KNOWLEDGE_CACHE_DIR", DEFAULT_CACHE_DIR)
+        self._sections: Dict[str, Mapping[str, Any]] = {}
+        self._lock = threading.Lock()
+        self.stats = {"sections_loaded": 0, "cache_hits": 0, "compiled": 0}
+
+    @property
+    def version(self) -> str:
+        """Version declared in the knowledge base manifest."""
+        return str(self.section("manifest").get("version", "0"))
+
+    def section(self, name: str) -> Mapping[str, Any]:
+        """
+        Return a section's merged definitions as a read-only mapping, loading it on first use.
+
+        Raises:
+            KeyError: If no knowledge directory defines the section
+        """
+        with self._lock:
+            if name not in self._sections:
+                self._sections[name] = freeze(self._load(name))
+                self.stats["sections_loaded"] += 1
+            return self._sections[name]
+
+    def source_files(self, section: Optional[str] = None) -> List[str]:
+        """Source files of one section, or of the whole knowledge base, in merge order."""
+        files = []
+        for root in self.roots:
+            if not os.path.isdir(root):
+                continue
+            for entry in sorted(os.listdir(root)):
+                path = os.path.join(root, entry)
+                stem, extension = os.path.splitext(entry)
+                if os.path.isdir(path) and (section is None or entry == section):
+                    files.extend(os.path.join(path, name) for name in sorted(os.listdir(path))
+                                 if name.endswith(SOURCE_EXTENSIONS))
+                elif extension in SOURCE_EXTENSIONS and (section is None or stem == section):
+                    files.append(path)
+        return files
+
+    def _load(self, name: str) -> Dict[str, Any]:
+        sources = self.source_files(name)
+        if not sources:
+            raise KeyError(f"Unknown knowledge base section: {name}")
+
+        cache_path = os.path.join(self.cache_dir, f"{name}-{self._cache_key(name, sources)}.json")
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self.stats["cache_hits"] += 1
+                return data
+            logger.warning(f"⚠️ Ignoring compiled knowledge section {cache_path}: expected a mapping")
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ Ignoring unreadable compiled knowledge section {cache_path}: {e}")
+
+        data = self._compile(name, sources)
+        self.stats["compiled"] += 1
+        logger.info(f"📚 Compiled knowledge base section '{name}' from {len(sources)} file(s)")
+        try:
+            compiled = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        except (TypeError, ValueError) as e:
+            logger.warning(f"⚠️ Knowledge section '{name}' is not JSON-serializable, it will not be cached: {e}")
+            return data
+        if json.loads(compiled) != data:
+            # e.g. non-string keys or tuples, which JSON would change on the next load
+            logger.warning(f"⚠️ Knowledge section '{name}' does not round-trip through JSON, it will not be cached")
+            return data
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                f.write(compiled)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not write compiled knowledge section {cache_path}: {e}")
+        return data
+
+    def _compile(self, name: str, sources: List[str]) -> Dict[str, Any]:
+        """Parse and merge a section's sources; files inside a section directory are keyed by their name."""
+        data: Dict[str, Any] = {}
+        for path in sources:
+            content = _read_source(path)
+            if os.path.basename(os.path.dirname(path)) == name:
+                content = {os.path.splitext(os.path.basename(path))[0]: content}
+            data = merge(data, content)
+        return data
+
+    @staticmethod
+    def _cache_key(name: str, sources: List[str]) -> str:
+        digest = hashlib.sha256(f"{COMPILED_FORMAT_VERSION}:{name}".encode("utf-8"))
+        for path in sources:
+            stat = os.stat(path)
+            digest.update(f"{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}".encode("utf-8"))
+        return digest.hexdigest()[:16]
+
+_default_knowledge_base: Optional[KnowledgeBase] = None
+_default_knowledge_base_lock = threading.Lock()
+
+def knowledge_base() -> KnowledgeBase:
+    """Return the process-wide knowledge base; sections are still only read on first use."""
+    global _default_knowledge_base
+    with _default_knowledge_base_lock:
+        if _default_knowledge_base is None:
+            _default_knowledge_base = KnowledgeBase()
+        return _default_knowledge_base
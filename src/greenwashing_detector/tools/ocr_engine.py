@@ -0,0 +1,208 @@
+# src/greenwashing_detector/tools/ocr_engine.py
+
+import os
+import time
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterable, Optional, Tuple
+import fitz  # PyMuPDF
+import pytesseract
+from PIL import Image
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_OCR_DPI = 72  # PyMuPDF's default render resolution
+DEFAULT_OCR_LANGUAGES = "eng"
+DEFAULT_OCR_TIMEOUT = 120  # seconds per page
+
+# Seconds allowed on top of the Tesseract timeout for opening and rendering a page
+RENDER_ALLOWANCE = 15
+
+# Times a page is requeued after its worker pool broke (e.g. a worker crashed) before it is given up
+MAX_PAGE_RETRIES = 2
+
+def _env_flag(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    return default if value is None else value.lower() in ("1", "true", "yes")
+
+def render_page_image(page, dpi: int, grayscale: bool = True,
+                      max_dimension: Optional[int] = None) -> Tuple["fitz.Pixmap", Image.Image]:
+    """
+    Render a PyMuPDF page straight into a PIL image, without a PNG encode/decode round-trip.
+
+    The image is built over the pixmap's raw sample buffer (zero-copy where PyMuPDF
+    exposes `samples_mv`), so the returned pixmap must be kept alive while the image
+    is in use.
+
+    Args:
+        page: PyMuPDF page
+        dpi: Render resolution
+        grayscale: Render a single-channel image (Tesseract binarizes anyway)
+        max_dimension: Cap on the longer side in pixels; lowers the render resolution instead of resizing
+
+    Returns:
+        Tuple of (pixmap, image)
+    """
+    if max_dimension:
+        longest_side_points = max(page.rect.width, page.rect.height) or 1
+        dpi = min(dpi, max(1, int(max_dimension * 72 / longest_side_points)))
+    colorspace = fitz.csGRAY if grayscale else fitz.csRGB
+    pix = page.get_pixmap(dpi=dpi, colorspace=colorspace, alpha=False)
+    mode = "L" if pix.n == 1 else "RGB"
+    samples = pix.samples_mv if hasattr(pix, "samples_mv") else pix.samples
+    img = Image.frombuffer(mode, (pix.width, pix.height), samples, "raw", mode, pix.stride, 1)
+    return pix, img
+
+def _ocr_page_worker(file_path: str, page_num: int, dpi: int, languages: str, timeout: float,
+                     grayscale: bool, max_dimension: Optional[int]) -> str:
+    """Worker entry point: open the PDF in this process, render one page and OCR it."""
+    doc = fitz.open(file_path)
+    try:
+        pix, img = render_page_image(doc[page_num], dpi, grayscale, max_dimension)
+        return pytesseract.image_to_string(img, lang=languages, timeout=timeout)
+    finally:
+        doc.close()
+
+def _terminate_pool(executor: ProcessPoolExecutor):
+    """Shut a process pool down without waiting for its running tasks, killing its workers."""
+    # No public API for this before Python 3.14's terminate_workers()
+    for process in list((getattr(executor, "_processes", None) or {}).values()):
+        process.terminate()
+    executor.shutdown(wait=False, cancel_futures=True)
+
+class OCREngine:
+    """
+    Tesseract OCR for scanned report pages, inline or on a bounded process pool.
+
+    Rendering and recognition of each page run in a worker process, so heavily
+    scanned reports are OCR'd concurrently instead of one page at a time. Results
+    are always returned in page order.
+    """
+
+    def __init__(self, dpi: Optional[int] = None, languages: Optional[str] = None,
+                 timeout: Optional[float] = None, workers: Optional[int] = None,
+                 grayscale: Optional[bool] = None, max_dimension: Optional[int] = None):
+        """
+        Args:
+            dpi: Render resolution (env OCR_DPI, default 72)
+            languages: Tesseract language packs, e.g. "eng+fra" (env OCR_LANGUAGES)
+            timeout: Per-page OCR timeout in seconds (env OCR_TIMEOUT)
+            workers: Maximum worker processes (env OCR_WORKERS, default CPU count)
+            grayscale: Render single-channel images (env OCR_GRAYSCALE, default on)
+            max_dimension: Downscale so the longer side is at most this many pixels (env OCR_MAX_DIMENSION)
+        """
+        self.dpi = dpi or int(os.getenv("OCR_DPI", DEFAULT_OCR_DPI))
+        self.languages = languages or os.getenv("OCR_LANGUAGES", DEFAULT_OCR_LANGUAGES)
+        self.timeout = timeout or float(os.getenv("OCR_TIMEOUT", DEFAULT_OCR_TIMEOUT))
+        self.workers = max(1, workers or int(os.getenv("OCR_WORKERS", os.cpu_count() or 1)))
+        self.grayscale = grayscale if grayscale is not None else _env_flag("OCR_GRAYSCALE", True)
+        self.max_dimension = max_dimension or int(os.getenv("OCR_MAX_DIMENSION", 0)) or None
+
+    @property
+    def settings_key(self) -> str:
+        """The settings that shape the OCR text, e.g. "72dpi-eng-gray-max0"; OCR text is cached under it."""
+        return f"{self.dpi}dpi-{self.languages}-{'gray' if self.grayscale else 'rgb'}-max{self.max_dimension or 0}"
+
+    def ocr_page(self, page) -> str:
+        """OCR a single PyMuPDF page in the current process."""
+        pix, img = render_page_image(page, self.dpi, self.grayscale, self.max_dimension)
+        return pytesseract.image_to_string(img, lang=self.languages, timeout=self.timeout)
+
+    def ocr_pages(self, file_path: str, page_numbers: Iterable[int]) -> Dict[int, str]:
+        """
+        OCR several pages of a PDF concurrently.
+
+        Pages that fail or run longer than the OCR timeout plus RENDER_ALLOWANCE (counted
+        from when the page starts) are logged and left out of the result, so callers can
+        fall back to their regular text. A page that overruns is stopped by restarting
+        the worker pool; pages running alongside it are requeued. Pages lost to a broken
+        pool (a worker that crashed) are requeued up to MAX_PAGE_RETRIES times.
+
+        Args:
+            file_path: Path to the PDF file
+            page_numbers: 0-based page numbers to OCR
+
+        Returns:
+            Dict of page number to OCR text, ordered by page number
+        """
+        pages = sorted(set(page_numbers))
+        if not pages:
+            return {}
+
+        logger.info(f"🔠 OCR'ing {len(pages)} pages with up to {min(self.workers, len(pages))} workers "
+                    f"({self.dpi} dpi, languages: {self.languages})")
+        results: Dict[int, str] = {}
+
+        if self.workers == 1:
+            # Inline, e.g. inside a batch extraction worker process that must not fork its own pool
+            for page_num in pages:
+                try:
+                    results[page_num] = _ocr_page_worker(file_path, page_num, self.dpi, self.languages,
+                                                         self.timeout, self.grayscale, self.max_dimension)
+                except Exception as e:
+                    logger.warning(f"OCR failed on page {page_num + 1}: {e}")
+            logger.info(f"✅ OCR completed for {len(results)}/{len(pages)} pages")
+            return results
+
+        # Each page gets the Tesseract timeout plus a render allowance, counted from when it starts.
+        # At most one page per worker is in flight, so a page starts as soon as it is submitted.
+        page_deadline = self.timeout + RENDER_ALLOWANCE
+        pool_size = min(self.workers, len(pages))
+        queued = list(pages)
+        running: Dict[Future, Tuple[int, float]] = {}
+        retries: Dict[int, int] = {}
+        executor = ProcessPoolExecutor(max_workers=pool_size)
+        try:
+            while queued or running:
+                while queued and len(running) < pool_size:
+                    page_num = queued.pop(0)
+                    future = executor.submit(_ocr_page_worker, file_path, page_num, self.dpi, self.languages,
+                                             self.timeout, self.grayscale, self.max_dimension)
+                    running[future] = (page_num, time.monotonic())
+
+                oldest_start = min(started for _, started in running.values())
+                done, _ = wait(running, timeout=max(0.0, oldest_start + page_deadline - time.monotonic()),
+                               return_when=FIRST_COMPLETED)
+                broken = False
+                retry = []
+                for future in done:
+                    page_num, _ = running.pop(future)
+                    try:
+                        results[page_num] = future.result()
+                    except BrokenProcessPool as e:
+                        broken = True
+                        retries[page_num] = retries.get(page_num, 0) + 1
+                        if retries[page_num] <= MAX_PAGE_RETRIES:
+                            retry.append(page_num)
+                        else:
+                            logger.warning(f"OCR failed on page {page_num + 1} after {MAX_PAGE_RETRIES} retries: {e}")
+                    except Exception as e:
+                        logger.warning(f"OCR failed on page {page_num + 1}: {e}")
+
+                now = time.monotonic()
+                for future, (page_num, started) in list(running.items()):
+                    if now - started >= page_deadline:
+                        del running[future]
+                        broken = True
+                        logger.warning(f"⏱️ OCR timed out on page {page_num + 1} after {page_deadline:.0f} seconds")
+
+                if broken:
+                    # A running page cannot be cancelled: replace the workers and requeue the pages they held
+                    queued = sorted(retry + [page_num for page_num, _ in running.values()]) + queued
+                    running.clear()
+                    _terminate_pool(executor)
+                    if queued:
+                        logger.info(f"🔄 Restarting the OCR pool for the remaining {len(queued)} pages")
+                    executor = ProcessPoolExecutor(max_workers=pool_size)
+        finally:
+            if running:
+                _terminate_pool(executor)
+            else:
+                executor.shutdown(wait=True)
+
+        results = dict(sorted(results.items()))
+        logger.info(f"✅ OCR completed for {len(results)}/{len(pages)} pages")
+        return results
@@ -0,0 +1,150 @@
+# src/greenwashing_detector/tools/page_stream.py
+
+import re
+import logging
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+from .framework_scanner import TermScanner
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEPARATORS = ["\n\n", "\n", ".", " "]
+
+# Text is only split once this many chunks' worth is buffered, so chunk boundaries
+# match what splitting the whole document would produce
+STREAM_BUFFER_CHUNKS = 4
+
+# A paragraph still open after this many characters (e.g. page text without blank
+# lines) is cut at its last line break, so the paragraph buffer stays bounded
+MAX_PARAGRAPH_CHARS = 10000
+
+_NUMBERED_HEADER = re.compile(r'^\d+(\.\d+)*\.?\s+[A-Z]')
+
+def detect_page_headers(text: str, max_length: int = 80) -> List[str]:
+    """
+    Detect likely section headers on a page: numbered headings and short all-caps or title-case lines.
+
+    Args:
+        text: Page text
+        max_length: Longest line still considered a header
+
+    Returns:
+        Header lines in page order
+    """
+    headers = []
+    for line in text.split('\n'):
+        line = line.strip()
+        if len(line) < 3 or len(line) > max_length or line.endswith(('.', ',', ';', ':')):
+            continue
+        if not any(c.isalpha() for c in line):
+            continue
+        if _NUMBERED_HEADER.match(line) or line.isupper() or line.istitle():
+            headers.append(line)
+    return headers
+
+def stream_text_chunks(texts: Iterable[str], chunk_size: int, chunk_overlap: int,
+                       separators: Optional[List[str]] = None, max_chunks: Optional[int] = None,
+                       joiner: str = "\n") -> Iterator[str]:
+    """
+    Chunk a stream of texts with RecursiveCharacterTextSplitter without joining them all first.
+
+    Texts are buffered until a few chunks' worth is available, the buffer is split, and
+    every chunk but the last is yielded. The last (possibly incomplete) chunk becomes the
+    start of the next buffer, which also carries the overlap across the boundary.
+
+    Args:
+        texts: Texts in document order, e.g. page texts
+        chunk_size: Maximum chunk size in characters
+        chunk_overlap: Overlap between consecutive chunks in characters
+        separators: Splitter separators (paragraph, line, sentence, word by default)
+        max_chunks: Stop after this many chunks; the rest of the stream is never consumed
+        joiner: Appended after each text, matching how the full document text is built
+
+    Returns:
+        Iterator of chunks in document order
+    """
+    splitter = RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        separators=separators or DEFAULT_SEPARATORS
+    )
+    flush_size = chunk_size * STREAM_BUFFER_CHUNKS
+    emitted = 0
+    buffer = ""
+
+    for text in texts:
+        buffer += text + joiner
+        if len(buffer) < flush_size:
+            continue
+
+        chunks = splitter.split_text(buffer)
+        for chunk in chunks[:-1]:
+            yield chunk
+            emitted += 1
+            if max_chunks is not None and emitted >= max_chunks:
+                return
+        buffer = chunks[-1] if chunks else ""
+
+    for chunk in splitter.split_text(buffer) if buffer.strip() else []:
+        yield chunk
+        emitted += 1
+        if max_chunks is not None and emitted >= max_chunks:
+            return
+
+def stream_paragraphs(texts: Iterable[str], joiner: str = "\n",
+                      max_chars: int = MAX_PARAGRAPH_CHARS) -> Iterator[str]:
+    """
+    Yield paragraphs (blank-line separated) from a stream of page texts.
+
+    Paragraphs that run across a page boundary are yielded once, complete, exactly as
+    splitting the joined document text on blank lines would produce them, except that
+    a paragraph longer than `max_chars` is cut at its last line break before the limit.
+    Only newly arrived text is searched for paragraph breaks, so each page is scanned once.
+    """
+    pieces: List[str] = []
+    size = 0
+    tail = ""
+    for text in texts:
+        text += joiner
+        # A blank line can also straddle the end of the previous text and the start of this one
+        if '\n\n' not in tail[-1:] + text:
+            pieces.append(text)
+            size += len(text)
+            tail = text
+            while size >= max_chars:
+                buffer = "".join(pieces)
+                cut = buffer.rfind('\n', 0, max_chars)
+                cut = cut if cut > 0 else max_chars
+                yield buffer[:cut]
+                rest = buffer[cut + 1:] if buffer[cut:cut + 1] == '\n' else buffer[cut:]
+                pieces, size = [rest], len(rest)
+            continue
+        paragraphs = ("".join(pieces) + text).split('\n\n')
+        rest = paragraphs.pop()
+        yield from paragraphs
+        pieces, size, tail = [rest], len(rest), rest
+    yield "".join(pieces)
+
+def count_keyword_matches(text: str, scanner: TermScanner) -> int:
+    """Count how many distinct keywords of a scanner occur in a text, in one pass."""
+    return len(scanner.found_terms(text))
+
+def scan_framework_keywords(pages: Iterable[Dict[str, Any]], scanner: TermScanner,
+                            min_matches: int = 1) -> Iterator[Tuple[Dict[str, Any], int]]:
+    """
+    Scan a page stream for framework keywords as pages are extracted.
+
+    Args:
+        pages: Page records as yielded by PDFDocument.iter_pages
+        scanner: Scanner compiled from the keywords to look for
+        min_matches: Minimum number of distinct keywords for a page to be reported
+
+    Returns:
+        Iterator of (page record, number of keywords matched) for matching pages
+    """
+    for record in pages:
+        matches = count_keyword_matches(record["text"], scanner)
+        if matches >= min_matches:
+            yield record, matches
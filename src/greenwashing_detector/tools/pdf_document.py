@@ -0,0 +1,477 @@
+# src/greenwashing_detector/tools/pdf_document.py
+
+import os
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+import fitz  # PyMuPDF
+from .boilerplate import BoilerplateDetector, sample_page_numbers
+from .extraction_cache import EXTRACTOR_VERSION, ExtractionCache, get_extraction_cache
+from .page_stream import detect_page_headers
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Pages with less extractable text than this are treated as scanned images and OCR'd
+OCR_MIN_TEXT_CHARS = 100
+
+# Multi-process extraction only pays off once process start-up is amortised over enough pages
+PARALLEL_EXTRACTION_MIN_PAGES = 40
+
+def default_extraction_workers() -> int:
+    """Worker count for page extraction, overridable with PDF_EXTRACTION_WORKERS."""
+    configured = os.getenv("PDF_EXTRACTION_WORKERS")
+    if configured:
+        try:
+            return max(1, int(configured))
+        except ValueError:
+            logger.warning(f"⚠️ Invalid PDF_EXTRACTION_WORKERS value: {configured}")
+    return min(4, os.cpu_count() or 1)
+
+def split_page_ranges(page_numbers: List[int], parts: int) -> List[Tuple[int, int]]:
+    """Split sorted page numbers into at most `parts` contiguous [start, end) ranges."""
+    ranges = []
+    if not page_numbers:
+        return ranges
+    size = -(-len(page_numbers) // max(1, parts))  # ceiling division
+    for i in range(0, len(page_numbers), size):
+        batch = page_numbers[i:i + size]
+        ranges.append((batch[0], batch[-1] + 1))
+    return ranges
+
+def _extract_page_range(file_path: str, start: int, end: int) -> List[str]:
+    """Worker entry point: open the PDF in this process and extract pages [start, end)."""
+    doc = fitz.open(file_path)
+    try:
+        return [doc[page_num].get_text() for page_num in range(start, end)]
+    finally:
+        doc.close()
+
+class PDFDocument:
+    """
+    Per-run view of a PDF report that parses each page only once.
+
+    Page text, layout blocks, the embedded TOC and document metadata are extracted
+    lazily on first access and cached, so every reader, chunker and tool working on
+    the same report shares a single parse of the file.
+
+    When an extraction cache is available, results from earlier runs on the same file
+    content are loaded up front and the PDF itself is only opened if something that
+    was not cached (e.g. a page render) is requested.
+    """
+
+    def __init__(self, file_path: str, workers: Optional[int] = None,
+                 cache: Optional[ExtractionCache] = None, use_cache: bool = True):
+        self.file_path = file_path
+        self.workers = workers if workers is not None else default_extraction_workers()
+        self._doc = None
+        self._mtime = os.path.getmtime(file_path)
+        self._page_text: Dict[int, str] = {}
+        self._page_layout: Dict[int, List[tuple]] = {}
+        self._toc: Optional[List[list]] = None
+        self._full_text: Optional[str] = None
+        self._clean_full_text: Optional[str] = None
+        # Running headers, footers and other lines repeated across pages, stripped before chunking
+        self.strip_repeated_lines = os.getenv("PDF_STRIP_BOILERPLATE", "1").lower() not in ("0", "false", "no")
+        self._boilerplate: Optional[BoilerplateDetector] = None
+        self._boilerplate_stats: Optional[Dict[str, int]] = None
+        self.page_count = 0
+        self.metadata: Dict[str, str] = {}
+        # OCR output per page for the selected OCR settings (see use_ocr_settings), and derived
+        # results (TOC entries, framework sections) shared by chunkers
+        self.ocr_settings: Optional[str] = None
+        self._ocr_by_settings: Dict[str, Dict[int, str]] = {}
+        self.ocr_text: Dict[int, str] = {}
+        self.artifacts: Dict[str, Any] = {}
+        # Final text per page after the OCR fallback, shared by every chunking pass
+        self._resolved_text: Dict[int, str] = {}
+        # Counters proving each page is parsed and OCR'd at most once per document
+        self.text_extractions: Dict[int, int] = {}
+        self.ocr_runs: Dict[int, int] = {}
+        self._ocr_failed = set()
+        self.counters: Dict[str, int] = {"page_text_hits": 0, "ocr_hits": 0, "resolved_text_hits": 0}
+
+        self._cache = (cache or get_extraction_cache()) if use_cache else None
+        self._cache_key: Optional[str] = None
+        self._cached_snapshot: Optional[tuple] = None
+        if self._cache is not None and self._load_from_cache():
+            logger.info(f"📦 Loaded extraction results from cache: {file_path} ({self.page_count} pages)")
+        else:
+            self.page_count = len(self.doc)
+            self.metadata = dict(self.doc.metadata or {})
+            logger.info(f"📄 Opened PDF document: {file_path} ({self.page_count} pages)")
+
+    @property
+    def doc(self):
+        """The underlying PyMuPDF document, opened on first use."""
+        if self._doc is None:
+            self._doc = fitz.open(self.file_path)
+        return self._doc
+
+    def __len__(self) -> int:
+        return self.page_count
+
+    def __getitem__(self, page_num: int):
+        """Return the underlying PyMuPDF page (needed for rendering, e.g. OCR)."""
+        return self.doc[page_num]
+
+    def page_text(self, page_num: int) -> str:
+        """Return the extracted text of a page (0-based), parsing it on first access."""
+        text = self._page_text.get(page_num)
+        if text is None:
+            text = self.doc[page_num].get_text()
+            self._page_text[page_num] = text
+            self.text_extractions[page_num] = self.text_extractions.get(page_num, 0) + 1
+        else:
+            self.counters["page_text_hits"] += 1
+        return text
+
+    def use_ocr_settings(self, settings: str):
+        """
+        Serve the OCR text produced with these OCR settings (see OCREngine.settings_key).
+
+        OCR text is stored per settings, so a run with another resolution or language
+        pack OCRs the pages again instead of reusing text recognised differently. OCR
+        text recorded before any settings are selected is not persisted.
+        """
+        if settings == self.ocr_settings:
+            return
+        self.ocr_settings = settings
+        self.ocr_text = self._ocr_by_settings.setdefault(settings, {})
+        self._ocr_failed = set()
+        self._resolved_text = {}
+
+    def page_text_with_ocr(self, page_num: int, ocr_func: Callable[[Any], str],
+                           min_chars: int = OCR_MIN_TEXT_CHARS) -> str:
+        """
+        Return the best text for a page, falling back to OCR for image-only pages.
+
+        The result is memoized, so however many passes ask for a page it is extracted
+        once and OCR'd at most once per document (OCR output is also persisted to the
+        extraction cache).
+
+        Args:
+            page_num: 0-based page number
+            ocr_func: Callable taking a PyMuPDF page and returning its OCR text
+            min_chars: Pages with less extracted text than this are OCR'd
+
+        Returns:
+            The regular text, or the OCR text if it recovered more content
+        """
+        resolved = self._resolved_text.get(page_num)
+        if resolved is not None:
+            self.counters["resolved_text_hits"] += 1
+            return resolved
+        
+        text = self.page_text(page_num)
+        if len(text.strip()) < min_chars:
+            ocr_text = self.ocr_text.get(page_num)
+            if ocr_text is not None:
+                self.counters["ocr_hits"] += 1
+            elif page_num in self._ocr_failed:
+                ocr_text = ""
+            else:
+                try:
+                    ocr_text = ocr_func(self.doc[page_num])
+                    self.ocr_text[page_num] = ocr_text
+                except Exception as e:
+                    logger.warning(f"OCR failed: {e}")
+                    ocr_text = ""
+                self.ocr_runs[page_num] = self.ocr_runs.get(page_num, 0) + 1
+            
+            if len(ocr_text.strip()) > len(text.strip()):
+                logger.info(f"OCR extracted {len(ocr_text)} chars vs {len(text)} chars from regular extraction")
+                text = ocr_text
+        
+        self._resolved_text[page_num] = text
+        return text
+
+    def iter_pages(self, ocr_func: Optional[Callable[[Any], str]] = None, start: int = 0,
+                   end: Optional[int] = None, retain: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Yield one record per page as it is extracted, instead of building the whole document text.
+
+        Each record is a dict with the 1-based `page` number, its `text`, an `ocr` flag set
+        when the text came from OCR, and the `headers` detected on the page. Consumers can
+        stop iterating at any point and the remaining pages are never parsed.
+
+        Args:
+            ocr_func: Optional OCR callable used for image-only pages (see page_text_with_ocr)
+            start: First 0-based page to yield
+            end: Page to stop before (defaults to the page count)
+            retain: Keep newly parsed pages in the page-text store; pass False for a single
+                streaming pass where memory should stay flat
+
+        Returns:
+            Iterator of page records in page order
+        """
+        end = self.page_count if end is None else min(end, self.page_count)
+        for page_num in range(start, end):
+            if ocr_func is not None:
+                text = self.page_text_with_ocr(page_num, ocr_func)
+            elif retain or page_num in self._page_text:
+                text = self.page_text(page_num)
+            else:
+                text = self.doc[page_num].get_text()
+                self.text_extractions[page_num] = self.text_extractions.get(page_num, 0) + 1
+            yield {
+                "page": page_num + 1,
+                "text": text,
+                "ocr": page_num in self.ocr_text and text == self.ocr_text[page_num],
+                "headers": detect_page_headers(text)
+            }
+
+    def prefetch_ocr(self, page_numbers: List[int], ocr_engine, min_chars: int = OCR_MIN_TEXT_CHARS) -> int:
+        """
+        OCR the scanned pages among `page_numbers` concurrently, ahead of the passes that read them.
+
+        Args:
+            page_numbers: 0-based candidate page numbers
+            ocr_engine: OCREngine used to render and OCR the pages on its process pool
+            min_chars: Pages with less extracted text than this are OCR'd
+
+        Returns:
+            Number of pages OCR'd successfully
+        """
+        self.use_ocr_settings(ocr_engine.settings_key)
+        pending = [
+            page_num for page_num in sorted(set(page_numbers))
+            if 0 <= page_num < self.page_count
+            and page_num not in self.ocr_text
+            and page_num not in self._ocr_failed
+            and page_num not in self._resolved_text
+            and len(self.page_text(page_num).strip()) < min_chars
+        ]
+        if len(pending) < 2:
+            return 0  # a single page is cheaper to OCR inline
+        
+        results = ocr_engine.ocr_pages(self.file_path, pending)
+        for page_num in pending:
+            self.ocr_runs[page_num] = self.ocr_runs.get(page_num, 0) + 1
+            if page_num in results:
+                self.ocr_text[page_num] = results[page_num]
+            else:
+                self._ocr_failed.add(page_num)
+        return len(results)
+
+    def extraction_stats(self) -> Dict[str, int]:
+        """Summarize how often pages were parsed and OCR'd versus served from the store."""
+        return {
+            "pages": self.page_count,
+            "pages_extracted": len(self.text_extractions),
+            "max_extractions_per_page": max(self.text_extractions.values(), default=0),
+            "pages_ocrd": len(self.ocr_runs),
+            "max_ocr_runs_per_page": max(self.ocr_runs.values(), default=0),
+            **self.counters
+        }
+
+    def page_layout(self, page_num: int) -> List[tuple]:
+        """Return the text blocks of a page as (x0, y0, x1, y1, text, block_no, block_type) tuples."""
+        blocks = self._page_layout.get(page_num)
+        if blocks is None:
+            blocks = self.doc[page_num].get_text("blocks")
+            self._page_layout[page_num] = blocks
+        return blocks
+
+    def extract_all_pages(self, workers: Optional[int] = None) -> List[str]:
+        """
+        Extract every page not yet in the cache, in parallel for large documents.
+
+        The pending pages are split into contiguous page ranges, each range is parsed on
+        its own worker process, and the results are stored back in page order.
+
+        Args:
+            workers: Number of worker processes (defaults to the document's setting)
+
+        Returns:
+            List of page texts in page order
+        """
+        workers = workers if workers is not None else self.workers
+        pending = [i for i in range(self.page_count) if i not in self._page_text]
+        
+        if workers > 1 and len(pending) >= PARALLEL_EXTRACTION_MIN_PAGES:
+            ranges = split_page_ranges(pending, workers)
+            logger.info(f"⚡ Extracting {len(pending)} pages with {len(ranges)} worker processes")
+            try:
+                with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+                    futures = [
+                        (start, executor.submit(_extract_page_range, self.file_path, start, end))
+                        for start, end in ranges
+                    ]
+                    for start, future in futures:
+                        for offset, text in enumerate(future.result()):
+                            self._page_text[start + offset] = text
+                            self.text_extractions[start + offset] = self.text_extractions.get(start + offset, 0) + 1
+            except Exception as e:
+                logger.warning(f"⚠️ Parallel extraction failed, falling back to a single process: {e}")
+        
+        return [self.page_text(i) for i in range(self.page_count)]
+
+    @property
+    def full_text(self) -> str:
+        """Return the text of the whole document, one page per newline-terminated block."""
+        if self._full_text is None:
+            self.extract_all_pages()
+            self._full_text = "".join(self.page_text(i) + "\n" for i in range(self.page_count))
+        return self._full_text
+
+    def boilerplate(self) -> BoilerplateDetector:
+        """
+        Return the detector of lines repeated across this document's pages.
+
+        It is fitted once, on an even sample of pages for long documents so streaming
+        passes can strip pages before the rest of the document is extracted, and its
+        line hashes are kept in the artifacts, so the extraction cache restores them.
+        """
+        if self._boilerplate is None:
+            detector = BoilerplateDetector()
+            stored = self.artifacts.get("boilerplate")
+            if stored and stored.get("params") == detector.params:
+                detector.keys = set(stored["lines"])
+                detector.edge_keys = set(stored["edge_lines"])
+            else:
+                pages = sample_page_numbers(self.page_count, detector.sample_pages)
+                if len(pages) == self.page_count:
+                    detector.fit(self.extract_all_pages())
+                else:
+                    detector.fit(self.page_text(page_num) for page_num in pages)
+                self.artifacts["boilerplate"] = {"params": detector.params, "lines": sorted(detector.keys),
+                                                 "edge_lines": sorted(detector.edge_keys)}
+            self._boilerplate = detector
+        return self._boilerplate
+
+    def strip_boilerplate(self, text: str) -> str:
+        """Remove the document's repeated lines from a page text (unless PDF_STRIP_BOILERPLATE=0)."""
+        if not self.strip_repeated_lines:
+            return text
+        return self.boilerplate().strip(text)[0]
+
+    def boilerplate_stats(self) -> Dict[str, int]:
+        """Characters and tokens the boilerplate stripping removes from the whole document."""
+        if self._boilerplate_stats is None:
+            if self.strip_repeated_lines:
+                _, self._boilerplate_stats = self.boilerplate().strip_pages(self.extract_all_pages())
+            else:
+                self._boilerplate_stats = {"pages": self.page_count, "repeated_lines": 0, "lines_removed": 0,
+                                           "chars_removed": 0, "tokens_removed": 0}
+        return self._boilerplate_stats
+
+    @property
+    def clean_full_text(self) -> str:
+        """Return the text of the whole document without the lines repeated across pages."""
+        if self._clean_full_text is None:
+            if not self.strip_repeated_lines:
+                return self.full_text
+            pages = self.extract_all_pages()
+            self._clean_full_text = "".join(self.strip_boilerplate(text) + "\n" for text in pages)
+            stats = self.boilerplate_stats()
+            logger.info(f"🧾 Removed {stats['lines_removed']} repeated header/footer lines "
+                        f"({stats['repeated_lines']} distinct): {stats['chars_removed']:,} characters, "
+                        f"~{stats['tokens_removed']:,} tokens")
+        return self._clean_full_text
+
+    def get_toc(self) -> List[list]:
+        """Return the embedded outline as [level, title, page] entries."""
+        if self._toc is None:
+            self._toc = self.doc.get_toc()
+        return self._toc
+
+    def _snapshot(self) -> tuple:
+        ocr_pages = sum(len(texts) for texts in self._ocr_by_settings.values())
+        return (len(self._page_text), ocr_pages, self._toc is not None, tuple(sorted(self.artifacts)))
+
+    def _load_from_cache(self) -> bool:
+        """Populate the document from the extraction cache. Returns True on a hit."""
+        try:
+            self._cache_key = self._cache.key_for(self.file_path)
+            entry = self._cache.load(self._cache_key)
+        except Exception as e:
+            logger.warning(f"⚠️ Extraction cache unavailable: {e}")
+            self._cache = None
+            return False
+        if not entry or entry.get("version") != EXTRACTOR_VERSION:
+            return False
+        self.page_count = entry["page_count"]
+        self.metadata = entry.get("metadata", {})
+        self._page_text = {int(page): text for page, text in entry.get("pages", {}).items()}
+        self._ocr_by_settings = {settings: {int(page): text for page, text in texts.items()}
+                                 for settings, texts in entry.get("ocr", {}).items()}
+        self._toc = entry.get("outline")
+        self.artifacts = entry.get("artifacts", {})
+        self._cached_snapshot = self._snapshot()
+        return True
+
+    def save_to_cache(self):
+        """Persist everything extracted so far, if it changed since it was loaded."""
+        if self._cache is None:
+            return
+        if self._snapshot() == self._cached_snapshot:
+            return
+        try:
+            if self._cache_key is None:
+                self._cache_key = self._cache.key_for(self.file_path)
+            self._cache.store(self._cache_key, {
+                "version": EXTRACTOR_VERSION,
+                "file_path": os.path.abspath(self.file_path),
+                "page_count": self.page_count,
+                "metadata": self.metadata,
+                "pages": {str(page): text for page, text in self._page_text.items()},
+                "ocr": {settings: {str(page): text for page, text in texts.items()}
+                        for settings, texts in self._ocr_by_settings.items() if texts},
+                "outline": self._toc,
+                "artifacts": self.artifacts
+            })
+            self._cached_snapshot = self._snapshot()
+            logger.info(f"💾 Extraction results cached for {self.file_path}")
+        except Exception as e:
+            logger.warning(f"⚠️ Could not cache extraction results: {e}")
+
+    def is_stale(self) -> bool:
+        """Check whether the file on disk changed since it was opened."""
+        try:
+            return os.path.getmtime(self.file_path) != self._mtime
+        except OSError:
+            return True
+
+    def close(self):
+        """Release the underlying PyMuPDF handle."""
+        if self._doc is None:
+            return
+        try:
+            self._doc.close()
+            self._doc = None
+        except Exception as e:
+            logger.warning(f"⚠️ Error closing PDF document {self.file_path}: {e}")
+
+
+# Documents shared by every reader and chunker during a run, keyed by absolute path
+_open_documents: Dict[str, PDFDocument] = {}
+
+def load_pdf_document(file_path: str, workers: Optional[int] = None) -> PDFDocument:
+    """
+    Return the shared PDFDocument for a file, opening it on first use.
+
+    Args:
+        file_path: Path to the PDF file
+        workers: Extraction worker processes for a newly opened document
+
+    Returns:
+        The cached document for this run
+    """
+    key = os.path.abspath(file_path)
+    document = _open_documents.get(key)
+    if document is not None and document.is_stale():
+        document.close()
+        document = None
+    if document is None:
+        document = PDFDocument(file_path, workers=workers)
+        _open_documents[key] = document
+    return document
+
+def release_pdf_document(file_path: str):
+    """Persist, close and forget the shared document for a file at the end of a run."""
+    document = _open_documents.pop(os.path.abspath(file_path), None)
+    if document is not None:
+        document.save_to_cache()
+        document.close()
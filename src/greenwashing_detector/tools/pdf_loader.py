@@ -1,103 +1,125 @@
 # src/greenwashing_detector/tools/pdf_loader.py
 
 from crewai.tools import BaseTool
-from PyPDF2 import PdfReader
-import os
 import re
-from typing import Annotated, List, Dict, Tuple, Optional
+from typing import Annotated, Iterable, Iterator, List, Dict, Optional
+from pydantic import Field
 from langchain.text_splitter import RecursiveCharacterTextSplitter
-import fitz  # PyMuPDF
 import logging
-import pytesseract
-from PIL import Image
-import io
-import numpy as np
+from .pdf_document import PDFDocument, load_pdf_document
+from .ocr_engine import OCREngine
+from .page_stream import stream_paragraphs, stream_text_chunks, scan_framework_keywords
+from .framework_scanner import TermScanner
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Characters shared by consecutive ESG analysis chunks
+ESG_CHUNK_OVERLAP = 300
+
+# Section names that typically contain framework information
+FRAMEWORK_PARAGRAPH_SECTIONS = [
+    "about this report",
+    "reporting approach",
+    "methodology",
+    "assurance",
+    "reporting standards",
+    "framework",
+    "compliance",
+    "third-party",
+    "verification",
+    "certification",
+    "standards",
+    "guidelines",
+    "principles",
+    "scope",
+    "boundary",
+    "materiality",
+    "stakeholder",
+    "governance",
+    "disclosure",
+    "transparency"
+]
+
+# Framework-related keywords
+FRAMEWORK_PARAGRAPH_KEYWORDS = [
+    "gri", "tcfd", "sasb", "cdp", "iso", "ghg", "isae", "csrd", "esrs",
+    "ifrs", "sustainability", "esg", "reporting", "standard", "framework",
+    "accordance", "compliance", "assurance", "verification", "certification"
+]
+
+# Explicit framework mentions
+EXPLICIT_FRAMEWORKS = [
+    "global reporting initiative",
+    "task force on climate",
+    "sustainability accounting standards",
+    "carbon disclosure project",
+    "international organization for standardization",
+    "greenhouse gas protocol",
+    "international standard on assurance engagements",
+    "corporate sustainability reporting directive",
+    "european sustainability reporting standards",
+    "international financial reporting standards",
+    "GRI",
+    "TCFD",
+    "SASB",
+    "CDP",
+    "ISO",
+    "GHG Protocol",
+    "ISAE",
+    "CSR",
+    "ESRS",
+    "IFRS"
+]
+
+# One scanner for all three lists; substring matches, as a paragraph filter favours recall
+FRAMEWORK_PARAGRAPH_SCANNER = TermScanner(
+    [(term, "section") for term in FRAMEWORK_PARAGRAPH_SECTIONS] +
+    [(term, "keyword") for term in FRAMEWORK_PARAGRAPH_KEYWORDS] +
+    [(term, "framework") for term in EXPLICIT_FRAMEWORKS],
+    word_boundaries=False
+)
+
 class PDFReportReader(BaseTool):
     name: Annotated[str, "PDFReportReader"] = "PDFReportReader"
     description: Annotated[str, "Tool description"] = "Extracts and chunks raw text from a given sustainability PDF report to avoid LLM token limits."
+    extraction_workers: Annotated[Optional[int], "Worker processes for page extraction"] = Field(default=None)
+
+    def extract_full_text(self, file_path: str) -> str:
+        """Extract the full document text, splitting page ranges across worker processes."""
+        document = load_pdf_document(file_path, workers=self.extraction_workers)
+        document.extract_all_pages(workers=self.extraction_workers)
+        return document.full_text
+
+    def is_framework_paragraph(self, paragraph: str) -> bool:
+        """Check whether a paragraph is likely to contain framework information."""
+        return FRAMEWORK_PARAGRAPH_SCANNER.search(paragraph) is not None
+
+    def stream_framework_sections(self, texts: Iterable[str]) -> Iterator[str]:
+        """
+        Yield framework-relevant paragraphs from a stream of page texts as they arrive.
+        Falls back to the first few paragraphs (likely the executive summary) if none match.
+        """
+        found = False
+        opening_paragraphs = []
+        for paragraph in stream_paragraphs(texts):
+            if len(opening_paragraphs) < 5:
+                opening_paragraphs.append(paragraph)
+            if self.is_framework_paragraph(paragraph):
+                found = True
+                yield paragraph
+        if not found:
+            yield from opening_paragraphs
 
     def extract_framework_sections(self, full_text: str) -> str:
         """
         Extract sections most likely to contain framework mentions.
         These sections typically contain framework declarations and methodology.
         """
-        # Define key sections that typically contain framework information
-        framework_sections = [
-            r"about this report",
-            r"reporting approach",
-            r"methodology",
-            r"assurance",
-            r"reporting standards",
-            r"framework",
-            r"compliance",
-            r"third-party",
-            r"verification",
-            r"certification",
-            r"standards",
-            r"guidelines",
-            r"principles",
-            r"scope",
-            r"boundary",
-            r"materiality",
-            r"stakeholder",
-            r"governance",
-            r"disclosure",
-            r"transparency"
-        ]
-        
         # Split text into paragraphs
         paragraphs = full_text.split('\n\n')
-        relevant_sections = []
-        
-        for paragraph in paragraphs:
-            paragraph_lower = paragraph.lower()
-            
-            # Check if paragraph contains framework-related keywords
-            framework_keywords = [
-                "gri", "tcfd", "sasb", "cdp", "iso", "ghg", "isae", "csrd", "esrs",
-                "ifrs", "sustainability", "esg", "reporting", "standard", "framework",
-                "accordance", "compliance", "assurance", "verification", "certification"
-            ]
-            
-            # Check for section headers that might contain framework info
-            section_match = any(re.search(section, paragraph_lower) for section in framework_sections)
-            
-            # Check for framework keywords
-            keyword_match = any(keyword in paragraph_lower for keyword in framework_keywords)
-            
-            # Check for explicit framework mentions
-            explicit_frameworks = [
-                r"global reporting initiative",
-                r"task force on climate",
-                r"sustainability accounting standards",
-                r"carbon disclosure project",
-                r"international organization for standardization",
-                r"greenhouse gas protocol",
-                r"international standard on assurance engagements",
-                r"corporate sustainability reporting directive",
-                r"european sustainability reporting standards",
-                r"international financial reporting standards",
-                r"GRI",
-                r"TCFD",
-                r"SASB",
-                r"CDP",
-                r"ISO",
-                r"GHG Protocol",
-                r"ISAE",
-                r"CSR",
-                r"ESRS",
-                r"IFRS",
-            ]
-            
-            explicit_match = any(re.search(framework, paragraph_lower) for framework in explicit_frameworks)
-            
-            if section_match or keyword_match or explicit_match:
-                relevant_sections.append(paragraph)
+        relevant_sections = [paragraph for paragraph in paragraphs if self.is_framework_paragraph(paragraph)]
         
         # If we found relevant sections, return them
         if relevant_sections:
@@ -136,6 +158,38 @@ class PDFReportReader(BaseTool):
         print(f"📊 Smart chunking result: {len(result)} chars from {len(text_to_chunk)} chars input")
         return result
 
+    def smart_chunk_pdf_pages(self, file_path: str, chunk_size: int = 2000, chunk_overlap: int = 200, max_chunks: int = 3) -> str:
+        """
+        Smart chunking over the page stream: pages are parsed only until enough
+        framework-relevant content has been gathered for `max_chunks` chunks (plus a
+        sample of pages when repeated header/footer lines are stripped).
+        """
+        document = load_pdf_document(file_path, workers=self.extraction_workers)
+        relevant_chars = 0
+        
+        def counted(paragraphs: Iterable[str]) -> Iterator[str]:
+            nonlocal relevant_chars
+            for paragraph in paragraphs:
+                relevant_chars += len(paragraph)
+                yield paragraph
+        
+        page_texts = (document.strip_boilerplate(record["text"]) for record in document.iter_pages())
+        chunks = list(stream_text_chunks(counted(self.stream_framework_sections(page_texts)),
+                                         chunk_size, chunk_overlap, max_chunks=max_chunks, joiner="\n\n"))
+        
+        # If framework sections are substantial, use them
+        if relevant_chars > 1000:
+            print(f"🎯 Using smart chunking: Found {relevant_chars} chars of framework-relevant content")
+        else:
+            # Fallback to regular chunking if not enough framework content found
+            print(f"⚠️  Smart chunking fallback: Using full text ({len(document)} pages)")
+            page_texts = (document.strip_boilerplate(record["text"]) for record in document.iter_pages())
+            chunks = list(stream_text_chunks(page_texts, chunk_size, chunk_overlap, max_chunks=max_chunks))
+        
+        result = "\n\n".join(chunks)
+        print(f"📊 Smart chunking result: {len(result)} chars from {len(chunks)} chunks")
+        return result
+
     def chunk_pdf_text(self, full_text: str, chunk_size: int = 2000, chunk_overlap: int = 200, max_chunks: int = 2) -> str:
         """Legacy chunking function - now uses smart chunking by default."""
         return self.smart_chunk_pdf_text(full_text, chunk_size, chunk_overlap, max_chunks)
@@ -143,13 +197,8 @@ class PDFReportReader(BaseTool):
     def _run(self, file_path: str) -> str:
         """Implementation of the tool's functionality"""
         try:
-            reader = PdfReader(file_path)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
-            
-            # Use smart chunking for framework detection
-            chunked_text = self.smart_chunk_pdf_text(text)
+            # Use smart chunking for framework detection, streaming pages instead of joining the whole text
+            chunked_text = self.smart_chunk_pdf_pages(file_path)
             return f"PDF Text (Smart Chunked for Framework Detection):\n\n{chunked_text}"
                 
         except Exception as e:
@@ -160,7 +209,9 @@ class SmartChunkingProcessor:
     Enhanced smart chunking with OCR and TOC detection for framework detection.
     """
     
-    def __init__(self):
+    def __init__(self, ocr_engine: Optional[OCREngine] = None):
+        self.ocr_engine = ocr_engine or OCREngine()
+        
         self.framework_keywords = [
             'framework', 'standard', 'guideline', 'protocol', 'methodology',
             'reporting', 'assurance', 'certification', 'compliance', 'alignment',
@@ -179,8 +230,12 @@ class SmartChunkingProcessor:
             'assurance', 'governance', 'data', 'compliance',
             'reporting boundaries', 'basis of preparation'
         ]
+        
+        # Compiled once; every page and TOC title is then scanned in a single pass
+        self.keyword_scanner = TermScanner([(keyword, keyword) for keyword in self.framework_keywords], plurals=True)
+        self.section_scanner = TermScanner([(section, section) for section in self.framework_sections], plurals=True)
 
-    def extract_toc(self, doc) -> List[Dict]:
+    def extract_toc(self, doc: PDFDocument) -> List[Dict]:
         """
         Extract table of contents using multiple methods.
         """
@@ -188,8 +243,7 @@ class SmartChunkingProcessor:
         
         # Method 1: Look for common TOC patterns in text
         for page_num in range(min(10, len(doc))):  # Check first 10 pages
-            page = doc[page_num]
-            text = page.get_text()
+            text = doc.page_text(page_num)
             
             # Look for page numbers and section titles
             lines = text.split('\n')
@@ -233,7 +287,7 @@ class SmartChunkingProcessor:
         
         return toc_entries
 
-    def detect_framework_sections(self, doc, toc_entries: List[Dict]) -> List[Dict]:
+    def detect_framework_sections(self, doc: PDFDocument, toc_entries: List[Dict]) -> List[Dict]:
         """
         Identify sections most likely to contain framework information.
         """
@@ -244,7 +298,7 @@ class SmartChunkingProcessor:
             title_lower = entry['title'].lower()
             
             # Check if section title contains framework-related keywords
-            if any(keyword in title_lower for keyword in self.framework_sections):
+            if self.section_scanner.search(title_lower) is not None:
                 framework_sections.append({
                     'title': entry['title'],
                     'page': entry['page'],
@@ -255,14 +309,18 @@ class SmartChunkingProcessor:
         # If no TOC matches, scan text for framework sections
         if not framework_sections:
             for page_num in range(len(doc)):
-                page = doc[page_num]
-                text = page.get_text().lower()
+                text = doc.page_text(page_num).lower()
                 
-                # Look for section headers
-                lines = text.split('\n')
-                for line in lines:
-                    line = line.strip()
-                    if any(section in line for section in self.framework_sections):
+                # Look for section headers: every line holding a section name, found in one scan
+                matched_lines = set()
+                for hit in self.section_scanner.iter_hits(text):
+                    line_start = text.rfind('\n', 0, hit['start']) + 1
+                    if line_start in matched_lines:
+                        continue
+                    matched_lines.add(line_start)
+                    line_end = text.find('\n', hit['end'])
+                    line = text[line_start:line_end if line_end != -1 else len(text)].strip()
+                    if line:
                         framework_sections.append({
                             'title': line,
                             'page': page_num + 1,
@@ -272,61 +330,56 @@ class SmartChunkingProcessor:
         
         return framework_sections
 
-    def extract_text_with_ocr(self, page) -> str:
+    def extract_text_with_ocr(self, doc: PDFDocument, page_num: int) -> str:
         """
         Extract text from page using OCR if regular text extraction fails.
+        Reads from the document's shared page-text store, so each page is extracted
+        and OCR'd at most once no matter how many chunking passes request it.
         """
-        # First try regular text extraction
-        text = page.get_text()
-        
-        # If text is minimal or seems like it might be an image, use OCR
-        if len(text.strip()) < 100:  # Threshold for minimal text
-            try:
-                # Convert page to image
-                pix = page.get_pixmap()
-                img_data = pix.tobytes("png")
-                img = Image.open(io.BytesIO(img_data))
-                
-                # Use OCR to extract text
-                ocr_text = pytesseract.image_to_string(img)
-                
-                if len(ocr_text.strip()) > len(text.strip()):
-                    logger.info(f"OCR extracted {len(ocr_text)} chars vs {len(text)} chars from regular extraction")
-                    return ocr_text
-                    
-            except Exception as e:
-                logger.warning(f"OCR failed: {e}")
-        
-        return text
+        doc.use_ocr_settings(self.ocr_engine.settings_key)
+        return doc.page_text_with_ocr(page_num, self.ocr_page)
+
+    def ocr_page(self, page) -> str:
+        """Render a PyMuPDF page and run Tesseract OCR on it."""
+        return self.ocr_engine.ocr_page(page)
 
-    def create_smart_chunks(self, doc, target_chunk_size: int = 2000) -> List[str]:
+    def create_smart_chunks(self, doc: PDFDocument, target_chunk_size: int = 2000) -> List[str]:
         """
         Create intelligent chunks focused on framework-relevant content.
         """
         logger.info("🔍 Creating smart chunks with OCR and TOC detection...")
         
         # Step 1: Extract TOC
-        toc_entries = self.extract_toc(doc)
+        toc_entries = doc.artifacts.get("toc_entries")
+        if toc_entries is None:
+            toc_entries = self.extract_toc(doc)
+            doc.artifacts["toc_entries"] = toc_entries
         logger.info(f"📋 Found {len(toc_entries)} TOC entries")
         
         # Step 2: Identify framework-relevant sections
-        framework_sections = self.detect_framework_sections(doc, toc_entries)
+        framework_sections = doc.artifacts.get("framework_sections")
+        if framework_sections is None:
+            framework_sections = self.detect_framework_sections(doc, toc_entries)
+            doc.artifacts["framework_sections"] = framework_sections
         logger.info(f"🎯 Identified {len(framework_sections)} framework-relevant sections")
         
         # Step 3: Create prioritized chunks
         chunks = []
         
+        # OCR scanned section pages and the opening pages concurrently before reading them
+        doc.prefetch_ocr([section['page'] - 1 for section in framework_sections] + list(range(min(3, len(doc)))),
+                         self.ocr_engine)
+        
         # Priority 1: Framework-relevant sections
         for section in framework_sections:
             page_num = section['page'] - 1  # Convert to 0-based index
             
             if 0 <= page_num < len(doc):
-                page = doc[page_num]
-                text = self.extract_text_with_ocr(page)
+                text = self.extract_text_with_ocr(doc, page_num)
                 
                 # Create chunk with context
                 chunk = f"=== FRAMEWORK SECTION: {section['title']} (Page {section['page']}) ===\n\n"
-                chunk += text
+                chunk += doc.strip_boilerplate(text)
                 
                 if len(chunk) > target_chunk_size:
                     # Split large chunks
@@ -338,44 +391,48 @@ class SmartChunkingProcessor:
         # Priority 2: Look for framework keywords in remaining pages
         if len(chunks) < 3:  # If we don't have enough framework-specific chunks
             logger.info("🔍 Scanning remaining pages for framework keywords...")
+            doc.prefetch_ocr(list(range(len(doc))), self.ocr_engine)
             
-            for page_num in range(len(doc)):
+            for record, keyword_matches in scan_framework_keywords(doc.iter_pages(self.ocr_page),
+                                                                    self.keyword_scanner, min_matches=2):
                 # Skip pages we already processed
-                if any(f"Page {page_num + 1}" in chunk for chunk in chunks):
+                if any(f"Page {record['page']}" in chunk for chunk in chunks):
                     continue
                 
-                page = doc[page_num]
-                text = self.extract_text_with_ocr(page)
+                # Page contains at least 2 framework keywords
+                chunk = f"=== KEYWORD MATCH: Page {record['page']} ({keyword_matches} framework keywords) ===\n\n"
+                chunk += doc.strip_boilerplate(record["text"])
                 
-                # Check if page contains framework keywords
-                text_lower = text.lower()
-                keyword_matches = sum(1 for keyword in self.framework_keywords if keyword in text_lower)
-                
-                if keyword_matches >= 2:  # At least 2 framework keywords
-                    chunk = f"=== KEYWORD MATCH: Page {page_num + 1} ({keyword_matches} framework keywords) ===\n\n"
-                    chunk += text
-                    
-                    if len(chunk) > target_chunk_size:
-                        sub_chunks = self.split_chunk(chunk, target_chunk_size)
-                        chunks.extend(sub_chunks)
-                    else:
-                        chunks.append(chunk)
+                if len(chunk) > target_chunk_size:
+                    sub_chunks = self.split_chunk(chunk, target_chunk_size)
+                    chunks.extend(sub_chunks)
+                else:
+                    chunks.append(chunk)
         
         # Priority 3: Add overview/executive summary if available
         if chunks:
             # Look for executive summary or overview in first few pages
             for page_num in range(min(3, len(doc))):
-                page = doc[page_num]
-                text = self.extract_text_with_ocr(page)
+                text = self.extract_text_with_ocr(doc, page_num)
                 text_lower = text.lower()
                 
                 if any(word in text_lower for word in ['executive summary', 'overview', 'about this report']):
                     chunk = f"=== EXECUTIVE SUMMARY: Page {page_num + 1} ===\n\n"
-                    chunk += text
+                    chunk += doc.strip_boilerplate(text)
                     chunks.insert(0, chunk)  # Add at beginning
                     break
         
         logger.info(f"✅ Created {len(chunks)} smart chunks")
+        boilerplate = doc.boilerplate_stats()
+        logger.info(f"🧾 Repeated header/footer lines stripped before chunking: {boilerplate['lines_removed']} lines, "
+                    f"{boilerplate['chars_removed']:,} characters, ~{boilerplate['tokens_removed']:,} tokens")
+        stats = doc.extraction_stats()
+        logger.info(
+            f"📊 Page text store: {stats['pages_extracted']}/{stats['pages']} pages extracted "
+            f"(max {stats['max_extractions_per_page']}x per page, {stats['page_text_hits']} reuses), "
+            f"{stats['pages_ocrd']} pages OCR'd (max {stats['max_ocr_runs_per_page']}x per page, "
+            f"{stats['ocr_hits']} cached), {stats['resolved_text_hits']} repeated page reads served from the store"
+        )
         return chunks
 
     def split_chunk(self, chunk: str, target_size: int) -> List[str]:
@@ -425,8 +482,8 @@ class FrameworkPDFReader(PDFReportReader):
         try:
             logger.info(f"📄 Reading PDF with smart chunking: {file_path}")
             
-            # Open PDF
-            doc = fitz.open(file_path)
+            # Reuse the run's shared document instead of re-parsing the file
+            doc = load_pdf_document(file_path)
             logger.info(f"📊 PDF has {len(doc)} pages")
             
             # Create smart chunks
@@ -435,17 +492,13 @@ class FrameworkPDFReader(PDFReportReader):
             if not chunks:
                 logger.warning("⚠️ No smart chunks created, falling back to regular extraction")
                 # Fallback to regular text extraction
-                text = ""
-                for page in doc:
-                    text += page.get_text() + "\n"
-                return text
+                return doc.full_text
             
             # Combine chunks with clear separators
             combined_text = "\n\n" + "="*80 + "\n\n".join(chunks)
             
             logger.info(f"✅ Smart chunking completed: {len(chunks)} chunks, {len(combined_text)} characters")
             
-            doc.close()
             return combined_text
             
         except Exception as e:
@@ -458,7 +511,7 @@ class FullPDFReader(PDFReportReader):
     name: Annotated[str, "FullPDFReader"] = "FullPDFReader"
     description: Annotated[str, "Tool description"] = "Extracts and chunks full text from sustainability PDF reports for comprehensive ESG analysis, with result aggregation capabilities."
 
-    def chunk_for_esg_analysis(self, full_text: str, chunk_size: int = 3500, chunk_overlap: int = 300, max_chunks: int = 5) -> List[str]:
+    def chunk_for_esg_analysis(self, full_text: str, chunk_size: int = 3500, chunk_overlap: int = ESG_CHUNK_OVERLAP, max_chunks: int = 5) -> List[str]:
         """
         Chunk the full text for ESG analysis with larger chunks and overlap.
         Returns a list of chunks for processing.
@@ -479,26 +532,45 @@ class FullPDFReader(PDFReportReader):
         
         return limited_chunks
 
+    def stream_esg_chunks(self, file_path: str, chunk_size: int = 3500, chunk_overlap: int = ESG_CHUNK_OVERLAP,
+                          max_chunks: Optional[int] = 5) -> Iterator[str]:
+        """
+        Yield ESG analysis chunks as pages are extracted.
+        Stops parsing pages as soon as `max_chunks` chunks have been produced; stripping
+        repeated header/footer lines only parses a sample of pages up front.
+        """
+        document = load_pdf_document(file_path, workers=self.extraction_workers)
+        page_texts = (document.strip_boilerplate(record["text"]) for record in document.iter_pages())
+        yield from stream_text_chunks(page_texts, chunk_size, chunk_overlap, max_chunks=max_chunks)
+
     def _run(self, file_path: str) -> str:
         """Implementation for full text extraction with chunking for ESG analysis."""
         try:
-            reader = PdfReader(file_path)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
+            document = load_pdf_document(file_path, workers=self.extraction_workers)
+            pages = document.iter_pages()
+            
+            # Read pages only until we know whether the report needs chunking
+            page_texts = []
+            text_length = 0
+            for record in pages:
+                page_texts.append(record["text"])
+                text_length += len(record["text"]) + 1
+                if text_length > 15000:  # Rough estimate: 15K chars ≈ 4000 tokens
+                    break
             
             # Check if text is too large and needs chunking
-            if len(text) > 15000:  # Rough estimate: 15K chars ≈ 4000 tokens
-                print(f"⚠️  Large PDF detected ({len(text)} chars). Using chunking for ESG analysis.")
-                chunks = self.chunk_for_esg_analysis(text)
+            if text_length > 15000:
+                print(f"⚠️  Large PDF detected (>{text_length} chars, {len(document)} pages). Using chunking for ESG analysis.")
+                chunks = list(self.stream_esg_chunks(file_path))
                 
                 # Return the first chunk with information about total chunks
                 first_chunk = chunks[0]
-                chunk_info = f"\n\n[NOTE: This is chunk 1 of {len(chunks)}. Total PDF size: {len(text)} characters]"
+                chunk_info = f"\n\n[NOTE: This is chunk 1 of {len(chunks)}. Total PDF size: {len(document)} pages]"
                 
                 return f"PDF Text (Chunk 1 of {len(chunks)} for ESG Analysis):\n\n{first_chunk}{chunk_info}"
             else:
                 # For smaller PDFs, return full text
+                text = "".join(page_text + "\n" for page_text in page_texts)
                 return f"PDF Text (Full Report for ESG Analysis):\n\n{text}"
                 
         except Exception as e:
@@ -510,15 +582,18 @@ class ESGChunkProcessor:
     def __init__(self, pdf_reader: FullPDFReader):
         self.pdf_reader = pdf_reader
     
+    def iter_chunks(self, file_path: str) -> Iterator[str]:
+        """Yield chunks of a PDF as soon as they are available, before later pages are parsed."""
+        return self.pdf_reader.stream_esg_chunks(file_path)
+    
     def process_all_chunks(self, file_path: str) -> List[str]:
         """Process all chunks of a PDF and return results for each chunk."""
         try:
-            reader = PdfReader(file_path)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
+            chunks = list(self.iter_chunks(file_path))
             
-            chunks = self.pdf_reader.chunk_for_esg_analysis(text)
+            print(f"📄 ESG Analysis Chunking: {len(chunks)} chunks")
+            if chunks:
+                print(f"   📏 Average chunk size: {sum(len(chunk) for chunk in chunks) // len(chunks)} chars")
             return chunks
             
         except Exception as e:
@@ -1,42 +1,142 @@
 import os   
-from typing import List
-from .framework_glossary import FRAMEWORKS
+import re
+import time
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from .framework_glossary import GLOSSARY
+
+logger = logging.getLogger(__name__)
+
+# Marks a per-call variable in the static text of a compiled prompt
+_SLOT = re.compile(r'\x00(\w+)\x00')
+
+def slot(name: str) -> str:
+    """Placeholder for a per-call variable, filled in by CompiledPrompt.render()."""
+    return f"\x00{name}\x00"
+
+class CompiledPrompt:
+    """
+    A prompt whose static text is rendered once, with slots for the per-call variables.
+
+    Rendering only joins the pre-rendered pieces with the slot values, so the large
+    static parts (framework guidance, TCFD criteria, output formats) are not formatted
+    again for every chunk.
+    """
+
+    def __init__(self, text: str):
+        pieces = _SLOT.split(text)
+        self._static = tuple(pieces[0::2])
+        self.slots = tuple(pieces[1::2])
+        self.static_chars = sum(len(piece) for piece in self._static)
+
+    def render(self, **values: Any) -> str:
+        """Fill in the slots; every slot needs a value."""
+        start = time.perf_counter()
+        parts = [self._static[0]]
+        for name, static in zip(self.slots, self._static[1:]):
+            parts.append(str(values[name]))
+            parts.append(static)
+        text = "".join(parts)
+        with _compiled_prompts_lock:
+            _prompt_metrics["renders"] += 1
+            _prompt_metrics["render_seconds"] += time.perf_counter() - start
+            _prompt_metrics["rendered_chars"] += len(text)
+            _prompt_metrics["static_chars_reused"] += self.static_chars
+        return text
+
+# Compiled prompts by (prompt kind, framework set, pillar), shared by every PromptBuilder
+_compiled_prompts: Dict[Tuple[str, Tuple[str, ...], Optional[str]], CompiledPrompt] = {}
+_compiled_prompts_lock = threading.Lock()
+_prompt_metrics = {
+    "compiled": 0, "compile_seconds": 0.0, "compiled_chars": 0, "hits": 0,
+    "renders": 0, "render_seconds": 0.0, "rendered_chars": 0, "static_chars_reused": 0
+}
+
+def compile_prompt(kind: str, frameworks: Tuple[str, ...], pillar: Optional[str],
+                   build: Callable[[], str]) -> CompiledPrompt:
+    """
+    Return the compiled prompt for a kind, framework set and pillar, building it on first use.
+
+    Args:
+        kind: Prompt kind, e.g. "tcfd_pillar"
+        frameworks: Framework set the prompt is built for
+        pillar: TCFD pillar, or None
+        build: Renders the prompt text, with slot() placeholders for the per-call variables
+    """
+    key = (kind, frameworks, pillar)
+    with _compiled_prompts_lock:
+        compiled = _compiled_prompts.get(key)
+        if compiled is not None:
+            _prompt_metrics["hits"] += 1
+            return compiled
+    start = time.perf_counter()
+    compiled = CompiledPrompt(build())
+    elapsed = time.perf_counter() - start
+    with _compiled_prompts_lock:
+        if key not in _compiled_prompts:
+            _compiled_prompts[key] = compiled
+            _prompt_metrics["compiled"] += 1
+            _prompt_metrics["compile_seconds"] += elapsed
+            _prompt_metrics["compiled_chars"] += compiled.static_chars
+        return _compiled_prompts[key]
+
+def prompt_metrics() -> Dict[str, Any]:
+    """Snapshot of prompt compilation and rendering counters."""
+    with _compiled_prompts_lock:
+        return dict(_prompt_metrics)
+
+def log_prompt_metrics():
+    """Log how many prompts were compiled versus rendered from the cache, and their cost and size."""
+    metrics = prompt_metrics()
+    if not metrics["renders"]:
+        return
+    logger.info(
+        f"🧩 Prompts: {metrics['compiled']} compiled in {metrics['compile_seconds'] * 1000:.1f} ms "
+        f"({metrics['compiled_chars']:,} chars), {metrics['renders']} renders with {metrics['hits']} cache hits "
+        f"in {metrics['render_seconds'] * 1000:.1f} ms ({metrics['rendered_chars']:,} chars rendered, "
+        f"{metrics['static_chars_reused']:,} from pre-rendered text)"
+    )
 
 class PromptBuilder:
     def __init__(self, detected_frameworks: List[str]):
         self.detected_frameworks = detected_frameworks
-        self.valid_frameworks = [fw for fw in detected_frameworks if fw in FRAMEWORKS]
-        self.missing = [fw for fw in detected_frameworks if fw not in FRAMEWORKS]
+        # Names and acronyms in any case resolve to the glossary's framework keys
+        resolved = {fw: GLOSSARY.resolve(fw) for fw in detected_frameworks}
+        self.valid_frameworks = list(dict.fromkeys(key for key in resolved.values() if key))
+        self.missing = [fw for fw, key in resolved.items() if key is None]
 
     def build_claims_extraction_prompt(self) -> str:
-        parts = []
-        for fw_key in self.valid_frameworks:
-            fw = FRAMEWORKS[fw_key]
-            if 'prompt_snippets' in fw and 'claims_extraction' in fw['prompt_snippets']:
-                parts.append(f"### {fw['name']}\n{fw['prompt_snippets']['claims_extraction']}")
-        return self._finalize_prompt(parts, "ESG Claims Extraction")
+        return compile_prompt("claims_extraction", tuple(self.detected_frameworks), None,
+                              lambda: self._build_guidance_prompt("claims_extraction", "ESG Claims Extraction")).render()
 
     def build_greenwashing_analysis_prompt(self) -> str:
+        return compile_prompt("greenwashing_analysis", tuple(self.detected_frameworks), None,
+                              lambda: self._build_guidance_prompt("greenwashing_analysis", "Greenwashing Analysis")).render()
+
+    def _build_guidance_prompt(self, snippet: str, task_type: str) -> str:
         parts = []
         for fw_key in self.valid_frameworks:
-            fw = FRAMEWORKS[fw_key]
-            if 'prompt_snippets' in fw and 'greenwashing_analysis' in fw['prompt_snippets']:
-                parts.append(f"### {fw['name']}\n{fw['prompt_snippets']['greenwashing_analysis']}")
-        return self._finalize_prompt(parts, "Greenwashing Analysis")
+            fw = GLOSSARY[fw_key]
+            if 'prompt_snippets' in fw and snippet in fw['prompt_snippets']:
+                parts.append(f"### {fw['name']}\n{fw['prompt_snippets'][snippet]}")
+        return self._finalize_prompt(parts, task_type)
 
     def build_tcfd_sophisticated_prompt(self, tcfd_pillar: str = None) -> str:
         """Build sophisticated TCFD prompts based on Chatreport's approach."""
         if "TCFD" not in self.valid_frameworks:
             return "TCFD framework not detected in the report."
         
-        tcfd_framework = FRAMEWORKS["TCFD"]
+        tcfd_framework = GLOSSARY["TCFD"]
         
         if tcfd_pillar and tcfd_pillar in tcfd_framework.get("queries", {}):
             # Build specific pillar prompt
-            return self._build_tcfd_pillar_prompt(tcfd_framework, tcfd_pillar)
+            return compile_prompt("tcfd_pillar", ("TCFD",), tcfd_pillar,
+                                  lambda: self._build_tcfd_pillar_prompt(tcfd_framework, tcfd_pillar)).render()
         else:
             # Build comprehensive TCFD prompt
-            return self._build_comprehensive_tcfd_prompt(tcfd_framework)
+            return compile_prompt("tcfd_comprehensive", ("TCFD",), None,
+                                  lambda: self._build_comprehensive_tcfd_prompt(tcfd_framework)).render()
 
     def _build_tcfd_pillar_prompt(self, tcfd_framework: dict, pillar: str) -> str:
         """Build a sophisticated prompt for a specific TCFD pillar."""
@@ -145,7 +245,12 @@ Analyze the provided report content for comprehensive TCFD compliance."""
         if "TCFD" not in self.valid_frameworks:
             return "TCFD framework not detected in the report."
         
-        tcfd_framework = FRAMEWORKS["TCFD"]
+        # Only the report content changes from chunk to chunk
+        return compile_prompt("tcfd_assessment", ("TCFD",), pillar,
+                              lambda: self._build_tcfd_assessment_prompt(pillar)).render(report_content=report_content)
+
+    def _build_tcfd_assessment_prompt(self, pillar: str) -> str:
+        tcfd_framework = GLOSSARY["TCFD"]
         query = tcfd_framework["queries"][pillar]
         assessment = tcfd_framework["assessments"][pillar]
         
@@ -157,7 +262,7 @@ Analyze the provided report content for comprehensive TCFD compliance."""
 {assessment}
 
 **REPORT CONTENT TO ANALYZE**:
-{report_content}
+{slot("report_content")}
 
 **ASSESSMENT CRITERIA**:
 - Score 0-100 based on completeness and quality of disclosure
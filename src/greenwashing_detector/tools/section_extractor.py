@@ -2,7 +2,10 @@ from crewai.tools import BaseTool
 from typing import Any, Annotated
 from pydantic import Field
 import requests
+from ..llm_cache import cached_completion
 
+# Bump when the prompt below changes, so cached responses to the old prompt are not reused
+PROMPT_VERSION = "1"
 
 class RelevantSectionExtractor(BaseTool):
     name: Annotated[str, "RelevantSectionExtractor"] = "RelevantSectionExtractor"
@@ -24,10 +27,13 @@ class RelevantSectionExtractor(BaseTool):
             "temperature": 0.3
         }
 
-        try:
+        def generate() -> str:
             response = requests.post(self.model_endpoint, json=payload, timeout=90)
             response.raise_for_status()
-            return response.json()["response"].strip()
+            return response.json()["response"]
+
+        try:
+            return cached_completion(self.model, PROMPT_VERSION, prompt, {"temperature": 0.3}, generate).strip()
         except Exception as e:
             return f"❌ Error extracting relevant sections: {e}"
 
@@ -1,11 +1,23 @@
 # src/greenwashing_detector/tools/tcfd_analyzer.py
 
 from typing import Any, Annotated, Dict, List, Optional
+from collections import OrderedDict
 from crewai.tools import BaseTool
-from .prompt_builder import PromptBuilder
+from pydantic import Field
+from .prompt_builder import PromptBuilder, compile_prompt, slot
+from .framework_glossary import GLOSSARY
+from .evidence_retrieval import DEFAULT_TOP_K, MAX_EVIDENCE_TOKENS, TCFDEvidenceRetriever, format_evidence
+import hashlib
+import threading
 import json
 import re
 
+# Evidence retrievers kept per tool, keyed by the hash of the text they index
+RETRIEVER_CACHE_SIZE = 32
+
+# Passages per pillar in the comprehensive analysis, which covers all eleven pillars at once
+COMPREHENSIVE_TOP_K = 2
+
 class TCFDAnalyzerTool(BaseTool):
     """Tool for sophisticated TCFD compliance analysis using Chatreport-style prompts."""
     
@@ -16,13 +28,40 @@ class TCFDAnalyzerTool(BaseTool):
     Use this tool to analyze TCFD disclosures in sustainability reports.
     """
 
-    def __init__(self):
-        super().__init__()
+    evidence_top_k: int = Field(default=DEFAULT_TOP_K, description="Evidence passages retrieved per TCFD pillar")
+    evidence_max_tokens: int = Field(default=MAX_EVIDENCE_TOKENS, description="Token budget of one pillar's evidence")
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._prompt_builder = None
+        self._retrievers: "OrderedDict[str, TCFDEvidenceRetriever]" = OrderedDict()
+        self._retrievers_lock = threading.Lock()
 
     @property
     def prompt_builder(self):
-        """Get the prompt builder instance."""
-        return PromptBuilder(["TCFD"])
+        """Get the prompt builder instance, built once per tool."""
+        if self._prompt_builder is None:
+            self._prompt_builder = PromptBuilder(["TCFD"])
+        return self._prompt_builder
+
+    def evidence_retriever(self, report_content: str) -> TCFDEvidenceRetriever:
+        """
+        Return the evidence retriever of a text, indexing it only the first time it is seen.
+
+        Pillar calls on the same chunk (up to eleven of them) share one index.
+        """
+        key = hashlib.blake2b(report_content.encode("utf-8"), digest_size=16).hexdigest()
+        with self._retrievers_lock:
+            retriever = self._retrievers.get(key)
+            if retriever is not None:
+                self._retrievers.move_to_end(key)
+                return retriever
+        retriever = TCFDEvidenceRetriever.from_text(report_content)
+        with self._retrievers_lock:
+            self._retrievers[key] = retriever
+            while len(self._retrievers) > RETRIEVER_CACHE_SIZE:
+                self._retrievers.popitem(last=False)
+        return retriever
 
     def _run(self, 
              report_content: str, 
@@ -50,20 +89,37 @@ class TCFDAnalyzerTool(BaseTool):
 
     def _analyze_tcfd_pillar(self, report_content: str, pillar: str) -> str:
         """Analyze a specific TCFD pillar."""
-        prompt = self.prompt_builder.build_tcfd_sophisticated_prompt(pillar)
+        # Only the passages relevant to this pillar go to the LLM, not the whole chunk
+        passages = self.evidence_retriever(report_content).evidence(pillar, self.evidence_top_k,
+                                                                    self.evidence_max_tokens)
         
         # For now, return the prompt structure - in actual implementation,
         # this would be sent to an LLM for analysis
+        analysis = compile_prompt("tcfd_pillar_analysis", ("TCFD",), pillar,
+                                  lambda: self._build_pillar_analysis(pillar))
+        return analysis.render(
+            report_length=len(report_content),
+            evidence_count=len(passages),
+            evidence_tokens=sum(passage["tokens"] for passage in passages),
+            evidence=format_evidence(passages)
+        )
+
+    def _build_pillar_analysis(self, pillar: str) -> str:
+        prompt = self.prompt_builder.build_tcfd_sophisticated_prompt(pillar)
+        
         return f"""
 **TCFD PILLAR ANALYSIS: {pillar.upper()}**
 
 **ANALYSIS PROMPT GENERATED**:
 {prompt}
 
-**REPORT CONTENT LENGTH**: {len(report_content)} characters
+**REPORT CONTENT LENGTH**: {slot("report_length")} characters
+
+**RELEVANT EVIDENCE** ({slot("evidence_count")} passages, {slot("evidence_tokens")} tokens):
+{slot("evidence")}
 
 **NEXT STEPS**:
-1. Send the prompt and report content to an LLM for analysis
+1. Send the prompt and the relevant evidence to an LLM for analysis
 2. Parse the JSON response
 3. Extract compliance score, greenwashing indicators, and missing elements
 4. Format results for display
@@ -78,6 +134,18 @@ class TCFDAnalyzerTool(BaseTool):
 
     def _analyze_comprehensive_tcfd(self, report_content: str) -> str:
         """Analyze comprehensive TCFD compliance across all pillars."""
+        evidence = self.evidence_retriever(report_content).evidence_by_pillar(
+            COMPREHENSIVE_TOP_K, self.evidence_max_tokens // 2
+        )
+        queries = GLOSSARY["TCFD"].get("queries", {})
+        evidence_text = "\n\n".join(
+            f"### {pillar.upper()}: {queries[pillar]}\n{format_evidence(passages)}"
+            for pillar, passages in evidence.items()
+        )
+        analysis = compile_prompt("tcfd_comprehensive_analysis", ("TCFD",), None, self._build_comprehensive_analysis)
+        return analysis.render(report_length=len(report_content), evidence=evidence_text)
+
+    def _build_comprehensive_analysis(self) -> str:
         prompt = self.prompt_builder.build_tcfd_sophisticated_prompt()
         
         return f"""
@@ -86,7 +154,10 @@ class TCFDAnalyzerTool(BaseTool):
 **ANALYSIS PROMPT GENERATED**:
 {prompt}
 
-**REPORT CONTENT LENGTH**: {len(report_content)} characters
+**REPORT CONTENT LENGTH**: {slot("report_length")} characters
+
+**RELEVANT EVIDENCE BY PILLAR**:
+{slot("evidence")}
 
 **ANALYSIS COVERAGE**:
 - Governance (TCFD 1-2): Board and management oversight
@@ -95,7 +166,7 @@ class TCFDAnalyzerTool(BaseTool):
 - Metrics and Targets (TCFD 9-11): KPIs and emissions disclosure
 
 **NEXT STEPS**:
-1. Send the prompt and report content to an LLM for analysis
+1. Send the prompt and the evidence for each pillar to an LLM for analysis
 2. Parse the JSON response
 3. Extract overall score and pillar-specific analysis
 4. Identify critical findings and recommendations
@@ -170,12 +241,10 @@ class TCFDAnalyzerTool(BaseTool):
 
     def get_tcfd_pillar_summary(self, pillar: str) -> str:
         """Get a summary of what a specific TCFD pillar requires."""
-        from .framework_glossary import FRAMEWORKS
-        
-        if "TCFD" not in FRAMEWORKS:
+        if "TCFD" not in GLOSSARY:
             return "TCFD framework not available."
         
-        tcfd_framework = FRAMEWORKS["TCFD"]
+        tcfd_framework = GLOSSARY["TCFD"]
         
         if pillar not in tcfd_framework.get("queries", {}):
             return f"Pillar {pillar} not found in TCFD framework."
@@ -196,12 +265,10 @@ class TCFDAnalyzerTool(BaseTool):
 
     def get_all_tcfd_pillars(self) -> List[str]:
         """Get list of all available TCFD pillars."""
-        from .framework_glossary import FRAMEWORKS
-        
-        if "TCFD" not in FRAMEWORKS:
+        if "TCFD" not in GLOSSARY:
             return []
         
-        return list(FRAMEWORKS["TCFD"].get("queries", {}).keys())
+        return list(GLOSSARY["TCFD"].get("queries", {}).keys())
 
 
 # Example usage and testing
@@ -6,6 +6,10 @@ from pydantic import Field
 import os
 import logging
 import requests
+from ..llm_cache import cached_completion
+
+# Bump when the prompt below changes, so cached responses to the old prompt are not reused
+PROMPT_VERSION = "1"
 
 class TOCExtractor(BaseTool):
     """Tool for extracting the Table of Contents or logical section headers from a report using a local LLM."""
@@ -30,10 +34,13 @@ class TOCExtractor(BaseTool):
             "temperature": self.temperature,
         }
 
-        try:
+        def generate() -> str:
             response = requests.post(self.endpoint, json=payload, timeout=30)
             response.raise_for_status()
-            output = response.json()["response"]
+            return response.json()["response"]
+
+        try:
+            output = cached_completion(self.model, PROMPT_VERSION, prompt, {"temperature": self.temperature}, generate)
             return output.strip()
 
         except Exception as e:
@@ -0,0 +1,186 @@
+# src/greenwashing_detector/tools/tokenizer.py
+
+import os
+import re
+import hashlib
+import logging
+import tempfile
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Context windows in tokens, matched by exact model name first, then by longest prefix
+MODEL_CONTEXT_WINDOWS = {
+    "gpt-3.5-turbo-0125": 16385,
+    "gpt-3.5-turbo-16k": 16385,
+    "gpt-3.5-turbo": 16385,
+    "gpt-4o-mini": 128000,
+    "gpt-4o": 128000,
+    "gpt-4-turbo": 128000,
+    "gpt-4-32k": 32768,
+    "gpt-4": 8192,
+    "ollama/llama2": 4096,
+    "ollama/llama3": 8192,
+    "ollama/mistral": 8192,
+}
+DEFAULT_CONTEXT_WINDOW = 4096
+
+# tiktoken encodings per model family; anything else is counted with cl100k_base
+MODEL_ENCODINGS = {
+    "gpt-4o": "o200k_base",
+    "gpt-4": "cl100k_base",
+    "gpt-3.5": "cl100k_base",
+}
+DEFAULT_ENCODING = "cl100k_base"
+
+# Where tiktoken publishes its BPE files; it caches each one under the SHA-1 of this URL
+TIKTOKEN_BPE_URL = "https://openaipublic.blob.core.windows.net/encodings/{encoding}.tiktoken"
+
+def context_window(model: str) -> int:
+    """Return the context window of a model in tokens (e.g. 16385 for gpt-3.5-turbo-0125)."""
+    name = model.split(":", 1)[0]  # drop Ollama tags such as ":latest"
+    if name in MODEL_CONTEXT_WINDOWS:
+        return MODEL_CONTEXT_WINDOWS[name]
+    for prefix in sorted(MODEL_CONTEXT_WINDOWS, key=len, reverse=True):
+        if name.startswith(prefix):
+            return MODEL_CONTEXT_WINDOWS[prefix]
+    logger.warning(f"⚠️ Unknown context window for {model}, assuming {DEFAULT_CONTEXT_WINDOW} tokens")
+    return DEFAULT_CONTEXT_WINDOW
+
+def encoding_for_model(model: Optional[str]) -> str:
+    """Return the tiktoken encoding name used to count tokens for a model."""
+    for prefix, encoding in MODEL_ENCODINGS.items():
+        if model and model.startswith(prefix):
+            return encoding
+    return DEFAULT_ENCODING
+
+def tiktoken_cache_path(encoding_name: str) -> Optional[str]:
+    """
+    Return where tiktoken looks for an encoding's BPE file, mirroring its own cache lookup.
+
+    Returns:
+        The cache file path, or None if tiktoken's cache is disabled (TIKTOKEN_CACHE_DIR="")
+    """
+    cache_dir = os.getenv("TIKTOKEN_CACHE_DIR", os.getenv("DATA_GYM_CACHE_DIR",
+                                                         os.path.join(tempfile.gettempdir(), "data-gym-cache")))
+    if not cache_dir:
+        return None
+    url = TIKTOKEN_BPE_URL.format(encoding=encoding_name)
+    return os.path.join(cache_dir, hashlib.sha1(url.encode()).hexdigest())
+
+class Tokenizer(ABC):
+    """
+    Minimal tokenizer interface used by the chunkers.
+
+    Tokenizers report where each token starts in the original text, so chunk
+    boundaries can be placed at exact token positions without decoding.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def token_offsets(self, text: str) -> List[int]:
+        """Return the character offset at which each token of `text` starts."""
+
+    def count(self, text: str) -> int:
+        """Return the number of tokens in `text`."""
+        return len(self.token_offsets(text))
+
+class TiktokenTokenizer(Tokenizer):
+    """
+    Exact token counts using a tiktoken encoding.
+
+    The encoding's BPE file must already be in tiktoken's cache (TIKTOKEN_CACHE_DIR,
+    see tiktoken_cache_path), so chunking never touches the network. Set
+    TIKTOKEN_ALLOW_DOWNLOAD=1 to let tiktoken fetch a missing file on first use.
+
+    Raises:
+        FileNotFoundError: If the BPE file is not cached and downloads are not allowed
+    """
+
+    def __init__(self, encoding_name: str = DEFAULT_ENCODING):
+        import tiktoken
+        cache_path = tiktoken_cache_path(encoding_name)
+        allow_download = os.getenv("TIKTOKEN_ALLOW_DOWNLOAD", "").lower() in ("1", "true", "yes")
+        if not allow_download and (cache_path is None or not os.path.exists(cache_path)):
+            raise FileNotFoundError(
+                f"{encoding_name} BPE file not cached (expected at {cache_path}); set TIKTOKEN_CACHE_DIR "
+                f"to a directory holding it, or TIKTOKEN_ALLOW_DOWNLOAD=1 to download it"
+            )
+        self.encoding = tiktoken.get_encoding(encoding_name)
+        self.name = f"tiktoken:{encoding_name}"
+
+    def count(self, text: str) -> int:
+        return len(self.encoding.encode(text, disallowed_special=()))
+
+    def token_offsets(self, text: str) -> List[int]:
+        tokens = self.encoding.encode(text, disallowed_special=())
+        _, offsets = self.encoding.decode_with_offsets(tokens)
+        return offsets
+
+class RegexTokenizer(Tokenizer):
+    """
+    Dependency-free approximation of GPT byte-pair tokenization.
+
+    Text is pre-split like cl100k_base (words with their leading space, short digit
+    runs, punctuation runs, whitespace), and long words are split into pieces of a
+    few characters. Counts are within a few percent of tiktoken on English prose and
+    err on the high side, which keeps chunks inside their budget.
+    """
+
+    name = "regex"
+
+    _PRETOKENS = re.compile(r"'(?:[sdmt]|ll|ve|re)| ?[^\W\d_]+| ?\d{1,3}| ?[^\s\w]+|\s+(?!\S)|\s+")
+    MAX_WORD_CHARS = 6
+    WORD_PIECE_CHARS = 4
+
+    def token_offsets(self, text: str) -> List[int]:
+        offsets = []
+        for match in self._PRETOKENS.finditer(text):
+            start, end = match.span()
+            if end - start <= self.MAX_WORD_CHARS:
+                offsets.append(start)
+            else:
+                offsets.extend(range(start, end, self.WORD_PIECE_CHARS))
+        return offsets
+
+
+# Tokenizer factories by name; register_tokenizer() adds local tokenizers (e.g. a Llama vocabulary)
+_tokenizer_factories: Dict[str, Callable[[Optional[str]], Tokenizer]] = {
+    "tiktoken": lambda model: TiktokenTokenizer(encoding_for_model(model)),
+    "regex": lambda model: RegexTokenizer(),
+}
+_tokenizers: Dict[tuple, Tokenizer] = {}
+
+def register_tokenizer(name: str, factory: Callable[[Optional[str]], Tokenizer]):
+    """Register a tokenizer factory taking the model name and returning a Tokenizer."""
+    _tokenizer_factories[name] = factory
+    _tokenizers.clear()
+
+def get_tokenizer(model: Optional[str] = None, name: Optional[str] = None) -> Tokenizer:
+    """
+    Return a (cached) tokenizer for a model.
+
+    Args:
+        model: Model the text is sent to, used to pick the encoding
+        name: Registered tokenizer name (env TOKENIZER, default "tiktoken")
+
+    Returns:
+        The tokenizer, falling back (with a warning) to RegexTokenizer if tiktoken or its BPE
+        files are unavailable
+    """
+    name = name or os.getenv("TOKENIZER", "tiktoken")
+    key = (name, encoding_for_model(model))
+    tokenizer = _tokenizers.get(key)
+    if tokenizer is None:
+        try:
+            tokenizer = _tokenizer_factories[name](model)
+        except Exception as e:
+            logger.warning(f"⚠️ Tokenizer '{name}' unavailable ({e}); token counts for "
+                           f"{model or 'the default model'} are approximated with the regex tokenizer")
+            tokenizer = RegexTokenizer()
+        _tokenizers[key] = tokenizer
+    return tokenizer
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Tests for token-bounded chunking: chunks stay within the token budget and end on sentence or section ends.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+pytest.importorskip("crewai")
+
+from greenwashing_detector.tools.chunking import MARKDOWN_SECTION, TokenChunker, sentence_boundaries
+from greenwashing_detector.tools.tokenizer import RegexTokenizer
+
+SENTENCES = [
+    "Scope 1 emissions fell by 12.5% against the 2019 baseline.",
+    "The board reviews climate-related risks every quarter!",
+    "Do our targets cover Scope 3 emissions from purchased goods?",
+    "Renewable electricity supplied 64% of our operations in 2023."
+]
+TEXT = " ".join(SENTENCES * 30)
+
+@pytest.fixture
+def tokenizer():
+    return RegexTokenizer()
+
+def test_chunks_never_exceed_the_token_budget(tokenizer):
+    for max_tokens in (20, 57, 120):
+        chunker = TokenChunker(max_tokens=max_tokens, tokenizer=tokenizer)
+        chunks = chunker.chunk(TEXT)
+        assert len(chunks) > 1
+        assert all(chunk["tokens"] <= max_tokens for chunk in chunks)
+        assert all(tokenizer.count(chunk["text"]) <= max_tokens for chunk in chunks)
+
+def test_chunks_cover_the_text_without_overlap(tokenizer):
+    chunks = TokenChunker(max_tokens=50, tokenizer=tokenizer).chunk(TEXT)
+    assert "".join(chunk["text"] for chunk in chunks) == TEXT
+    assert [chunk["index"] for chunk in chunks] == list(range(1, len(chunks) + 1))
+
+def test_chunks_end_on_sentence_ends(tokenizer):
+    chunks = TokenChunker(max_tokens=60, tokenizer=tokenizer).chunk(TEXT)
+    ends = set(sentence_boundaries(TEXT))
+    for chunk in chunks[:-1]:
+        assert chunk["end"] in ends
+        assert chunk["text"].rstrip()[-1] in ".!?"
+    # "12.5" is not a sentence end
+    assert not any(chunk["text"].rstrip().endswith("12.") for chunk in chunks)
+
+def test_overlap_repeats_the_end_of_the_previous_chunk(tokenizer):
+    chunks = TokenChunker(max_tokens=60, overlap_tokens=10, tokenizer=tokenizer).chunk(TEXT)
+    assert all(chunk["tokens"] <= 60 for chunk in chunks)
+    for previous, chunk in zip(chunks, chunks[1:]):
+        assert previous["start"] < chunk["start"] < previous["end"]
+
+def test_chunks_break_at_section_starts(tokenizer):
+    sections = [f"## Section {number}\n" + " ".join(SENTENCES[:2]) + "\n" for number in range(1, 7)]
+    text = "".join(sections)
+    chunks = TokenChunker(max_tokens=80, tokenizer=tokenizer).chunk(text, MARKDOWN_SECTION)
+    assert len(chunks) > 1
+    for chunk in chunks:
+        assert chunk["text"].startswith("## Section")
+        assert chunk["tokens"] <= 80
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Tests for near-duplicate paragraph removal: SimHash banding, page back-references and chunk overlaps.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+pytest.importorskip("crewai")
+
+from greenwashing_detector.tools.dedup import (
+    NearDuplicateIndex,
+    PageLocator,
+    deduplicate_paragraphs,
+    paragraph_spans,
+    simhash,
+    trim_chunk_overlaps
+)
+
+COMMITMENT = (
+    "We are committed to reducing our environmental footprint across all operations and "
+    "will continue to invest in energy efficiency programmes at every manufacturing site."
+)
+
+EMISSIONS_TABLE = "Scope 1 emissions\n1250\n1180\nScope 2 emissions\n830\n790"
+
+def test_simhash_ignores_case_punctuation_and_reflow():
+    reflowed = COMMITMENT.upper().replace(" and ", "\nand ").replace(".", "")
+    assert simhash(reflowed) == simhash(COMMITMENT)
+
+def test_simhash_keeps_edited_copies_close_and_other_text_far():
+    edited = COMMITMENT.replace("every", "each")
+    other = "Employee turnover fell in 2023 after the introduction of flexible working for office staff."
+    assert (simhash(COMMITMENT) ^ simhash(edited)).bit_count() <= 12
+    assert (simhash(COMMITMENT) ^ simhash(other)).bit_count() > 12
+
+def test_index_finds_every_fingerprint_within_max_distance():
+    index = NearDuplicateIndex(max_distance=3)
+    base = 0x0123456789ABCDEF
+    index.add(base, "base")
+    # Flipped bits spread over several bands still share at least one band with the original
+    for bits in ((0,), (0, 20), (5, 30, 60)):
+        candidate = base
+        for bit in bits:
+            candidate ^= 1 << bit
+        assert index.find(candidate) == "base"
+    assert index.find(base ^ 0b1111) is None
+
+def test_index_returns_the_closest_match():
+    index = NearDuplicateIndex(max_distance=4)
+    index.add(0b1111, "far")
+    index.add(0b0001, "near")
+    assert index.find(0b0000) == "near"
+
+def test_page_locator_maps_paragraphs_to_pages():
+    locator = PageLocator(["Intro text\nMore intro", "Scope 1 emissions rose", "Scope 1 emissions fell"])
+    assert locator.page_of("Intro text") == 1
+    assert locator.page_of("Scope 1 emissions rose\nby 4%") == 2
+    assert locator.page_of("Scope 1 emissions fell") == 3
+    # Searches restart from the beginning for paragraphs out of order
+    assert locator.page_of("More intro") == 1
+    assert locator.page_of("Not in the report") is None
+
+def test_trim_chunk_overlaps_removes_repeated_prefix():
+    chunks = ["First part of the text. Shared tail", "Shared tail and the second part.", "Unrelated third chunk."]
+    assert trim_chunk_overlaps(chunks, 20) == ["First part of the text. Shared tail", "and the second part.",
+                                               "Unrelated third chunk."]
+
+def test_paragraph_spans_keep_every_line():
+    text = f"{EMISSIONS_TABLE}\n\nPage 4 of 20\n{COMMITMENT}"
+    spans = paragraph_spans(text)
+    assert [text[start:end] for start, end in spans] == [EMISSIONS_TABLE, f"Page 4 of 20\n{COMMITMENT}"]
+
+def test_text_without_duplicates_is_unchanged():
+    text = f"{EMISSIONS_TABLE}\n\n  Page 4 of 20\n{COMMITMENT}\n\n\nEmployee turnover was 8% in 2023.\n"
+    deduplicated, stats = deduplicate_paragraphs(text)
+    assert deduplicated == text
+    assert stats["duplicates_removed"] == 0
+
+def test_duplicates_are_removed_with_a_back_reference():
+    text = f"{COMMITMENT}\n\n{EMISSIONS_TABLE}\n\n{COMMITMENT}\n\nClosing remarks."
+    deduplicated, stats = deduplicate_paragraphs(text)
+    assert deduplicated == f"{COMMITMENT}\n[Repeated 2 times in the report]\n\n{EMISSIONS_TABLE}\n\nClosing remarks."
+    assert stats["duplicates_removed"] == 1
+    assert stats["chars_removed"] == len(COMMITMENT)
+
+def test_back_references_name_the_pages():
+    pages = [COMMITMENT, "Scope 1 emissions were 1250 tCO2e.", COMMITMENT]
+    deduplicated, _ = deduplicate_paragraphs("\n\n".join(pages), locator=PageLocator(pages))
+    assert deduplicated.startswith(f"{COMMITMENT}\n[Repeated on pages 1, 3]")
+    assert deduplicated.count(COMMITMENT) == 1
+
+def test_templated_paragraphs_with_different_figures_are_kept():
+    site_a = COMMITMENT + " Site A used 1,200 MWh in 2023."
+    site_b = COMMITMENT + " Site B used 3,400 MWh in 2023."
+    text = f"{site_a}\n\n{site_b}"
+    assert deduplicate_paragraphs(text)[0] == text
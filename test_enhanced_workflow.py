@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+End-to-end test of the enhanced workflow with stubbed crews.
+Runs every stage on a generated PDF without calling an LLM, then reruns it from the checkpoints.
+"""
+
+import os
+import sys
+from contextlib import contextmanager
+
+import pytest
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+fitz = pytest.importorskip("fitz")
+pytest.importorskip("crewai")
+
+from greenwashing_detector import main as workflow
+from greenwashing_detector.crew import GreenwashingDetector
+
+REPORT_PAGES = [
+    "Sustainability Report 2024\n\n"
+    "This report has been prepared in accordance with the GRI Standards. The GRI content index "
+    "on page 3 lists the GRI 305 emissions and GRI 401 employment disclosures.",
+    "Our Scope 1 emissions fell to 12,300 tCO2e and Scope 2 emissions to 4,100 tCO2e (GRI 305-1, GRI 305-2). "
+    "We are committed to becoming carbon neutral by 2030 through renewable electricity purchases.",
+    "GRI Content Index\n\nGRI 305-1 Direct (Scope 1) GHG emissions, page 2\n"
+    "GRI 401-1 New employee hires and employee turnover, page 3. Employee turnover was 8% in 2024."
+]
+
+class StubCrew:
+    """Stands in for a pooled crew and records the inputs of every kickoff."""
+
+    def __init__(self, name: str, kickoffs: list):
+        self.name = name
+        self.kickoffs = kickoffs
+
+    def kickoff(self, inputs: dict) -> str:
+        self.kickoffs.append((self.name, inputs))
+        if self.name == "esg_analysis":
+            return "ESG Claims Investigator: claim 1 - carbon neutral by 2030 (page 2)"
+        return f"{self.name} result: the carbon neutral claim lacks a transition plan (possible greenwashing)"
+
+@pytest.fixture
+def report_pdf(tmp_path):
+    path = tmp_path / "sample_report.pdf"
+    document = fitz.open()
+    for text in REPORT_PAGES:
+        document.new_page().insert_textbox(fitz.Rect(50, 50, 550, 800), text, fontsize=11)
+    document.save(str(path))
+    document.close()
+    return str(path)
+
+@pytest.fixture
+def kickoffs(tmp_path, monkeypatch):
+    """Run in a scratch directory with local stages only and every crew stubbed."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("FRAMEWORK_DETECTION_MODE", "rules")
+    monkeypatch.setenv("FLUFF_REMOVAL_MODE", "local")
+    monkeypatch.setenv("LLM_CACHE_MODE", "off")
+    monkeypatch.setenv("KNOWLEDGE_CACHE_DIR", str(tmp_path / "knowledge_cache"))
+    monkeypatch.setenv("EXTRACTION_CACHE_DISABLED", "1")
+    recorded = []
+
+    @contextmanager
+    def pooled_crew(self, name):
+        yield StubCrew(name, recorded)
+
+    monkeypatch.setattr(GreenwashingDetector, "pooled_crew", pooled_crew)
+    return recorded
+
+def test_enhanced_workflow_runs_end_to_end(report_pdf, kickoffs, tmp_path):
+    run_dir = str(tmp_path / "run")
+    result = workflow.run_enhanced_greenwashing_workflow(report_pdf, workers=2, run_dir=run_dir)
+
+    assert "## Framework Detection (Ollama)" in result
+    assert "GRI" in result
+    assert "carbon neutral by 2030" in result
+    assert "claims_validation result" in result
+
+    stages = [name for name, _ in kickoffs]
+    assert "esg_analysis" in stages and "claims_validation" in stages
+    assert not any(name.startswith("tcfd") for name in stages)
+    # The fluff-cleaned report text reaches the analysis crews
+    esg_inputs = next(inputs for name, inputs in kickoffs if name == "esg_analysis")
+    assert "Scope 1 emissions" in esg_inputs["esg_content"]
+
+    # The workflow summary records the cleaned content of the fluff stage
+    summary_path = tmp_path / "output" / "enhanced_workflow_summary.md"
+    assert summary_path.exists()
+    assert "Scope 1 emissions" in summary_path.read_text(encoding="utf-8")
+
+def test_enhanced_workflow_resumes_from_checkpoints(report_pdf, kickoffs, tmp_path):
+    run_dir = str(tmp_path / "run")
+    first = workflow.run_enhanced_greenwashing_workflow(report_pdf, workers=1, run_dir=run_dir)
+    assert kickoffs
+
+    kickoffs.clear()
+    second = workflow.run_enhanced_greenwashing_workflow(report_pdf, workers=1, run_dir=run_dir)
+
+    assert kickoffs == []
+    assert second.split("## Processing Summary")[0] == first.split("## Processing Summary")[0]
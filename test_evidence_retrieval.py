@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests for TCFD evidence retrieval: passage building, BM25 ranking and the pillar queries.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+pytest.importorskip("crewai")
+
+from greenwashing_detector.tools.evidence_retrieval import (
+    QUESTION_WEIGHT,
+    BM25Index,
+    TCFDEvidenceRetriever,
+    build_passages,
+    pillar_query,
+    tokenize
+)
+
+@pytest.fixture(autouse=True)
+def knowledge_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("KNOWLEDGE_CACHE_DIR", str(tmp_path / "knowledge_cache"))
+
+METRICS_TABLE = (
+    "Climate-related metrics\n"
+    "GHG emissions (tCO2e)\n2022\n2023\n"
+    "Scope 1\n1250\n1180\n"
+    "Scope 2\n830\n790"
+)
+
+def test_tokenize_drops_stopwords_and_folds_plurals():
+    assert tokenize("The risks and opportunities of our Metrics") == ["risk", "opportunity", "metric"]
+
+def test_bm25_ranks_matching_documents_and_skips_the_rest():
+    index = BM25Index([
+        "Board oversight of climate risk.",
+        "Scope 1 emissions metrics and targets, emissions fell.",
+        "Our people and culture."
+    ])
+    results = index.search({"emission": 1.0, "target": 1.0}, top_k=5)
+    assert [doc_id for doc_id, _ in results] == [1]
+    assert results[0][1] > 0
+
+def test_bm25_weights_rare_terms_higher():
+    index = BM25Index(["climate risk", "climate strategy", "climate scenario analysis"])
+    assert index.idf["scenario"] > index.idf["climate"]
+    assert index.search({"climate": 1.0, "scenario": 1.0}, top_k=1)[0][0] == 2
+
+def test_pillar_query_weights_the_question_above_the_criteria():
+    query = pillar_query("tcfd_9")
+    assert query["metric"] == QUESTION_WEIGHT
+    assert query["measure"] == 1.0
+    assert pillar_query("tcfd_99") == {}
+
+def test_passages_keep_table_figures_and_line_breaks():
+    passages = build_passages([(7, METRICS_TABLE + "\n\nPage 7 of 80")])
+    assert passages[0]["page"] == 7
+    assert METRICS_TABLE in passages[0]["text"]
+    assert "1180\nScope 2" in passages[0]["text"]
+
+def test_passages_respect_max_chars_and_segments():
+    paragraph = "Emissions fell again this year across every site we operate."
+    passages = build_passages([(1, "\n\n".join([paragraph] * 4)), (2, paragraph)], max_chars=130)
+    assert [passage["page"] for passage in passages] == [1, 1, 2]
+    assert all(len(passage["text"]) <= 130 for passage in passages)
+
+def test_metrics_pillar_retrieves_the_figures_with_their_page():
+    text = (
+        "=== KEYWORD MATCH: Page 3 (2 framework keywords) ===\n"
+        "The board oversees climate-related issues through its audit committee.\n"
+        "=== KEYWORD MATCH: Page 9 (4 framework keywords) ===\n"
+        "We use the following metrics to assess climate-related risks and opportunities.\n"
+        + METRICS_TABLE
+    )
+    evidence = TCFDEvidenceRetriever.from_text(text).evidence("tcfd_9", top_k=1, model="llama3")
+    assert evidence[0]["page"] == 9
+    assert "1250\n1180" in evidence[0]["text"]
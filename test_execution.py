@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-provider LLM limits: concurrency cap per crew, requests-per-minute spacing per request.
+"""
+
+import os
+import sys
+import time
+
+import pytest
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+pytest.importorskip("crewai")
+
+from crewai import LLM
+
+from greenwashing_detector.execution import RateLimiter
+from greenwashing_detector.llm_cache import MODE_READ_WRITE, CachedLLM, LLMResponseCache
+
+def test_wait_spaces_request_starts():
+    limiter = RateLimiter("openai", rpm=600, concurrent=4)
+    start = time.monotonic()
+    for _ in range(3):
+        limiter.wait()
+    assert time.monotonic() - start >= 0.19
+
+def test_concurrency_slot_does_not_spend_the_quota():
+    limiter = RateLimiter("openai", rpm=1, concurrent=1)
+    start = time.monotonic()
+    for _ in range(3):
+        with limiter:
+            pass
+    assert time.monotonic() - start < 1
+
+@pytest.fixture
+def requests(monkeypatch):
+    sent = []
+    monkeypatch.setattr(LLM, "call", lambda self, messages, *args, **kwargs: sent.append(messages) or "response")
+    return sent
+
+def test_every_request_waits_for_the_limiter(requests, monkeypatch):
+    llm = CachedLLM(model="ollama/llama3")
+    waits = []
+    monkeypatch.setattr(llm.rate_limiter, "wait", lambda: waits.append(1))
+    llm.call("first")
+    llm.call("second")
+    assert len(requests) == 2 and len(waits) == 2
+
+def test_cache_hits_do_not_wait(requests, monkeypatch, tmp_path):
+    cache = LLMResponseCache(path=str(tmp_path / "responses.sqlite3"), mode=MODE_READ_WRITE)
+    llm = CachedLLM(model="ollama/llama3", response_cache=cache)
+    waits = []
+    monkeypatch.setattr(llm.rate_limiter, "wait", lambda: waits.append(1))
+    assert llm.call("same prompt") == llm.call("same prompt") == "response"
+    assert len(requests) == 1 and len(waits) == 1
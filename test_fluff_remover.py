@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Tests for the local fluff-removal engine: layout artifacts are removed, report data is kept.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+pytest.importorskip("crewai")
+
+from greenwashing_detector.tools.fluff_remover import (
+    DROP,
+    KEEP,
+    FluffRemover,
+    is_layout_artifact,
+    split_paragraphs
+)
+
+# An emissions table as PyMuPDF extracts it: one cell per line
+EMISSIONS_TABLE = (
+    "GHG emissions (tCO2e)\n2022\n2023\n"
+    "Scope 1\n1250\n1180\n"
+    "Scope 2\n830\n790\n"
+    "Water withdrawal (megalitres)\n412\n398\n"
+)
+
+def test_table_figures_survive_fluff_removal():
+    cleaned = FluffRemover().remove_fluff(EMISSIONS_TABLE, ["GRI"])["text"]
+    for figure in ("2022", "2023", "1250", "1180", "830", "790", "412", "398"):
+        assert figure in cleaned.split("\n")
+    assert cleaned == EMISSIONS_TABLE.strip()
+
+def test_table_figures_count_toward_keeping_a_paragraph():
+    decision, _ = FluffRemover().classify_paragraph(
+        "Energy consumption\n2022\n2023\nElectricity\n1250\n1180\nGas\n830\n790", ["GRI"]
+    )
+    assert decision == KEEP
+
+def test_only_page_number_forms_are_layout_artifacts():
+    for line in ("Page 12", "page 3 of 40", "12 of 80", "Annual Report ........ 14", "© 2024 Acme plc",
+                 "www.example.com", "* * *"):
+        assert is_layout_artifact(line), line
+    for line in ("12", "2023", "1,250", "830", "Scope 1"):
+        assert not is_layout_artifact(line), line
+
+def test_split_paragraphs_keeps_bare_numbers():
+    paragraphs, artifacts = split_paragraphs("Scope 1 emissions\n1250\n1180\nPage 4 of 20\n\nNext paragraph.")
+    assert paragraphs == [["Scope 1 emissions", "1250", "1180"], ["Next paragraph."]]
+    assert artifacts == 1
+
+def test_promotional_paragraphs_are_dropped():
+    decision, _ = FluffRemover().classify_paragraph("We are proud of our heritage.", ["GRI"])
+    assert decision == DROP
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Tests for reading the framework detector's output into a FrameworkDetectionResult.
+"""
+
+import logging
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+pytest.importorskip("crewai")
+
+from greenwashing_detector.tools.framework_result import (
+    DetectedFramework,
+    EvidenceSpan,
+    FrameworkDetectionResult
+)
+
+def test_structured_output_is_used_with_short_names():
+    structured = FrameworkDetectionResult(frameworks=[
+        DetectedFramework(name="GRI Standards", role="primary", confidence=95,
+                          evidence=[EvidenceSpan(text="prepared in accordance with the GRI Standards")]),
+        DetectedFramework(name="Task Force on Climate-related Financial Disclosures", role="secondary", confidence=80)
+    ], raw="ignored")
+    result = FrameworkDetectionResult.from_llm_output(SimpleNamespace(pydantic=structured, raw="{}"))
+    assert result.framework_names == ["GRI", "TCFD"]
+    assert result.method == "llm"
+    assert result.raw == result.to_markdown()
+    assert result.tcfd_analysis_route() == "tcfd_secondary"
+
+def test_json_output_is_validated():
+    output = '```json\n{"frameworks": [{"name": "TCFD", "role": "primary", "confidence": 90}]}\n```'
+    result = FrameworkDetectionResult.from_llm_output(output)
+    assert result.tcfd_analysis_route() == "tcfd_primary"
+
+def test_markdown_fallback_is_logged(caplog):
+    with caplog.at_level(logging.WARNING):
+        result = FrameworkDetectionResult.from_llm_output(
+            '- **GRI Standards (PRIMARY)**: "prepared in accordance with the GRI Standards" **Confidence**: 95%'
+        )
+    assert result.framework_names == ["GRI"]
+    assert "not structured" in caplog.text
+
+def test_frameworks_stated_as_absent_are_skipped():
+    result = FrameworkDetectionResult.from_llm_output(
+        "- **GRI Standards (PRIMARY)**: prepared in accordance with the GRI Standards. **Confidence**: 95%\n"
+        "- TCFD: No TCFD disclosures were found in the report.\n"
+        "- **CDP**: Not mentioned or implied. **Confidence**: 10%\n"
+        "- SASB: SASB is not referenced.\n"
+        "- **IFRS S2**: we have given consideration to, but do not align in full with, IFRS S2. **Confidence**: 60%"
+    )
+    assert result.framework_names == ["GRI", "IFRS"]
+    assert result.get("IFRS").role == "reference"
+    assert result.tcfd_analysis_route() == "standard"
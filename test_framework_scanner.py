@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests for the single-pass term scanner and the sentence locator used by the framework detectors.
+"""
+
+import os
+import re
+import sys
+
+import pytest
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+pytest.importorskip("crewai")
+
+from greenwashing_detector.tools.framework_scanner import SentenceLocator, TermScanner
+
+def separate_scans(terms, text, plurals=True):
+    """Hits found by scanning for each term on its own, as (start, end, term)."""
+    hits = set()
+    for term in terms:
+        pattern = r'(?<!\w)' + re.escape(term) + ('s?' if plurals else '') + r'(?!\w)'
+        hits.update((match.start(), match.end(), term) for match in re.finditer(pattern, text, re.IGNORECASE))
+    return hits
+
+def hit_spans(scanner, text):
+    return {(hit["start"], hit["end"], hit["term"]) for hit in scanner.iter_hits(text)}
+
+def test_nested_terms_are_reported_with_the_longer_match():
+    scanner = TermScanner([("GRI", "GRI"), ("GRI Standards", "GRI"), ("Standards", "other")])
+    text = "Prepared in accordance with the GRI Standards."
+    assert hit_spans(scanner, text) == {(32, 45, "GRI Standards"), (32, 35, "GRI"), (36, 45, "Standards")}
+
+def test_overlapping_terms_are_both_reported():
+    terms = ["climate risk", "risk management", "management"]
+    scanner = TermScanner([(term, term) for term in terms])
+    text = "Our climate risk management process."
+    assert hit_spans(scanner, text) == separate_scans(terms, text, plurals=False) == {
+        (4, 16, "climate risk"), (12, 27, "risk management"), (17, 27, "management")
+    }
+
+def test_hits_match_separate_scans_and_come_in_text_order():
+    terms = ["GRI", "GRI Standards", "TCFD", "TCFD recommendations", "recommendation", "climate", "climate-related"]
+    scanner = TermScanner([(term, term) for term in terms], plurals=True)
+    text = ("Our climate-related disclosures follow the TCFD recommendations (TCFD) and the GRI Standards; "
+            "GRIs, climates and recommendations are counted too.")
+    hits = scanner.scan(text)
+    assert {(hit["start"], hit["end"], hit["term"]) for hit in hits} == separate_scans(terms, text)
+    assert [hit["start"] for hit in hits] == sorted(hit["start"] for hit in hits)
+
+def test_plurals_map_to_the_registered_term():
+    scanner = TermScanner([("standard", "std"), ("SDG", "SDG")], plurals=True)
+    assert [(hit["term"], hit["text"]) for hit in scanner.scan("Standards and SDGs")] == [
+        ("standard", "Standards"), ("SDG", "SDGs")
+    ]
+    assert scanner.scan("standardise") == []
+    assert TermScanner([("standard", "std")]).scan("standards") == []
+
+def test_word_boundaries_next_to_punctuation():
+    scanner = TermScanner([("GRI", "GRI"), ("CDP", "CDP")])
+    text = "(GRI), GRI-based, 'CDP'. GRI/CDP; integrity, CDPs, xGRI"
+    assert [hit["text"] for hit in scanner.scan(text)] == ["GRI", "GRI", "CDP", "GRI", "CDP"]
+
+def test_labels_of_a_term_shared_by_several_frameworks():
+    scanner = TermScanner([("ISSB", "IFRS"), ("ISSB", "ISSB"), ("IFRS S2", "IFRS")])
+    assert scanner.found_labels("aligned with ISSB") == {"IFRS", "ISSB"}
+    assert scanner.positions_by_label("IFRS S2 and ISSB") == {"IFRS": [0, 12], "ISSB": [12]}
+
+def test_sentence_locator_returns_the_sentence_around_a_hit():
+    text = "Intro sentence. We follow the TCFD recommendations. Closing words."
+    start = text.index("TCFD")
+    sentence, context = SentenceLocator(text, window=200).context(start, start + 4)
+    assert sentence == "We follow the TCFD recommendations"
+    assert context == text
+
+def test_sentence_locator_stays_within_the_window():
+    text = "A" * 50 + " the TCFD report " + "B" * 50
+    start = text.index("TCFD")
+    sentence, context = SentenceLocator(text, window=10).context(start, start + 4)
+    assert context == text[start - 10:start + 14]
+    assert sentence == context.strip()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Tests for the GRI indicator index: one scan records counts, matched terms and page numbers.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+pytest.importorskip("crewai")
+
+from greenwashing_detector.tools.framework_scanner import TermScanner
+from greenwashing_detector.tools.gri_analyzer import GRIIndicatorIndex
+
+INDICATORS = ["GRI 305", "GRI 401"]
+
+SCANNER = TermScanner([("GRI 305", "GRI 305"), ("emission", "GRI 305"),
+                       ("GRI 401", "GRI 401"), ("turnover", "GRI 401")], plurals=True)
+
+def test_pages_come_from_the_chunk_headers():
+    text = (
+        "Emissions fell before the first header.\n"
+        "=== KEYWORD MATCH: Page 4 (2 framework keywords) ===\n"
+        "Scope 1 emissions (GRI 305) fell by 5%.\n"
+        "=== FRAMEWORK SECTION: People (Page 9) ===\n"
+        "Employee turnover (GRI 401) was 8%. Emissions from travel rose.\n"
+    )
+    index = GRIIndicatorIndex.build(SCANNER, INDICATORS, text)
+    assert index.detected == ["GRI 305", "GRI 401"]
+    assert index.counts == {"GRI 305": 4, "GRI 401": 2}
+    # The mention before the first header has no page
+    assert index.pages == {"GRI 305": [4, 9], "GRI 401": [9]}
+    assert index.describe("GRI 305") == "GRI 305: 4 mentions on pages 4, 9"
+
+def test_pages_come_from_explicit_page_starts():
+    pages = ["Our emissions report.", "Nothing relevant here.", "Turnover and emissions (GRI 305)."]
+    text = "\n".join(pages)
+    page_starts = [0, len(pages[0]) + 1, len(pages[0]) + len(pages[1]) + 2]
+    index = GRIIndicatorIndex.build(SCANNER, INDICATORS, text, page_starts, first_page=11)
+    assert index.pages == {"GRI 305": [11, 13], "GRI 401": [13]}
+    assert index.terms["GRI 305"] == ["emission", "GRI 305"]
+
+def test_text_without_mentions_detects_nothing():
+    index = GRIIndicatorIndex.build(SCANNER, INDICATORS, "=== KEYWORD MATCH: Page 2 ===\nBoard diversity.")
+    assert index.detected == []
+    assert index.describe("GRI 401") == "GRI 401: 0 mentions"
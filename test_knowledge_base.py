@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Tests for the on-disk knowledge base: merged sections and their compiled JSON cache.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+pytest.importorskip("yaml")
+
+from greenwashing_detector.tools.knowledge_base import KnowledgeBase
+
+@pytest.fixture
+def roots(tmp_path):
+    bundled = tmp_path / "bundled"
+    (bundled / "frameworks").mkdir(parents=True)
+    (bundled / "frameworks" / "GRI.yaml").write_text("name: Global Reporting Initiative\nkeywords: [gri]\n")
+    user = tmp_path / "user"
+    (user / "frameworks").mkdir(parents=True)
+    (user / "frameworks" / "GRI.yaml").write_text("keywords: [gri standards]\n")
+    return [str(bundled), str(user)]
+
+def test_sections_merge_every_root(roots, tmp_path):
+    section = KnowledgeBase(roots, cache_dir=str(tmp_path / "cache")).section("frameworks")
+    assert section["GRI"]["name"] == "Global Reporting Initiative"
+    assert section["GRI"]["keywords"] == ("gri", "gri standards")
+
+def test_compiled_sections_are_cached_as_json(roots, tmp_path):
+    cache_dir = tmp_path / "cache"
+    first = KnowledgeBase(roots, cache_dir=str(cache_dir))
+    first.section("frameworks")
+    assert first.stats["compiled"] == 1
+    assert [path.suffix for path in cache_dir.iterdir()] == [".json"]
+
+    second = KnowledgeBase(roots, cache_dir=str(cache_dir))
+    assert second.section("frameworks") == first.section("frameworks")
+    assert second.stats == {"sections_loaded": 1, "cache_hits": 1, "compiled": 0}
+
+def test_unreadable_cache_files_are_recompiled(roots, tmp_path):
+    cache_dir = tmp_path / "cache"
+    KnowledgeBase(roots, cache_dir=str(cache_dir)).section("frameworks")
+    for path in cache_dir.iterdir():
+        path.write_text("not json")
+    knowledge = KnowledgeBase(roots, cache_dir=str(cache_dir))
+    assert knowledge.section("frameworks")["GRI"]["name"] == "Global Reporting Initiative"
+    assert knowledge.stats["compiled"] == 1
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Tests for the OCR process pool and the OCR text kept in the extraction cache.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+fitz = pytest.importorskip("fitz")
+pytest.importorskip("pytesseract")
+
+from greenwashing_detector.tools import ocr_engine
+from greenwashing_detector.tools.extraction_cache import ExtractionCache
+from greenwashing_detector.tools.ocr_engine import MAX_PAGE_RETRIES, OCREngine
+from greenwashing_detector.tools.pdf_document import PDFDocument
+
+def _crash_once_worker(file_path, page_num, *args):
+    """Kills its worker process the first time it sees page 1 (marker files count the attempts)."""
+    marker = f"{file_path}.{page_num}"
+    with open(marker, "a") as attempts:
+        attempts.write("x")
+    if page_num == 1 and os.path.getsize(marker) == 1:
+        os._exit(1)
+    return f"text of page {page_num}"
+
+def _always_crash_worker(file_path, page_num, *args):
+    with open(f"{file_path}.{page_num}", "a") as attempts:
+        attempts.write("x")
+    if page_num == 1:
+        os._exit(1)
+    return f"text of page {page_num}"
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    return str(tmp_path / "scan.pdf")
+
+def test_pages_lost_to_a_crashed_worker_are_retried(pdf_path, monkeypatch):
+    monkeypatch.setattr(ocr_engine, "_ocr_page_worker", _crash_once_worker)
+    results = OCREngine(workers=2).ocr_pages(pdf_path, [0, 1, 2, 3])
+    assert results == {page: f"text of page {page}" for page in range(4)}
+
+def test_a_page_that_keeps_crashing_is_given_up(pdf_path, monkeypatch):
+    monkeypatch.setattr(ocr_engine, "_ocr_page_worker", _always_crash_worker)
+    results = OCREngine(workers=2).ocr_pages(pdf_path, [0, 1, 2])
+    assert results == {0: "text of page 0", 2: "text of page 2"}
+    assert os.path.getsize(f"{pdf_path}.1") == MAX_PAGE_RETRIES + 1
+
+def test_settings_key_covers_every_setting():
+    base = OCREngine(dpi=72, languages="eng", grayscale=True, max_dimension=None)
+    keys = {base.settings_key}
+    for changed in (OCREngine(dpi=300, languages="eng", grayscale=True),
+                    OCREngine(dpi=72, languages="eng+fra", grayscale=True),
+                    OCREngine(dpi=72, languages="eng", grayscale=False),
+                    OCREngine(dpi=72, languages="eng", grayscale=True, max_dimension=2000)):
+        keys.add(changed.settings_key)
+    assert len(keys) == 5
+
+def test_cached_ocr_text_is_only_served_for_the_same_settings(tmp_path):
+    path = str(tmp_path / "scan.pdf")
+    document = fitz.open()
+    document.new_page()  # no text layer, so it is OCR'd
+    document.save(path)
+    document.close()
+    cache = ExtractionCache(cache_dir=str(tmp_path / "cache"))
+    low = OCREngine(dpi=72).settings_key
+    high = OCREngine(dpi=300).settings_key
+
+    first = PDFDocument(path, cache=cache)
+    first.use_ocr_settings(low)
+    assert first.page_text_with_ocr(0, lambda page: "recognised at 72 dpi") == "recognised at 72 dpi"
+    first.save_to_cache()
+    first.close()
+
+    calls = []
+    second = PDFDocument(path, cache=cache)
+    second.use_ocr_settings(high)
+    assert second.page_text_with_ocr(0, lambda page: calls.append(page) or "recognised at 300 dpi") \
+        == "recognised at 300 dpi"
+    assert len(calls) == 1
+    second.use_ocr_settings(low)
+    assert second.page_text_with_ocr(0, lambda page: calls.append(page) or "unused") == "recognised at 72 dpi"
+    assert len(calls) == 1
+    second.close()